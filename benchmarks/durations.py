@@ -0,0 +1,57 @@
+""" Duration parsing: the old five-regex parser against the memoized one
+
+    Usage (from the repository root):
+        PYTHONPATH=. python benchmarks/durations.py [count]
+
+    Durations are drawn from a small pool, the way elapsed times repeat in a
+    real run.
+"""
+import random
+import re
+import sys
+import timeit
+from datetime import timedelta
+
+from testrail.helper import parse_durations, testrail_duration_to_timedelta
+
+
+def legacy_duration_to_timedelta(duration):
+    span = lambda x: int(x.group(0)[:-1]) if x else 0
+    timedelta_map = {
+        'weeks': span(re.search('\\d+w', duration)),
+        'days': span(re.search('\\d+d', duration)),
+        'hours': span(re.search('\\d+h', duration)),
+        'minutes': span(re.search('\\d+m', duration)),
+        'seconds': span(re.search('\\d+s', duration))
+    }
+    return timedelta(**timedelta_map)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    pool = ['{0}m {1}s'.format(m, s) for m in range(30) for s in range(0, 60, 5)]
+    pool += ['1h', '2h 30m', '1d 4h', '1w 2d']
+    random.seed(0)
+    durations = [random.choice(pool) for _ in range(count)]
+
+    def legacy():
+        return sum(legacy_duration_to_timedelta(d).total_seconds()
+                   for d in durations)
+
+    def memoized():
+        return sum(testrail_duration_to_timedelta(d).total_seconds()
+                   for d in durations)
+
+    def bulk():
+        return sum(parse_durations(durations))
+
+    assert legacy() == memoized() == bulk()
+    print('durations: {0}'.format(count))
+    for name, func in (('legacy', legacy), ('timedelta', memoized),
+                       ('parse_durations', bulk)):
+        best = min(timeit.repeat(func, number=1, repeat=3))
+        print('{0:<16} {1:.3f}s'.format(name, best))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+""" Per-object memory of Result with and without the compact layout
+
+    Usage (from the repository root):
+        PYTHONPATH=. python benchmarks/model_memory.py [count]
+
+    "legacy" rebuilds the layout models had before they were slotted: an
+    instance __dict__, an API() of its own and a per-object custom field
+    table. Both sides wrap the same rows, so the figures leave out the rows
+    themselves. Needs Python 3.4+ for tracemalloc.
+"""
+import sys
+import tracemalloc
+
+from testrail.api import API
+from testrail.helper import custom_methods
+from testrail.result import Result
+
+
+class LegacyResult(object):
+    def __init__(self, content=None):
+        self._content = content or dict()
+        self.api = API()
+        self._custom_methods = dict(custom_methods(self._content))
+
+
+def rows(count):
+    return [{'id': i, 'test_id': i, 'status_id': 1, 'created_on': 0,
+             'elapsed': '1m', 'custom_build': 'b1', 'custom_env': 'ci'}
+            for i in range(count)]
+
+
+def measure(cls, data):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = [cls(row) for row in data]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objs
+    return used / len(data)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    API(email='bench@example.com', key='key', url='https://example.com')
+    data = rows(count)
+    legacy = measure(LegacyResult, data)
+    compact = measure(Result, data)
+    print('objects:  {0}'.format(count))
+    print('legacy:   {0:.0f} bytes/object'.format(legacy))
+    print('compact:  {0:.0f} bytes/object'.format(compact))
+    print('saved:    {0:.0%}'.format(1 - compact / legacy))
+
+
+if __name__ == '__main__':
+    main()
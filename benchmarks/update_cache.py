@@ -0,0 +1,70 @@
+""" UpdateCache adds and deletes: linear scans against the id positions
+
+    Usage (from the repository root):
+        PYTHONPATH=. python benchmarks/update_cache.py [count]
+
+    Adds count runs one at a time to a project's cached listing, then
+    deletes them again, the way a bulk import or cleanup script would.
+    "legacy" repeats the scan-and-sort update and scan-every-project delete
+    UpdateCache did before.
+"""
+import sys
+import timeit
+from datetime import datetime
+
+from testrail.api import UpdateCache
+
+
+def legacy_update(cache, update_obj):
+    obj_list = cache[update_obj['project_id']]['value']
+    for index, obj in enumerate(obj_list):
+        if obj['id'] == update_obj['id']:
+            obj_list[index] = update_obj
+            break
+    else:
+        obj_list.append(update_obj)
+        obj_list.sort(key=lambda x: x['id'])
+
+
+def legacy_delete(cache, delete_id):
+    for project in cache.values():
+        obj_list = project['value']
+        for index, obj in enumerate(obj_list):
+            if obj['id'] == delete_id:
+                obj_list.pop(index)
+                return
+
+
+def new_cache(projects=5):
+    return dict((p, {'ts': datetime.now(), 'value': []})
+                for p in range(projects))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    runs = [{'id': i, 'project_id': 4} for i in range(count)]
+
+    def legacy():
+        cache = new_cache()
+        for run in runs:
+            legacy_update(cache, run)
+        for run in runs:
+            legacy_delete(cache, run['id'])
+
+    def indexed():
+        cache = new_cache()
+        add = UpdateCache(cache)(lambda run: run)
+        delete = UpdateCache(cache)(lambda run_id: {})
+        for run in runs:
+            add(run)
+        for run in runs:
+            delete(run['id'])
+
+    print('runs: {0}'.format(count))
+    for name, func in (('legacy', legacy), ('indexed', indexed)):
+        best = min(timeit.repeat(func, number=1, repeat=3))
+        print('{0:<8} {1:.3f}s'.format(name, best))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import sys
 from setuptools import setup
+from setuptools.command.build_py import build_py
 
 install_requires = [
     'requests>=2.6.0',
@@ -12,6 +13,20 @@ install_requires = [
 if sys.version_info[:3] < (2, 7, 0):
     install_requires.append('ordereddict')
 
+if sys.version_info[0] < 3:
+    install_requires.append('futures')
+    install_requires.append('backports.functools_lru_cache')
+
+
+class BuildPy(build_py):
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        if sys.version_info < (3, 5):
+            # testrail.aio uses async def
+            modules = [m for m in modules if m[1] != 'aio']
+        return modules
+
+
 setup(
     name='testrail',
     packages=['testrail'],
@@ -23,6 +38,8 @@ setup(
     download_url='https://github.com/travispavek/testrail-python/tarball/0.3.15',
     keywords=['testrail', 'api', 'client', 'library', 'rest'],
     install_requires=install_requires,
+    extras_require={'numpy': ['numpy']},
+    cmdclass={'build_py': BuildPy},
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
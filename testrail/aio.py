@@ -0,0 +1,110 @@
+""" asyncio front ends for API and TestRail (Python 3.5+ only; the module
+    is left out of Python 2 installs)
+
+    Every call runs the matching blocking method on a thread pool shared by
+    the instance, so endpoints, pagination, caching, retries and 429
+    handling are exactly those of API. The pool size is the limit on how
+    many calls are in flight at once; API.configure_session() should allow
+    at least that many pooled connections.
+"""
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from testrail.api import API
+from testrail.client import TestRail
+
+try:
+    _running_loop = asyncio.get_running_loop
+except AttributeError:
+    # Python < 3.7, where the running loop is the thread's event loop
+    _running_loop = asyncio.get_event_loop
+
+
+class _AsyncWrapper(object):
+    _wrapped = None
+
+    def __init__(self, concurrency):
+        self._executor = ThreadPoolExecutor(concurrency)
+
+    def __getattr__(self, attr):
+        if attr.startswith('_') or attr.startswith('iter_'):
+            # iter_* generators would run in the event loop once consumed
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                self.__class__.__name__, attr))
+        method = getattr(self._wrapped, attr)
+        if not callable(method):
+            return method
+
+        async def call(*args, **kwargs):
+            return await self._run(method, *args, **kwargs)
+        call.__name__ = attr
+        call.__doc__ = method.__doc__
+        return call
+
+    async def _run(self, func, *args, **kwargs):
+        loop = _running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(func, *args, **kwargs))
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncAPI(_AsyncWrapper):
+    """ Awaitable mirror of API: await AsyncAPI().runs(project_id)
+    """
+    def __init__(self, email=None, key=None, url=None, concurrency=8):
+        super(AsyncAPI, self).__init__(concurrency)
+        self._wrapped = API(email=email, key=key, url=url)
+
+    async def gather(self, method, args_list):
+        """ Call method once per argument tuple in args_list concurrently and
+            return the results in the same order
+        """
+        return await asyncio.gather(
+            *[getattr(self, method)(*args) for args in args_list])
+
+
+class AsyncTestRail(_AsyncWrapper):
+    """ Awaitable mirror of TestRail: await AsyncTestRail(1).runs()
+    """
+    def __init__(self, project_id=0, email=None, key=None, url=None,
+                 concurrency=8):
+        super(AsyncTestRail, self).__init__(concurrency)
+        self._wrapped = TestRail(project_id, email=email, key=key, url=url)
+        self._auth = dict(email=email, key=key, url=url)
+        self._clients = dict()
+
+    def _client(self, project_id):
+        """ Return the TestRail gather() uses for project_id, made once
+
+            Unlike TestRail(project_id), it leaves the default project of
+            API instances that never set one alone: only its own API works
+            on project_id, and models resolve theirs from their rows.
+        """
+        client = self._clients.get(project_id)
+        if client is None:
+            client = copy.copy(self._wrapped)
+            client.api = API(**self._auth)
+            client.api._context = project_id
+            client._project_id = project_id
+            client._result_buffer = None
+            self._clients[project_id] = client
+        return client
+
+    async def gather(self, method, project_ids, *args, **kwargs):
+        """ Call TestRail.<method>(*args, **kwargs) for every project in
+            project_ids concurrently and return the results in order
+        """
+        return await asyncio.gather(
+            *[self._run(getattr(self._client(project_id), method),
+                        *args, **kwargs)
+              for project_id in project_ids])
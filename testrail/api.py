@@ -2,24 +2,224 @@ from __future__ import division
 
 import os
 import collections
-from time import sleep
+import threading
+from bisect import bisect_left, insort
+from time import mktime, sleep, time
 from builtins import dict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
 from retry import retry
 
+from testrail.cache import MemoryCacheBackend
+from testrail.flight import SingleFlight
 from testrail.helper import TestRailError, TooManyRequestsError, ServiceUnavailableError
+from testrail.ratelimit import TokenBucket
 
 nested_dict = lambda: collections.defaultdict(nested_dict)
 
+# Filters each listing endpoint evaluates on the server
+case_filters = ('created_after', 'created_before', 'created_by', 'filter',
+                'milestone_id', 'priority_id', 'refs', 'section_id',
+                'template_id', 'type_id', 'updated_after', 'updated_before',
+                'updated_by')
+milestone_filters = ('is_completed', 'is_started')
+plan_filters = ('created_after', 'created_before', 'created_by',
+                'is_completed', 'milestone_id')
+run_filters = ('created_after', 'created_before', 'created_by',
+               'is_completed', 'milestone_id', 'refs_filter', 'suite_id')
+result_filters = ('created_after', 'created_before', 'created_by',
+                  'defects_filter', 'status_id')
+test_filters = ('status_id', )
+
+
+def _index_value(obj, field):
+    """ Return the key obj is indexed under for field. A (field, 'fold')
+        pair indexes the field's value case-insensitively.
+    """
+    if isinstance(field, tuple):
+        value = obj.get(field[0])
+        return value.lower() if value is not None else None
+    return obj.get(field)
+
+
+def _lock(cache):
+    """ Return the lock guarding one cache slot, created on first use
+
+        It serializes changes to the slot's listing and indexes; other slots
+        stay free.
+    """
+    lock = cache.get('lock')
+    if lock is None:
+        # setdefault is atomic, so racing threads end up with the same lock
+        lock = cache.setdefault('lock', threading.RLock())
+    return lock
+
+
+def _index(cache, field):
+    """ Return a dict mapping each value of field to the cached objects that
+        have it. Indexes are built on first use and rebuilt whenever
+        cache['value'] has been replaced by a refresh.
+    """
+    with _lock(cache):
+        index = cache.get('index')
+        if not index or index['source'] is not cache['value']:
+            index = cache['index'] = {'source': cache['value']}
+        if field not in index:
+            by_field = dict()
+            for obj in cache['value']:
+                by_field.setdefault(_index_value(obj, field), []).append(obj)
+            index[field] = by_field
+        return index[field]
+
+
+def _index_add(cache, obj, first=False):
+    """ Add obj to every index already built for cache, ahead of the objects
+        it shares a value with if it went to the front of the list
+    """
+    index = cache.get('index')
+    if not index or index['source'] is not cache.get('value'):
+        return
+    for field, by_field in index.items():
+        if field == 'source':
+            continue
+        matches = by_field.setdefault(_index_value(obj, field), [])
+        if first:
+            matches.insert(0, obj)
+        else:
+            matches.append(obj)
+
+
+def _index_discard(cache, obj):
+    """ Remove obj from every index already built for cache
+    """
+    index = cache.get('index')
+    if not index or index['source'] is not cache.get('value'):
+        return
+    for field, by_field in index.items():
+        if field == 'source':
+            continue
+        value = _index_value(obj, field)
+        matches = by_field.get(value, [])
+        for i, match in enumerate(matches):
+            if match is obj:
+                matches.pop(i)
+                break
+        if not matches:
+            by_field.pop(value, None)
+
+
+def _rows(cache):
+    """ Number of objects cached in a slot and its filtered listings
+    """
+    rows = len(cache.get('value') or ())
+    for query in list(cache.get('queries', {}).values()):
+        rows += len(query.get('value') or ())
+    return rows
+
+
+def _invalidate_queries(cache):
+    """ Mark the filtered listings kept under cache for refresh. They can't
+        be patched in place, since a changed object may have entered or left
+        any of them.
+    """
+    for query in list(cache.get('queries', {}).values()):
+        query['ts'] = None
+
+
+def _positions(cache):
+    """ Return the position bookkeeping of cache['value'], built once per
+        refresh: 'ids' maps the id of every object to the slot it had in
+        the list then (or was appended or prepended at), 'first' is the
+        slot of the start of the list, one less for every prepend, and
+        'removed' lists, sorted, the slots of the objects removed since.
+        The list itself keeps the order TestRail returned it in.
+    """
+    positions = cache.get('positions')
+    if not positions or positions['source'] is not cache['value']:
+        obj_list = cache['value']
+        positions = cache['positions'] = {
+            'source': obj_list,
+            'ids': dict((obj['id'], i) for i, obj in enumerate(obj_list)),
+            'first': 0,
+            'removed': list()}
+    return positions
+
+
+def _locate(cache, obj_id):
+    """ Return the position of the object with obj_id in cache['value'], or
+        None if it isn't there
+    """
+    positions = _positions(cache)
+    slot = positions['ids'].get(obj_id)
+    if slot is None:
+        return None
+    # Every removal before the slot moved it down by one
+    return (slot - positions['first'] -
+            bisect_left(positions['removed'], slot))
+
+
+def _place(cache, obj, first=False):
+    """ Replace the object in cache['value'] with obj's id by obj, or add
+        obj at the end of the list (at the start with first, for listings
+        TestRail returns newest first). Call with _lock(cache) held.
+    """
+    obj_list = cache['value']
+    index = _locate(cache, obj['id'])
+    if index is not None:
+        _index_discard(cache, obj_list[index])
+        obj_list[index] = obj
+        _index_add(cache, obj)
+    elif first:
+        positions = _positions(cache)
+        positions['first'] -= 1
+        positions['ids'][obj['id']] = positions['first']
+        obj_list.insert(0, obj)
+        _index_add(cache, obj, first=True)
+    else:
+        positions = _positions(cache)
+        positions['ids'][obj['id']] = (
+            positions['first'] + len(obj_list) + len(positions['removed']))
+        obj_list.append(obj)
+        _index_add(cache, obj)
+
+
+def _remove(cache, obj_id):
+    """ Remove the object with obj_id from cache['value'], returning whether
+        it was there
+    """
+    with _lock(cache):
+        index = _locate(cache, obj_id)
+        if index is None:
+            return False
+        positions = _positions(cache)
+        insort(positions['removed'], positions['ids'].pop(obj_id))
+        _index_discard(cache, cache['value'].pop(index))
+        return True
+
+
+def _upsert(cache, update_obj, first=False):
+    """ Replace the object in cache['value'] with update_obj's id by
+        update_obj, or add update_obj if there is none (see _place).
+        Filtered listings kept under cache are marked for refresh.
+    """
+    _invalidate_queries(cache)
+    with _lock(cache):
+        if not cache['ts']:
+            # The cache will clear on the next read, so no reason to add/update
+            return
+        _place(cache, update_obj, first)
+
 
 class UpdateCache(object):
     """ Decorator class for updating API cache
     """
-    def __init__(self, cache):
+    def __init__(self, cache, newest_first=False):
         self.cache = cache
+        self.newest_first = newest_first
 
     def __call__(self, f):
         def wrapped_f(*args, **kwargs):
@@ -35,28 +235,25 @@ class UpdateCache(object):
         return wrapped_f
 
     def _delete_from_cache(self, delete_id):
-        ''' Check every dict inside of self.cache for an object with a matching
-            ID
+        ''' Remove the object with delete_id from the cached listing holding
+            it, found through each listing's id positions
         '''
-        for project in self.cache.values():
-            obj_list = project['value']
-            for index, obj in enumerate(obj_list):
-                if obj['id'] == delete_id:
-                    obj_list.pop(index)
-                    return
-        else:
-            # If we hit this, it means we looked at every object in every cache
-            # and didn't find a match. Set the cache to refresh on the next call
-            for project in self.cache.values():
-                project['ts'] = None
-
-            return
+        projects = list(self.cache.values())
+        for project in projects:
+            if 'value' in project and _remove(project, delete_id):
+                _invalidate_queries(project)
+                return
+        # No cached listing holds it, so they are all still right; only
+        # filtered listings might
+        for project in projects:
+            _invalidate_queries(project)
 
     def _update_cache(self, update_obj):
         ''' Update the cache using update_obj.
 
             If a matching object is found in the cache, replace it with update_obj.
-            If no matching object is found, append it to the cache
+            If no matching object is found, append it to the cache (prepend
+            it for newest_first listings)
         '''
         # Make update_obj a list if it isn't already
         update_list = update_obj if isinstance(update_obj, list) else [update_obj, ]
@@ -71,24 +268,44 @@ class UpdateCache(object):
             else:
                 raise TestRailError("Unknown object type; can't update cache")
 
-            if not self.cache[obj_key]['ts']:
-                # The cache will clear on the next read, so no reason to add/update
-                continue
-
-            obj_list = self.cache[obj_key]['value']
-            for index, obj in enumerate(obj_list):
-                if obj['id'] == update_obj['id']:
-                    obj_list[index] = update_obj
-                    break
-            else:
-                # If we get this far, it means we searched all objects without
-                # finding a match. Add the object
-                obj_list.append(update_obj)
-                obj_list.sort(key=lambda x: x['id'])
+            # Only listings already cached need the change; creating a slot
+            # here would also bypass the collection's cache limit
+            cache = self.cache.get(obj_key)
+            if cache is not None:
+                _upsert(cache, update_obj, self.newest_first)
 
 
 class API(object):
+    """ TestRail API v2 client
+
+        Caches and settings are shared by every instance (self.__dict__ is
+        _shared_state); each cache slot has its own lock, taken to refresh
+        it or change it. The project an instance works on by default is its
+        own, so clients of different projects can share threads.
+    """
+    __slots__ = ('__dict__', '_context')
+
     _config = None
+    _session = None
+    _session_lock = threading.Lock()
+    _session_options = {'pool_size': 10, 'keep_alive': True, 'adapter': None}
+    _retry_after = 0
+    _rate_limiter = None
+    _page_limit = 250
+    _page_workers = 1
+    _full_sync_interval = 600
+    _cache_backend = MemoryCacheBackend()
+    _flights = SingleFlight()
+    # Per collection settings, keyed by cache name (e.g. '_statuses')
+    _ttls = dict()
+    _soft_ttls = dict()
+    _cache_limits = dict()
+    # Least recently used order of the keys of limited collections, with
+    # the rows each holds
+    _recent = collections.defaultdict(collections.OrderedDict)
+    _recent_lock = threading.Lock()
+    # Whether the cache settings of ~/.testrail.conf have been applied
+    _conf_cache_applied = False
     _ts = datetime.now() - timedelta(days=1)
     _shared_state = {'_case_types': nested_dict(),
                      '_cases': nested_dict(),
@@ -102,12 +319,16 @@ class API(object):
                      '_sections': nested_dict(),
                      '_statuses': nested_dict(),
                      '_suites': nested_dict(),
+                     '_test_results': nested_dict(),
                      '_tests': nested_dict(),
                      '_users': nested_dict(),
+                     # (collection, id) -> project, see _project_of
+                     '_project_ids': dict(),
                      '_timeout': 30,
                      '_project_id': None}
 
-    def __init__(self, email=None, key=None, url=None):
+    def __init__(self, email=None, key=None, url=None, cache_ttl=None,
+                 cache_limit=None):
         self.__dict__ = self._shared_state
         if email is not None and key is not None and url is not None:
             config = dict(email=email, key=key, url=url)
@@ -116,11 +337,18 @@ class API(object):
             config = self._config
         else:
             config = self._conf()
+            # Only once: the models construct an API per object, and must
+            # not undo settings made since through set_ttl() and friends
+            if not API._conf_cache_applied:
+                API._conf_cache_applied = True
+                self.configure_cache(config.get('cache_ttl'),
+                                     config.get('cache_limit'))
 
         self._auth = (config['email'], config['key'])
         self._url = config['url']
         self.headers = {'Content-Type': 'application/json'}
         self.verify_ssl = config.get('verify_ssl', True)
+        self.configure_cache(cache_ttl, cache_limit)
 
     def _conf(self):
         TR_EMAIL = 'TESTRAIL_USER_EMAIL'
@@ -162,19 +390,320 @@ class API(object):
         else:
             verify_ssl = True
 
-        return {'email': _email, 'key': _key, 'url': _url, 'verify_ssl': verify_ssl}
+        return {'email': _email, 'key': _key, 'url': _url, 'verify_ssl': verify_ssl,
+                'cache_ttl': config['testrail'].get('cache_ttl'),
+                'cache_limit': config['testrail'].get('cache_limit')}
 
-    def _paginate_request(self, end_point, params, field):
+    @classmethod
+    def configure_session(cls, pool_size=10, keep_alive=True, adapter=None):
+        """ Configure the HTTP session shared by every API instance
+
+            pool_size sets how many connections are kept open to the TestRail
+            server, keep_alive=False closes each connection after its request
+            and adapter replaces the default HTTPAdapter (useful for tests).
+            The current session is discarded and rebuilt on next request.
+        """
+        with cls._session_lock:
+            cls._session_options = {'pool_size': pool_size,
+                                    'keep_alive': keep_alive,
+                                    'adapter': adapter}
+            if cls._session is not None:
+                cls._session.close()
+            cls._session = None
+
+    @classmethod
+    def _http(cls):
+        """ Return the pooled requests.Session, creating it on first use
+        """
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    options = cls._session_options
+                    session = requests.Session()
+                    adapter = options['adapter'] or HTTPAdapter(
+                        pool_connections=options['pool_size'],
+                        pool_maxsize=options['pool_size'])
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    if not options['keep_alive']:
+                        session.headers['Connection'] = 'close'
+                    cls._session = session
+        return cls._session
+
+    def _iter_pages(self, end_point, params, field):
+        """ Yield the items of a paginated listing one page at a time
+
+            Only the current page is held in memory.
+        """
+        params = dict(params or {})
         params["offset"] = 0
-        params["limit"] = 250
-        values = []
+        params["limit"] = self._page_limit
         while True:
             items = self._get(end_point, params=params)
-            if items["size"] == 0:
-                return values
-            values.extend(items[field])
+            for item in items[field]:
+                yield item
+            if not self._has_next_page(items):
+                return
             params["offset"] += params["limit"]
 
+    def _paginate_request(self, end_point, params, field):
+        """ Return every item of a paginated listing
+
+            With more than one page worker configured, the first page is
+            fetched on its own and, if it points to a next page, the rest are
+            requested in parallel batches of self._page_workers offsets and
+            reassembled in offset order.
+        """
+        if self._page_workers <= 1:
+            return list(self._iter_pages(end_point, params, field))
+
+        params = dict(params or {})
+        params["offset"] = 0
+        params["limit"] = self._page_limit
+        items = self._get(end_point, params=params)
+        values = list(items[field])
+        if not self._has_next_page(items):
+            return values
+
+        def fetch(offset):
+            page_params = dict(params, offset=offset)
+            return self._get(end_point, params=page_params)
+
+        offset = params["limit"]
+        with ThreadPoolExecutor(self._page_workers) as pool:
+            while True:
+                offsets = [offset + n * params["limit"]
+                           for n in range(self._page_workers)]
+                for items in pool.map(fetch, offsets):
+                    values.extend(items[field])
+                    if not self._has_next_page(items):
+                        return values
+                offset = offsets[-1] + params["limit"]
+
+    def _delta_refresh(self, cache, end_point, params, field, stamp, after,
+                       newest_first=False):
+        """ Refresh cache with only the rows changed since the last sync
+
+            cache['since'] remembers the newest stamp (e.g. updated_on) seen
+            so far and is sent back to TestRail as the after filter (e.g.
+            updated_after). The returned rows replace their cached copies by
+            id, in place, and new rows are appended, or put in front for
+            listings TestRail returns newest_first, so the order matches a
+            full download. Deletions can't be seen this way, so the whole
+            listing is downloaded again every self._full_sync_interval
+            seconds.
+        """
+        synced = cache.get('synced')
+        if (cache.get('since') is None or synced is None or
+                self._refresh(synced, self._full_sync_interval)):
+            cache['value'] = self._paginate_request(end_point, params, field)
+            cache['synced'] = datetime.now()
+        else:
+            # Overlap by a second so rows stamped in the same second as the
+            # newest cached row are not missed; merging them twice is harmless
+            params = dict(params or {})
+            params[after] = cache['since'] - 1
+            self._merge(cache, self._paginate_request(end_point, params, field),
+                        newest_first)
+
+        stamps = [obj[stamp] for obj in cache['value'] if obj.get(stamp)]
+        cache['since'] = max(stamps) if stamps else 0
+        return cache['value']
+
+    @staticmethod
+    def _merge(cache, rows, newest_first=False):
+        """ Replace cached objects with their updated rows by id and add the
+            rows that are new (see _delta_refresh), keeping any built index
+            in step
+        """
+        with _lock(cache):
+            new = list()
+            for row in rows:
+                if _locate(cache, row['id']) is None:
+                    new.append(row)
+                else:
+                    _place(cache, row)
+            if newest_first:
+                # Rows come newest first too, so they go in front as a block
+                cache['value'][:0] = new
+                cache['positions'] = None
+                for row in reversed(new):
+                    _index_add(cache, row, first=True)
+            else:
+                for row in new:
+                    _place(cache, row)
+
+    def _cached(self, name, key, fetch):
+        """ Return the collection cached at self.<name>[key...]
+
+            Once it has expired, a fresher copy left in the cache backend by
+            another process is used if there is one, otherwise fetch() is
+            called to download it and the result is written to the backend.
+            Collections set to stale-while-revalidate are returned as they
+            are past their soft TTL and refreshed in the background; callers
+            only wait once the hard TTL has passed too.
+        """
+        cache = getattr(self, name)
+        for k in key:
+            cache = cache[k]
+        soft, hard = self._soft_ttls.get(name), self._ttls.get(name)
+        if self._refresh(cache['ts'], hard):
+            # Threads that missed together share one refresh, and its error
+            self._flights.do((name, ) + tuple(key),
+                             lambda: self._fill(name, key, cache, fetch, hard))
+        elif soft is not None and self._refresh(cache['ts'], soft):
+            self._revalidate(name, key, cache, fetch, soft)
+        value = cache['value']
+        if name in self._cache_limits:
+            self._touch(name, key[0])
+        return value
+
+    def _touch(self, name, key):
+        """ Mark self.<name>[key] as just used, then drop the least recently
+            used keys of the collection while it holds more rows than its
+            limit. The key just used is always kept.
+        """
+        collection = getattr(self, name)
+        with self._recent_lock:
+            recent = self._recent[name]
+            recent.pop(key, None)
+            recent[key] = _rows(collection.get(key, {}))
+            total = sum(recent.values())
+            while total > self._cache_limits[name] and len(recent) > 1:
+                old, rows = recent.popitem(last=False)
+                collection.pop(old, None)
+                total -= rows
+
+    def _fill(self, name, key, cache, fetch, timeout=None):
+        if not self._refresh(cache['ts'], timeout):
+            # refreshed by a flight that ended since the caller looked
+            return
+        if not self._load_from_backend(name, key, cache, timeout):
+            cache['value'] = fetch()
+            cache['ts'] = datetime.now()
+            self._cache_backend.store(
+                name, self._backend_key(key), cache['ts'], cache['value'])
+
+    def _revalidate(self, name, key, cache, fetch, timeout):
+        """ Refresh cache in a background thread, unless one already is
+        """
+        with _lock(cache):
+            if cache.get('revalidating'):
+                return
+            cache['revalidating'] = True
+
+        def refresh():
+            try:
+                self._flights.do((name, ) + tuple(key), lambda: self._fill(
+                    name, key, cache, fetch, timeout))
+            except Exception:
+                # Keep serving the stale copy; the next read past the soft
+                # TTL tries again and one past the hard TTL raises
+                pass
+            finally:
+                cache['revalidating'] = False
+
+        thread = threading.Thread(target=refresh)
+        thread.daemon = True
+        thread.start()
+
+    def _cached_query(self, name, key, end_point, field, filters,
+                      allowed=None):
+        """ Return the listing of end_point narrowed on the server by filters
+
+            Each distinct (end_point, filter set) is cached on its own under
+            self.<name>[key...]['queries'], next to the unfiltered listing,
+            and is refreshed whenever an object in that listing changes.
+        """
+        params, query = self._query(end_point, filters, allowed)
+        return self._cached(name, tuple(key) + ('queries', query), lambda: (
+            self._paginate_request(end_point, params, field)))
+
+    def _query(self, end_point, filters, allowed=None):
+        """ Return the request parameters for filters and the key their
+            listing is cached under
+        """
+        unknown = set(filters or {}) - set(allowed or filters or {})
+        if unknown:
+            raise TestRailError("Unsupported filter(s) for %s: %s" % (
+                end_point.split('/')[0], ', '.join(sorted(unknown))))
+        params = self._filter_params(filters)
+        return params, (end_point, ) + tuple(sorted(params.items()))
+
+    @staticmethod
+    def _filter_params(filters):
+        """ TestRail request parameters for a dict of listing filters
+
+            None values are dropped, booleans become 0/1, datetimes epoch
+            seconds, numbers strings and lists sorted comma separated values,
+            so equal filter sets always produce equal parameters.
+        """
+        params = dict()
+        for name, value in (filters or {}).items():
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                value = int(value)
+            elif isinstance(value, datetime):
+                value = int(mktime(value.timetuple()))
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                value = ','.join(str(v) for v in sorted(value))
+            if isinstance(value, (int, float)):
+                value = str(value)
+            params[name] = value
+        return params
+
+    def _backend_key(self, key):
+        # Different servers and users can see different data
+        return [self._url, self._auth[0]] + list(key)
+
+    def _load_from_backend(self, name, key, cache, timeout=None):
+        """ Copy the backend's entry into cache if it is fresh and newer than
+            what cache holds. A cache explicitly invalidated by setting its ts
+            to None always goes back to the server.
+        """
+        if 'value' in cache and cache['ts'] is None:
+            return False
+        stored = self._cache_backend.load(name, self._backend_key(key))
+        if stored is None or self._refresh(stored[0], timeout):
+            return False
+        if 'value' in cache and cache['ts'] and stored[0] <= cache['ts']:
+            return False
+        cache['ts'], cache['value'] = stored
+        return True
+
+    @classmethod
+    def set_cache_backend(cls, backend):
+        """ Use backend (see testrail.cache) as a second cache level shared
+            with other processes
+        """
+        cls._cache_backend = backend
+
+    def _iter_cached(self, cache, end_point, params, field):
+        """ Yield from cache if it is still fresh, otherwise stream the
+            listing straight from the server without caching it
+        """
+        if not self._refresh(cache.get('ts')):
+            return iter(cache['value'])
+        return self._iter_pages(end_point, params, field)
+
+    def _has_next_page(self, items):
+        """ Use the _links metadata when TestRail provides it, otherwise a
+            short page means this was the last one
+        """
+        if '_links' in items:
+            return bool(items['_links'].get('next'))
+        return items['size'] >= self._page_limit
+
+    @classmethod
+    def set_page_workers(cls, workers):
+        """ Number of pages _paginate_request may fetch concurrently, for
+            every API instance
+        """
+        if workers < 1:
+            raise TestRailError('page workers must be at least 1')
+        cls._page_workers = workers
+
     @staticmethod
     def _raise_on_429_or_503_status(resp):
         """ 429 is TestRail's status for too many API requests
@@ -184,6 +713,10 @@ class API(object):
         """
         if resp.status_code == 429:
             wait_amount = int(resp.headers['Retry-After'])
+            # Hold back requests from other threads until the window passes
+            API._retry_after = max(API._retry_after, time() + wait_amount)
+            if API._rate_limiter is not None:
+                API._rate_limiter.backoff()
             sleep(wait_amount)
             raise TooManyRequestsError("Too many API requests")
         if resp.status_code == 503:
@@ -191,86 +724,224 @@ class API(object):
         else:
             return
 
-    def _refresh(self, ts):
+    def _refresh(self, ts, timeout=None):
         if not ts:
             return True
 
         td = (datetime.now() - ts)
         since_last =  (td.microseconds + (td.seconds + td.days * 24 * 3600) * 10**6) / 10**6
 
-        return since_last > self._timeout
+        return since_last > (self._timeout if timeout is None else timeout)
+
+    @classmethod
+    def _collection(cls, collection):
+        name = '_%s' % collection
+        if not isinstance(cls._shared_state.get(name),
+                          collections.defaultdict):
+            raise TestRailError("Unknown collection '%s'" % collection)
+        return name
+
+    @classmethod
+    def set_stale_while_revalidate(cls, collection, soft, hard):
+        """ Serve collection (e.g. 'statuses') from cache for soft seconds,
+            then keep serving the stale copy while it is refreshed in the
+            background, until it is hard seconds old and callers wait for
+            the refresh again. soft=None turns background refresh off.
+        """
+        name = cls._collection(collection)
+        if soft is None:
+            cls._soft_ttls.pop(name, None)
+            return
+        if hard is None or not 0 <= soft < hard:
+            raise TestRailError('soft TTL must be less than the hard TTL')
+        cls._soft_ttls[name] = soft
+        cls._ttls[name] = hard
+
+    @classmethod
+    def set_ttl(cls, collection, seconds):
+        """ Keep collection (e.g. 'statuses') cached for seconds instead of
+            the default timeout. None goes back to the default, without
+            stale-while-revalidate.
+        """
+        name = cls._collection(collection)
+        if seconds is None:
+            cls._ttls.pop(name, None)
+            cls._soft_ttls.pop(name, None)
+            return
+        if seconds < 0 or cls._soft_ttls.get(name, -1) >= seconds:
+            raise TestRailError(
+                'TTL must not be negative and must exceed the soft TTL')
+        cls._ttls[name] = seconds
+
+    @classmethod
+    def set_cache_limit(cls, collection, rows):
+        """ Cap a collection cached per run or test ('tests', 'results' or
+            'test_results') at about rows objects, dropping the least
+            recently used runs or tests beyond it. None removes the cap.
+        """
+        name = cls._collection(collection)
+        if name not in ('_tests', '_results', '_test_results'):
+            raise TestRailError(
+                "Only tests, results and test_results can be limited")
+        with cls._recent_lock:
+            if rows is None:
+                cls._cache_limits.pop(name, None)
+                cls._recent.pop(name, None)
+            elif rows < 1:
+                raise TestRailError('cache limit must be at least 1')
+            else:
+                cls._cache_limits[name] = rows
+
+    @classmethod
+    def configure_cache(cls, ttl=None, limit=None):
+        """ Apply {collection: seconds} TTLs and {collection: rows} limits,
+            as read from the cache_ttl and cache_limit maps of
+            ~/.testrail.conf
+        """
+        try:
+            for collection, seconds in (ttl or {}).items():
+                cls.set_ttl(collection, float(seconds))
+            for collection, rows in (limit or {}).items():
+                cls.set_cache_limit(collection, int(rows))
+        except (TypeError, ValueError):
+            raise TestRailError('Invalid cache_ttl or cache_limit setting')
+
+    @classmethod
+    def _wait_for_retry_after(cls):
+        """ Sleep out any Retry-After window announced by a 429 response
+        """
+        remaining = cls._retry_after - time()
+        if remaining > 0:
+            sleep(remaining)
+
+    @classmethod
+    def set_rate_limit(cls, rate, burst=None, lock_path=None):
+        """ Pace requests to at most rate per second (bursts of up to burst)
+            before they are sent. The rate adapts downward on 429 responses.
+            Processes passing the same lock_path share one budget. A rate of
+            None turns pacing off.
+        """
+        if rate is None:
+            cls._rate_limiter = None
+        else:
+            cls._rate_limiter = TokenBucket(rate, burst, lock_path=lock_path)
+
+    @classmethod
+    def _throttle(cls):
+        cls._wait_for_retry_after()
+        if cls._rate_limiter is not None:
+            cls._rate_limiter.acquire()
 
     @classmethod
     def flush_cache(cls):
         """ Set all cache objects to refresh the next time they are accessed
         """
+        cls._cache_backend.clear()
+
         def clear_ts(cache):
             if 'ts' in cache:
                 cache['ts'] = None
-            for val in cache.values():
+            for val in list(cache.values()):
                 if isinstance(val, dict):
                     clear_ts(val)
 
 
-        for cache in cls._shared_state.values():
+        for cache in list(cls._shared_state.values()):
             if not isinstance(cache, dict):
                 continue
             else:
                 clear_ts(cache)
 
+    @staticmethod
+    def _find(cache, field, value):
+        """ Return the first cached object whose field equals value
+
+            Raises IndexError when there is no match, like indexing an empty
+            filter() result would.
+        """
+        matches = _index(cache, field).get(value)
+        if not matches:
+            raise IndexError(value)
+        return matches[0]
+
+    @staticmethod
+    def _named(cache, name):
+        """ Return the cached objects named name, ignoring case
+
+            The list comes straight from the cache's index, so it must not
+            be modified.
+        """
+        return _index(cache, ('name', 'fold')).get(name.lower(), [])
+
+    @property
+    def _project_id(self):
+        """ This instance's project, or the last one set on any instance
+            when this one never had one
+        """
+        try:
+            return self._context
+        except AttributeError:
+            return self.__dict__['_project_id']
+
     def set_project_id(self, project_id):
-        self._project_id = project_id
+        self._context = project_id
+        # instances that never set a project (e.g. the models' one) follow
+        # the last one set, as before
+        self.__dict__['_project_id'] = project_id
 
     # User Requests
     def users(self):
-        if self._refresh(self._users['ts']):
-            # get new value, if request is good update value with new ts.
-            self._users['value'] = self._get('get_users')
-            self._users['ts'] = datetime.now()
-        return self._users['value']
+        return self._cached('_users', (), lambda: self._get('get_users'))
 
     def user_with_id(self, user_id):
         try:
-            return list(filter(lambda x: x['id'] == user_id, self.users()))[0]
+            self.users()
+            return self._find(self._users, 'id', user_id)
         except IndexError:
             raise TestRailError("User ID '%s' was not found" % user_id)
 
     def user_with_email(self, user_email):
         try:
-            return list(filter(lambda x: x['email'] == user_email, self.users()))[0]
+            self.users()
+            return self._find(self._users, 'email', user_email)
         except IndexError:
             raise TestRailError("User email '%s' was not found" % user_email)
 
     # Project Requests
     def projects(self):
-        if self._refresh(self._projects['ts']):
-            # get new value, if request is good update value with new ts.
-            self._projects['value'] = self._paginate_request("get_projects", {}, "projects")
-            self._projects['ts'] = datetime.now()
-        return self._projects['value']
+        return self._cached('_projects', (), lambda: self._paginate_request(
+            "get_projects", {}, "projects"))
 
     def project_with_id(self, project_id):
         try:
-            return list(filter(lambda x: x['id'] == project_id, self.projects()))[0]
+            self.projects()
+            return self._find(self._projects, 'id', project_id)
         except IndexError:
             raise TestRailError("Project ID '%s' was not found" % project_id)
 
+    def projects_with_name(self, name):
+        self.projects()
+        return self._named(self._projects, name)
+
     # Suite Requests
     def suites(self, project_id=None):
         project_id = project_id or self._project_id
-        if self._refresh(self._suites[project_id]['ts']):
-            # get new value, if request is good update value with new ts.
-            _suites = self._get('get_suites/%s' % project_id)
-            self._suites[project_id]['value'] = _suites
-            self._suites[project_id]['ts'] = datetime.now()
-        return self._suites[project_id]['value']
-
-    def suite_with_id(self, suite_id):
+        return self._cached('_suites', (project_id, ), lambda: self._get(
+            'get_suites/%s' % project_id))
+
+    def suite_with_id(self, suite_id, project_id=None):
+        project_id = project_id or self._project_id
         try:
-            return list(filter(lambda x: x['id'] == suite_id, self.suites()))[0]
+            self.suites(project_id)
+            return self._find(self._suites[project_id], 'id', suite_id)
         except IndexError:
             raise TestRailError("Suite ID '%s' was not found" % suite_id)
 
+    def suites_with_name(self, name, project_id=None):
+        project_id = project_id or self._project_id
+        self.suites(project_id)
+        return self._named(self._suites[project_id], name)
+
     @UpdateCache(_shared_state['_suites'])
     def add_suite(self, suite):
         fields = ['name', 'description']
@@ -281,19 +952,32 @@ class API(object):
         return self._post('add_suite/%s' % project_id, payload)
 
     # Case Requests
-    def cases(self, project_id=None, suite_id=-1):
+    def cases(self, project_id=None, suite_id=-1, filters=None):
+        project_id = project_id or self._project_id
+        endpoint = 'get_cases/%s' % project_id
+        params = {'suite_id': suite_id} if suite_id != -1 else {}
+        if filters:
+            return self._cached_query(
+                '_cases', (project_id, suite_id), endpoint, 'cases',
+                dict(filters, **params), case_filters + ('suite_id', ))
+        # only fetch the cases updated since the last refresh
+        return self._cached('_cases', (project_id, suite_id), lambda: (
+            self._delta_refresh(self._cases[project_id][suite_id], endpoint,
+                                params, 'cases', 'updated_on',
+                                'updated_after')))
+
+    def iter_cases(self, project_id=None, suite_id=-1):
+        project_id = project_id or self._project_id
+        params = {'suite_id': suite_id} if suite_id != -1 else {}
+        return self._iter_cached(self._cases[project_id][suite_id],
+                                 'get_cases/%s' % project_id, params, 'cases')
+
+    def case_with_id(self, case_id, suite_id=None, project_id=None):
         project_id = project_id or self._project_id
-        if self._refresh(self._cases[project_id][suite_id]['ts']):
-            # get new value, if request is good update value with new ts.
-            endpoint = 'get_cases/%s' % project_id
-            params = {'suite_id': suite_id} if suite_id != -1 else {}
-            self._cases[project_id][suite_id]["value"] = self._paginate_request(endpoint, params, "cases")
-            self._cases[project_id][suite_id]['ts'] = datetime.now()
-        return self._cases[project_id][suite_id]['value']
-
-    def case_with_id(self, case_id, suite_id=None):
         try:
-            return list(filter(lambda x: x['id'] == case_id, self.cases(suite_id=suite_id)))[0]
+            self.cases(project_id, suite_id=suite_id)
+            return self._find(
+                self._cases[project_id][suite_id], 'id', case_id)
         except IndexError:
             raise TestRailError("Case ID '%s' was not found" % case_id)
 
@@ -302,9 +986,9 @@ class API(object):
                   'milestone_id', 'refs']
         section_id = case.get('section_id')
         payload = self._payload_gen(fields, case)
-        #TODO get update cache working for now reset cache
-        self.flush_cache()
-        return self._post('add_case/%s' % section_id, payload)
+        response = self._post('add_case/%s' % section_id, payload)
+        self._cache_case(response)
+        return response
 
     def update_case(self, case):
         fields = ['title', 'template_id', 'type_id', 'priority_id', 'estimate',
@@ -312,48 +996,78 @@ class API(object):
         fields.extend(self._custom_field_discover(case))
 
         data = self._payload_gen(fields, case)
-        #TODO get update cache working for now reset cache
-        self.flush_cache()
-        return self._post('update_case/%s' % case.get('id'), data)
+        response = self._post('update_case/%s' % case.get('id'), data)
+        self._cache_case(response)
+        return response
+
+    def _cache_case(self, case):
+        """ Add or update case in the cached case listings of its suite
 
+            Cases carry no project_id, so the owning project is the one
+            whose cached suites or cases include the case's suite. Without
+            one, project wide listings are marked stale instead; their next
+            (delta) refresh only fetches what changed.
+        """
+        suite_id = case.get('suite_id')
+        owner = None
+        for project_id, suites in list(self._cases.items()):
+            known = self._suites.get(project_id, {})
+            if 'value' in known and _index(known, 'id').get(suite_id):
+                owner = project_id
+            for key, cache in list(suites.items()):
+                if 'value' not in cache:
+                    continue
+                if key == suite_id or _index(cache, 'suite_id').get(suite_id):
+                    owner = project_id
+            if owner is not None:
+                break
+
+        for project_id, suites in list(self._cases.items()):
+            for key, cache in list(suites.items()):
+                if project_id == owner and key in (suite_id, -1, None):
+                    _upsert(cache, case)
+                elif owner is None and key in (-1, None):
+                    cache['ts'] = None
+                    _invalidate_queries(cache)
 
     def case_types(self):
-        if self._refresh(self._case_types['ts']):
-            # get new value, if request is good update value with new ts.
-            _case_types = self._get('get_case_types')
-            self._case_types['value'] = _case_types
-            self._case_types['ts'] = datetime.now()
-        return self._case_types['value']
+        return self._cached('_case_types', (), lambda: self._get(
+            'get_case_types'))
 
     def case_type_with_id(self, case_type_id):
         try:
-            return list(filter(
-                lambda x: x['id'] == case_type_id, self.case_types()))[0]
+            self.case_types()
+            return self._find(self._case_types, 'id', case_type_id)
         except IndexError:
             return TestRailError(
                 "Case Type ID '%s' was not found" % case_type_id)
 
     # Milestone Requests
-    def milestones(self, project_id):
-        if self._refresh(self._milestones[project_id]['ts']):
-            # get new value, if request is good update value with new ts.
-            endpoint = 'get_milestones/%s' % project_id
-            self._milestones[project_id]['value'] = self._paginate_request(endpoint, {}, "milestones")
-            self._milestones[project_id]['ts'] = datetime.now()
-        return self._milestones[project_id]['value']
+    def milestones(self, project_id, filters=None):
+        endpoint = 'get_milestones/%s' % project_id
+        if filters:
+            return self._cached_query('_milestones', (project_id, ), endpoint,
+                                      'milestones', filters, milestone_filters)
+        return self._cached('_milestones', (project_id, ), lambda: (
+            self._paginate_request(endpoint, {}, "milestones")))
 
     def milestone_with_id(self, milestone_id, project_id=None):
         if project_id is None:
             return self._get('get_milestone/%s' % milestone_id)
         else:
             try:
-                return list(filter(lambda x: x['id'] == milestone_id,
-                              self.milestones(project_id)))[0]
+                self.milestones(project_id)
+                return self._find(
+                    self._milestones[project_id], 'id', milestone_id)
             except IndexError:
                 raise TestRailError(
                     "Milestone ID '%s' was not found" % milestone_id)
 
-    @UpdateCache(_shared_state['_milestones'])
+    def milestones_with_name(self, name, project_id):
+        self.milestones(project_id)
+        return self._named(self._milestones[project_id], name)
+
+    @UpdateCache(_shared_state['_milestones'], newest_first=True)
     def add_milestone(self, milestone):
         fields = ['name', 'description', 'due_on']
         fields.extend(self._custom_field_discover(milestone))
@@ -362,7 +1076,7 @@ class API(object):
         payload = self._payload_gen(fields, milestone)
         return self._post('add_milestone/%s' % project_id, payload)
 
-    @UpdateCache(_shared_state['_milestones'])
+    @UpdateCache(_shared_state['_milestones'], newest_first=True)
     def update_milestone(self, milestone):
         fields = ['name', 'description', 'due_on', 'is_completed']
         fields.extend(self._custom_field_discover(milestone))
@@ -370,39 +1084,44 @@ class API(object):
         data = self._payload_gen(fields, milestone)
         return self._post('update_milestone/%s' % milestone.get('id'), data)
 
-    @UpdateCache(_shared_state['_milestones'])
+    @UpdateCache(_shared_state['_milestones'], newest_first=True)
     def delete_milestone(self, milestone_id):
         return self._post('delete_milestone/%s' % milestone_id)
 
     # Priority Requests
     def priorities(self):
-        if self._refresh(self._priorities['ts']):
-            # get new value, if request is good update value with new ts.
-            _priorities = self._get('get_priorities')
-            self._priorities['value'] = _priorities
-            self._priorities['ts'] = datetime.now()
-        return self._priorities['value']
+        return self._cached('_priorities', (), lambda: self._get(
+            'get_priorities'))
 
     def priority_with_id(self, priority_id):
         try:
-            return list(filter(
-                lambda x: x['id'] == priority_id, self.priorities()))[0]
+            self.priorities()
+            return self._find(self._priorities, 'id', priority_id)
         except IndexError:
             raise TestRailError("Priority ID '%s' was not found")
 
     # Section Requests
     def sections(self, project_id=None, suite_id=-1):
         project_id = project_id or self._project_id
-        if self._refresh(self._sections[project_id][suite_id]['ts']):
-            params = {'suite_id': suite_id} if suite_id != -1 else None
-            endpoint = 'get_sections/%s' % project_id
-            self._sections[project_id][suite_id]['value'] = self._paginate_request(endpoint, params, "sections")
-            self._sections[project_id][suite_id]['ts'] = datetime.now()
-        return self._sections[project_id][suite_id]['value']
-
-    def section_with_id(self, section_id):
+        params = {'suite_id': suite_id} if suite_id != -1 else None
+        endpoint = 'get_sections/%s' % project_id
+        return self._cached('_sections', (project_id, suite_id), lambda: (
+            self._paginate_request(endpoint, params, "sections")))
+
+    def section_with_id(self, section_id, project_id=None):
+        project_id = project_id or self._project_id
+        # Sections already listed per suite (e.g. by warm()) answer without
+        # a request, which multi suite projects could not otherwise avoid
+        timeout = self._ttls.get('_sections')
+        for cache in list(self._sections.get(project_id, {}).values()):
+            if 'value' in cache and not self._refresh(cache['ts'], timeout):
+                matches = _index(cache, 'id').get(section_id)
+                if matches:
+                    return matches[0]
         try:
-            return list(filter(lambda x: x['id'] == section_id, self.sections()))[0]
+            self.sections(project_id)
+            return self._find(
+                self._sections[project_id][-1], 'id', section_id)
         except IndexError:
             raise TestRailError("Section ID '%s' was not found" % section_id)
         except TestRailError:
@@ -415,30 +1134,46 @@ class API(object):
 
         project_id = section.get('project_id') or self._project_id
         payload = self._payload_gen(fields, section)
-        #TODO get update cache working for now reset cache
-        self.flush_cache()
-        return self._post('add_section/%s' % project_id, payload)
+        response = self._post('add_section/%s' % project_id, payload)
+        # Sections are cached per project, by suite and project wide (-1)
+        sections = self._sections.get(project_id, {})
+        for key in (response.get('suite_id'), -1, None):
+            if key in sections:
+                _upsert(sections[key], response)
+        return response
 
     # Plan Requests
-    def plans(self, project_id=None):
+    def plans(self, project_id=None, filters=None):
+        project_id = project_id or self._project_id
+        endpoint = 'get_plans/%s' % project_id
+        if filters:
+            return self._cached_query('_plans', (project_id, ), endpoint,
+                                      'plans', filters, plan_filters)
+        return self._cached('_plans', (project_id, ), lambda: (
+            self._paginate_request(endpoint, {}, "plans")))
+
+    def iter_plans(self, project_id=None):
         project_id = project_id or self._project_id
-        if self._refresh(self._plans[project_id]['ts']):
-            # get new value, if request is good update value with new ts.
-            endpoint = 'get_plans/%s' % project_id
-            self._plans[project_id]['value'] = self._paginate_request(endpoint, {}, "plans")
-            self._plans[project_id]['ts'] = datetime.now()
-        return self._plans[project_id]['value']
-
-    def plan_with_id(self, plan_id, with_entries=False):
+        return self._iter_cached(self._plans[project_id],
+                                 'get_plans/%s' % project_id, {}, 'plans')
+
+    def plan_with_id(self, plan_id, with_entries=False, project_id=None):
         #TODO consider checking if plan already has entries and if not add it
         if with_entries:
             return self._get('get_plan/%s' % plan_id)
+        project_id = project_id or self._project_id
         try:
-            return list(filter(lambda x: x['id'] == plan_id, self.plans()))[0]
+            self.plans(project_id)
+            return self._find(self._plans[project_id], 'id', plan_id)
         except IndexError:
             raise TestRailError("Plan ID '%s' was not found" % plan_id)
 
-    @UpdateCache(_shared_state['_plans'])
+    def plans_with_name(self, name, project_id=None):
+        project_id = project_id or self._project_id
+        self.plans(project_id)
+        return self._named(self._plans[project_id], name)
+
+    @UpdateCache(_shared_state['_plans'], newest_first=True)
     def add_plan(self, plan):
         fields = ['name', 'description', 'milestone_id', 'entries']
         fields.extend(self._custom_field_discover(plan))
@@ -458,24 +1193,53 @@ class API(object):
         return self._post('add_plan_entry/%s' % plan_id, payload)
 
     # Run Requests
-    def runs(self, project_id=None, completed=None):
+    def runs(self, project_id=None, completed=None, filters=None,
+             **kwargs):
+        """ Runs of the project, narrowed on the server by completed and any
+            other get_runs filter (see run_filters) given as keywords or in a
+            filters dict. Every distinct set of filters is cached separately.
+        """
+        project_id = project_id or self._project_id
+        endpoint = 'get_runs/%s' % project_id
+        filters = self._run_filters(completed, filters, kwargs)
+        if filters:
+            return self._cached_query('_runs', (project_id, ), endpoint,
+                                      'runs', filters, run_filters)
+        return self._cached('_runs', (project_id, ), lambda: (
+            self._paginate_request(endpoint, {}, "runs")))
+
+    def iter_runs(self, project_id=None, completed=None, filters=None,
+                  **kwargs):
+        project_id = project_id or self._project_id
+        endpoint = 'get_runs/%s' % project_id
+        filters = self._run_filters(completed, filters, kwargs)
+        if filters:
+            params, query = self._query(endpoint, filters, run_filters)
+            return self._iter_cached(self._runs[project_id]['queries'][query],
+                                     endpoint, params, 'runs')
+        return self._iter_cached(self._runs[project_id], endpoint, {}, 'runs')
+
+    @staticmethod
+    def _run_filters(completed, filters, kwargs):
+        filters = dict(filters or {}, **kwargs)
+        if completed is not None:
+            filters['is_completed'] = completed
+        return dict((k, v) for k, v in filters.items() if v is not None)
+
+    def run_with_id(self, run_id, project_id=None):
         project_id = project_id or self._project_id
-        if self._refresh(self._runs[project_id]['ts']):
-            # get new value, if request is good update value with new ts.
-            endpoint = 'get_runs/%s' % project_id
-            if completed is not None:
-                endpoint += '&is_completed=%s' % str(int(completed))
-            self._runs[project_id]['value'] = self._paginate_request(endpoint, {}, "runs")
-            self._runs[project_id]['ts'] = datetime.now()
-        return self._runs[project_id]['value']
-
-    def run_with_id(self, run_id):
         try:
-           return list(filter(lambda x: x['id'] == run_id, self.runs()))[0]
+            self.runs(project_id)
+            return self._find(self._runs[project_id], 'id', run_id)
         except IndexError:
             raise TestRailError("Run ID '%s' was not found" % run_id)
 
-    @UpdateCache(_shared_state['_runs'])
+    def runs_with_name(self, name, project_id=None):
+        project_id = project_id or self._project_id
+        self.runs(project_id)
+        return self._named(self._runs[project_id], name)
+
+    @UpdateCache(_shared_state['_runs'], newest_first=True)
     def add_run(self, run):
         fields = ['name', 'description', 'suite_id', 'milestone_id',
                   'assignedto_id', 'include_all', 'case_ids']
@@ -485,7 +1249,7 @@ class API(object):
         payload = self._payload_gen(fields, run)
         return self._post('add_run/%s' % project_id, payload)
 
-    @UpdateCache(_shared_state['_runs'])
+    @UpdateCache(_shared_state['_runs'], newest_first=True)
     def update_run(self, run):
         fields = [
             'name', 'description', 'milestone_id', 'include_all', 'case_ids']
@@ -494,15 +1258,15 @@ class API(object):
         data = self._payload_gen(fields, run)
         return self._post('update_run/%s' % run.get('id'), data)
 
-    @UpdateCache(_shared_state['_runs'])
+    @UpdateCache(_shared_state['_runs'], newest_first=True)
     def close_run(self, run_id):
         return self._post('close_run/%s' % run_id)
 
-    @UpdateCache(_shared_state['_runs'])
+    @UpdateCache(_shared_state['_runs'], newest_first=True)
     def delete_run(self, run_id):
         return self._post('delete_run/%s' % run_id)
 
-    @UpdateCache(_shared_state['_plans'])
+    @UpdateCache(_shared_state['_plans'], newest_first=True)
     def add_plan(self, plan):
         fields = ['name', 'description', 'milestone_id']
         fields.extend(self._custom_field_discover(plan))
@@ -511,7 +1275,7 @@ class API(object):
         payload = self._payload_gen(fields, plan)
         return self._post('add_plan/%s' % project_id, payload)
 
-    @UpdateCache(_shared_state['_plans'])
+    @UpdateCache(_shared_state['_plans'], newest_first=True)
     def update_plan(self, plan):
         fields = ['name', 'description', 'milestone_id']
         fields.extend(self._custom_field_discover(plan))
@@ -519,26 +1283,32 @@ class API(object):
         data = self._payload_gen(fields, plan)
         return self._post('update_plan/%s' % plan.get('id'), data)
 
-    @UpdateCache(_shared_state['_plans'])
+    @UpdateCache(_shared_state['_plans'], newest_first=True)
     def close_plan(self, plan_id):
         return self._post('close_plan/%s' % plan_id)
 
-    @UpdateCache(_shared_state['_plans'])
+    @UpdateCache(_shared_state['_plans'], newest_first=True)
     def delete_plan(self, plan_id):
         return self._post('delete_plan/%s' % plan_id)
 
     # Test Requests
-    def tests(self, run_id):
-        if self._refresh(self._tests[run_id]['ts']):
-            endpoint = 'get_tests/%s' % run_id
-            self._tests[run_id]['value'] = self._paginate_request(endpoint, {}, "tests")
-            self._tests[run_id]['ts'] = datetime.now()
-        return self._tests[run_id]['value']
+    def tests(self, run_id, filters=None):
+        endpoint = 'get_tests/%s' % run_id
+        if filters:
+            return self._cached_query('_tests', (run_id, ), endpoint, 'tests',
+                                      filters, test_filters)
+        return self._cached('_tests', (run_id, ), lambda: (
+            self._paginate_request(endpoint, {}, "tests")))
+
+    def iter_tests(self, run_id):
+        return self._iter_cached(self._tests.get(run_id, {}),
+                                 'get_tests/%s' % run_id, {}, 'tests')
 
     def test_with_id(self, test_id, run_id=None):
         if run_id is not None:
             try:
-                return list(filter(lambda x: x['id'] == test_id, self.tests(run_id)))[0]
+                self.tests(run_id)
+                return self._find(self._tests[run_id], 'id', test_id)
             except IndexError:
                 raise TestRailError("Test ID '%s' was not found" % test_id)
         else:
@@ -548,21 +1318,32 @@ class API(object):
                 raise TestRailError("Test ID '%s' was not found" % test_id)
 
     # Result Requests
-    def results_by_run(self, run_id):
-        if self._refresh(self._results[run_id]['ts']):
-            endpoint = 'get_results_for_run/%s' % run_id
-            self._results[run_id]['value'] = self._paginate_request(endpoint, {}, "results")
-            self._results[run_id]['ts'] = datetime.now()
-        return self._results[run_id]['value']
-
-    def results_by_test(self, test_id):
-        if self._refresh(self._results[test_id]['ts']):
-            endpoint = 'get_results/%s' % test_id
-            self._results[test_id]['value'] = self._paginate_request(endpoint, {}, "results")
-            self._results[test_id]['ts'] = datetime.now()
-        return self._results[test_id]['value']
-
-    @UpdateCache(_shared_state['_results'])
+    def results_by_run(self, run_id, filters=None):
+        endpoint = 'get_results_for_run/%s' % run_id
+        if filters:
+            return self._cached_query('_results', (run_id, ), endpoint,
+                                      'results', filters, result_filters)
+        # results never change once added, so only fetch the new ones
+        return self._cached('_results', (run_id, ), lambda: (
+            self._delta_refresh(self._results[run_id], endpoint, {},
+                                'results', 'created_on', 'created_after',
+                                newest_first=True)))
+
+    def iter_results_by_run(self, run_id):
+        return self._iter_cached(self._results.get(run_id, {}),
+                                 'get_results_for_run/%s' % run_id, {},
+                                 'results')
+
+    def results_by_test(self, test_id, filters=None):
+        endpoint = 'get_results/%s' % test_id
+        if filters:
+            return self._cached_query(
+                '_test_results', (test_id, ), endpoint, 'results', filters,
+                ('defects_filter', 'status_id'))
+        return self._cached('_test_results', (test_id, ), lambda: (
+            self._paginate_request(endpoint, {}, "results")))
+
+    @UpdateCache(_shared_state['_test_results'], newest_first=True)
     def add_result(self, data):
         fields = ['status_id',
                   'comment',
@@ -573,19 +1354,19 @@ class API(object):
         fields.extend(self._custom_field_discover(data))
 
         payload = self._payload_gen(fields, data)
-        payload['elapsed'] = str(payload['elapsed']) + 's'
+        if 'elapsed' in payload:
+            payload['elapsed'] = str(payload['elapsed']) + 's'
         result = self._post('add_result/%s' % data['test_id'], payload)
 
-        # Need to update the _tests cache to mark the run for refresh
-        for run in self._tests:
-            for test in self._tests[run]['value']:
-                if test['id'] == data['test_id']:
-                    self._tests[run]['ts'] = None
-                    return result
-        else:
-            raise TestRailError("Could not find test '%s' in cache to update" % data['test_id'])
+        # Mark the run's tests and results for refresh. The result is
+        # posted either way; when no cache holds the test's run (never
+        # loaded, or evicted) there is nothing to refresh.
+        run_id = self._cached_test_run_id(data['test_id'])
+        if run_id is not None:
+            self._mark_run_results_stale(run_id)
+        return result
 
-    @UpdateCache(_shared_state['_results'])
+    @UpdateCache(_shared_state['_test_results'], newest_first=True)
     def add_results(self, results, run_id):
         fields = ['status_id',
                   'test_id',
@@ -599,46 +1380,131 @@ class API(object):
         for result in results:
             custom_field = fields + self._custom_field_discover(result)
             result = self._payload_gen(custom_field + fields, result)
-            result['elapsed'] = str(result['elapsed']) + 's'
+            if 'elapsed' in result:
+                result['elapsed'] = str(result['elapsed']) + 's'
             payload['results'].append(result)
 
         response = self._post('add_results/%s' % run_id, payload)
 
-        # Need to update the _tests cache to mark the run for refresh
-        self._tests[run_id]['ts'] = None
+        # Mark the run's tests and results for refresh
+        self._mark_run_results_stale(run_id)
 
         return response
 
+    def _mark_run_results_stale(self, run_id):
+        # Test statuses follow their latest result, and the run's results
+        # pick up the new ones on their next (delta) refresh. Runs that
+        # aren't cached (or were evicted) are left alone.
+        for collection in (self._tests, self._results):
+            cache = collection.get(run_id)
+            if cache is not None:
+                cache['ts'] = None
+                _invalidate_queries(cache)
+
+    def _cached_test_run_id(self, test_id):
+        """ Return the id of the cached run that contains test_id, or None
+
+            The run's tests may have been evicted while its results are
+            still cached, so those are searched too.
+        """
+        for run_id, cache in list(self._tests.items()):
+            if 'value' in cache and _index(cache, 'id').get(test_id):
+                return run_id
+        for run_id, cache in list(self._results.items()):
+            if 'value' in cache and _index(cache, 'test_id').get(test_id):
+                return run_id
+        return None
+
+    def test_run_id(self, test_id):
+        """ Return the id of the run test_id belongs to, asking TestRail only
+            when the test isn't in any cached run. The run's tests are then
+            loaded too, so its other tests are found without a request each.
+        """
+        run_id = self._cached_test_run_id(test_id)
+        if run_id is None:
+            run_id = self.test_with_id(test_id)['run_id']
+            try:
+                self.tests(run_id)
+            except TestRailError:
+                # Only a shortcut for the next tests; the run id is known
+                pass
+        return run_id
+
+    def _project_of(self, name, obj_id, end_point):
+        """ Return the id of the project whose cached self.<name> listing
+            holds obj_id, asking TestRail (end_point/obj_id) only when none
+            does. Models use it to resolve rows that don't carry their
+            project, rather than the last project set on any API. None when
+            TestRail doesn't know obj_id either, so the lookup that follows
+            reports it as not found.
+
+            Answers from TestRail are kept, as runs and suites never move
+            to another project; runs of test plans, which no get_runs
+            listing holds, would otherwise be asked for on every access.
+        """
+        project_id = self._project_ids.get((name, obj_id))
+        if project_id is not None:
+            return project_id
+        for project_id, cache in list(getattr(self, name).items()):
+            if 'value' in cache and _index(cache, 'id').get(obj_id):
+                return project_id
+        try:
+            obj = self._get('%s/%s' % (end_point, obj_id))
+        except TestRailError:
+            return None
+        project_id = obj.get('project_id') if isinstance(obj, dict) else None
+        if project_id is not None:
+            self._project_ids[(name, obj_id)] = project_id
+        return project_id
+
+    def run_project_id(self, run_id):
+        """ Return the id of the project run_id belongs to
+        """
+        return self._project_of('_runs', run_id, 'get_run')
+
+    def suite_project_id(self, suite_id):
+        """ Return the id of the project suite_id belongs to
+        """
+        return self._project_of('_suites', suite_id, 'get_suite')
+
     def _custom_field_discover(self, entity):
         return [field for field in entity.keys() if field.startswith('custom_')]
 
     # Status Requests
     def statuses(self):
-        if self._refresh(self._statuses['ts']):
-            _statuses = self._get('get_statuses')
-            self._statuses['value'] = _statuses
-            self._statuses['ts'] = datetime.now()
-        return self._statuses['value']
+        return self._cached('_statuses', (), lambda: self._get(
+            'get_statuses'))
 
     def status_with_id(self, status_id):
         try:
-            return list(filter(lambda x: x['id'] == status_id, self.statuses()))[0]
+            self.statuses()
+            return self._find(self._statuses, 'id', status_id)
         except IndexError:
             raise TestRailError("Status ID '%s' was not found" % status_id)
 
-    def configs(self):
-        if self._refresh(self._configs['ts']):
-            _configs = self._get('get_configs/%s' % self._project_id)
-            self._configs['value'] = _configs
-            self._configs['ts'] = datetime.now()
-        return self._configs['value']
+    def statuses_with_name(self, name):
+        self.statuses()
+        return self._named(self._statuses, name)
+
+    def configs(self, project_id=None):
+        project_id = project_id or self._project_id
+        return self._cached('_configs', (project_id, ), lambda: self._get(
+            'get_configs/%s' % project_id))
+
+    def _get(self, uri, params=None):
+        """ GET uri, sharing the response, or error, of an identical request
+            another thread already has in flight instead of sending it again
+        """
+        key = (self._url, uri, tuple(sorted((params or {}).items())))
+        return self._flights.do(key, lambda: self._http_get(uri, params))
 
     @retry(ServiceUnavailableError, tries=30, delay=10)
     @retry((TooManyRequestsError, ValueError), tries=3, delay=1, backoff=2)
-    def _get(self, uri, params=None):
+    def _http_get(self, uri, params=None):
+        self._throttle()
         uri = '/index.php?/api/v2/%s' % uri
-        r = requests.get(self._url+uri, params=params, auth=self._auth,
-                         headers=self.headers, verify=self.verify_ssl)
+        r = self._http().get(self._url+uri, params=params, auth=self._auth,
+                             headers=self.headers, verify=self.verify_ssl)
 
         self._raise_on_429_or_503_status(r)
 
@@ -660,9 +1526,10 @@ class API(object):
     @retry(ServiceUnavailableError, tries=30, delay=10)
     @retry(TooManyRequestsError, tries=3, delay=1, backoff=2)
     def _post(self, uri, data={}):
+        self._throttle()
         uri = '/index.php?/api/v2/%s' % uri
-        r = requests.post(self._url+uri, json=data, auth=self._auth,
-                          verify=self.verify_ssl)
+        r = self._http().post(self._url+uri, json=data, auth=self._auth,
+                              verify=self.verify_ssl)
 
         self._raise_on_429_or_503_status(r)
 
@@ -1,9 +1,74 @@
+from functools import update_wrapper
+
+
+def relation(*fields):
+    """ Property decorator for an object looked up through _content[fields]
+
+        The looked-up object is kept on the instance along with the values of
+        fields it came from, and only looked up again once one of them
+        changes, whether through a setter or _content directly. Relations
+        that walk through other relations (e.g. Test.case through run and
+        suite) list every field the walk depends on.
+        ContainerIter.prefetch fills the same store for many objects at once.
+    """
+    def decorator(func):
+        name = func.__name__
+
+        def getter(self):
+            key = self._relation_key(fields)
+            relations = self._relation_store()
+            if name in relations and relations[name][0] == key:
+                return relations[name][1]
+            value = func(self)
+            relations[name] = (key, value)
+            return value
+        update_wrapper(getter, func)
+        getter.fields = fields
+        return property(getter)
+    return decorator
+
+
+class SharedAPI(object):
+    """ Hand every model the same API instance instead of one per object
+
+        API is a Borg, so one instance sees everything another would; it is
+        only built on first use so that creating models stays cheap. Models
+        that assign self.api themselves shadow it as before.
+    """
+    _api = None
+
+    def __get__(self, obj, cls=None):
+        if SharedAPI._api is None:
+            from testrail.api import API
+            SharedAPI._api = API()
+        return SharedAPI._api
+
+
 class TestRailBase(object):
     """ Base class for all TestRail objects with a TestRail ID
     """
+    __slots__ = ()
+
+    api = SharedAPI()
+
     def __str__(self):
         class_name = self.__class__.__name__
         return "{0}-{1}".format(class_name, self.id)
 
     def __repr__(self):
         return str(self)
+
+    def _relation_key(self, fields):
+        return tuple(self._content.get(field) for field in fields)
+
+    def _relation_store(self):
+        try:
+            return self._relations
+        except AttributeError:
+            self._relations = dict()
+            return self._relations
+
+    def _attach(self, name, key, value):
+        """ Store value as the relation name resolved from key
+        """
+        self._relation_store()[name] = (key, value)
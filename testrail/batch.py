@@ -0,0 +1,286 @@
+from queue import Queue, Empty, Full
+from time import time
+import threading
+
+from testrail.helper import TestRailError
+
+
+def _rejects_rows(error):
+    """ Whether error is TestRail refusing rows of an add_results request (a
+        400 naming its results field), as opposed to the whole request: a
+        closed or deleted run, 401/403, 429 or 5xx
+    """
+    response = error.args[0] if error.args else None
+    if not isinstance(response, dict):
+        return False
+    return (response.get('status_code') == 400 and
+            'results' in str(response.get('error')))
+
+
+def _post_results(api, run_id, results):
+    """ Post results, returning the TestRailError raised or None
+    """
+    try:
+        api.add_results([r.raw_data() for r in results], run_id)
+    except TestRailError as e:
+        return e
+    return None
+
+
+def _add_results(api, run_id, results, error=None):
+    """ Post results to run_id through api.add_results (unless error says
+        they were just rejected) and return the (result, error) pairs of
+        the results that were not added. A chunk TestRail rejects rows of is
+        split in half and each half retried, so one bad result doesn't keep
+        the others from being posted. Errors about the request as a whole,
+        or both halves failing alike, fail the whole chunk instead.
+    """
+    if error is None:
+        error = _post_results(api, run_id, results)
+        if error is None:
+            return list()
+    if len(results) == 1 or not _rejects_rows(error):
+        return [(result, error) for result in results]
+    middle = len(results) // 2
+    halves = [results[:middle], results[middle:]]
+    errors = [_post_results(api, run_id, half) for half in halves]
+    if all(e is not None and str(e) == str(error) for e in errors):
+        # Not down to particular rows after all
+        return [(result, error) for result in results]
+    failed = list()
+    for half, half_error in zip(halves, errors):
+        if half_error is not None:
+            failed.extend(_add_results(api, run_id, half, half_error))
+    return failed
+
+
+class ResultBuffer(object):
+    """ Collect Results per run and post them through API.add_results
+
+        Results are flushed once size of them are pending, once the oldest
+        pending result is interval seconds old (checked when results are
+        added) and when the buffer is closed or used as a context manager.
+        If TestRail rejects rows of a chunk it is split in half and each half
+        is retried, so one bad result doesn't keep the others from being
+        posted. Results that can't be added are kept in self.failed as
+        (result, error) pairs and reported by flush(). run (a Run or run id)
+        is the run of results added without one.
+    """
+    def __init__(self, api, size=100, interval=None, run=None):
+        if size < 1:
+            raise TestRailError('size must be at least 1')
+        self.api = api
+        self.size = size
+        self.interval = interval
+        self.run = run
+        self.closed = False
+        self.failed = list()
+        self._pending = dict()
+        self._count = 0
+        self._oldest = None
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self.close()
+        except TestRailError:
+            # Don't hide the exception that is already propagating
+            if exc_type is None:
+                raise
+
+    def __len__(self):
+        return self._count
+
+    def add(self, result, run=None):
+        """ Queue result, posting the buffer if a threshold is reached
+
+            run (a Run or run id, self.run by default) saves looking up the
+            run of result's test.
+        """
+        if self.closed:
+            raise TestRailError('result buffer is closed')
+        if run is None:
+            run = self.run
+        if run is None:
+            run_id = self.api.test_run_id(result.raw_data()['test_id'])
+        else:
+            run_id = getattr(run, 'id', run)
+        with self._lock:
+            self._pending.setdefault(run_id, list()).append(result)
+            self._count += 1
+            if self._oldest is None:
+                self._oldest = time()
+            if self._due():
+                self.flush()
+
+    def _due(self):
+        if self._count >= self.size:
+            return True
+        return (self.interval is not None and
+                time() - self._oldest >= self.interval)
+
+    def flush(self):
+        """ Post every pending result in chunks of at most size results
+        """
+        with self._lock:
+            pending, self._pending = self._pending, dict()
+            self._count = 0
+            self._oldest = None
+            failed = len(self.failed)
+            chunks = [(run_id, results[i:i + self.size])
+                      for run_id, results in pending.items()
+                      for i in range(0, len(results), self.size)]
+            for index, (run_id, chunk) in enumerate(chunks):
+                try:
+                    self.failed.extend(_add_results(self.api, run_id, chunk))
+                except Exception:
+                    # e.g. TestRail could not be reached; keep the chunks
+                    # not posted yet for the next flush
+                    for run_id, chunk in chunks[index:]:
+                        self._pending.setdefault(run_id, list()).extend(chunk)
+                        self._count += len(chunk)
+                    self._oldest = time()
+                    raise
+            if len(self.failed) > failed:
+                raise TestRailError(
+                    '%s results could not be added: %s' % (
+                        len(self.failed) - failed,
+                        [str(e) for r, e in self.failed[failed:]]))
+
+    def close(self):
+        """ Flush what is left and stop accepting results
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.flush()
+
+
+_FLUSH = object()
+_STOP = object()
+
+
+class ResultUploader(object):
+    """ Post Results through API.add_results from background threads
+
+        add() puts results on a queue of at most maxsize entries and returns
+        straight away; when the queue is full it blocks until the workers
+        catch up. Each worker gathers up to size results, waiting at most
+        interval seconds for more, and posts them per run the same way
+        ResultBuffer does. Results that can't be posted are kept in
+        self.failed and passed to on_error(result, error) if it is given.
+        flush() waits until everything queued so far has been posted. run
+        (a Run or run id) is the run of results added without one.
+    """
+    def __init__(self, api, size=100, interval=1.0, maxsize=1000, workers=1,
+                 on_error=None, run=None):
+        if size < 1 or workers < 1:
+            raise TestRailError('size and workers must be at least 1')
+        self.api = api
+        self.size = size
+        self.interval = interval
+        self.on_error = on_error
+        self.run = run
+        self.closed = False
+        self.failed = list()
+        self._queue = Queue(maxsize)
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._work)
+                         for _ in range(workers)]
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, result, run=None, block=True, timeout=None):
+        """ Queue result for upload
+
+            With block=False, or once timeout seconds pass, a full queue
+            raises TestRailError instead of waiting.
+        """
+        if self.closed:
+            raise TestRailError('result uploader is closed')
+        if run is None:
+            run = self.run
+        try:
+            self._queue.put((result, run), block, timeout)
+        except Full:
+            raise TestRailError('result upload queue is full')
+
+    def flush(self):
+        """ Block until every result queued so far has been posted
+        """
+        if self.closed:
+            # close() posted everything left and stopped the workers
+            return
+        for _ in self._threads:
+            self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self):
+        """ Post what is left, then stop the worker threads
+        """
+        if self.closed:
+            return
+        self.closed = True
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self):
+        while True:
+            batch = list()
+            item = self._queue.get()
+            deadline = time() + self.interval
+            while item not in (_FLUSH, _STOP):
+                batch.append(item)
+                if len(batch) >= self.size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0, deadline - time()))
+                except Empty:
+                    break
+            try:
+                self._upload(batch)
+            finally:
+                for _ in range(len(batch)):
+                    self._queue.task_done()
+                if item in (_FLUSH, _STOP):
+                    self._queue.task_done()
+            if item is _STOP:
+                return
+
+    def _upload(self, batch):
+        runs = dict()
+        failed = list()
+        for result, run in batch:
+            try:
+                if run is None:
+                    run = self.api.test_run_id(result.raw_data()['test_id'])
+                runs.setdefault(getattr(run, 'id', run), list()).append(result)
+            except Exception as e:
+                failed.append((result, e))
+        for run_id, results in runs.items():
+            try:
+                failed.extend(_add_results(self.api, run_id, results))
+            except Exception as e:
+                # e.g. TestRail could not be reached; the worker carries on
+                failed.extend((result, e) for result in results)
+        with self._lock:
+            self.failed.extend(failed)
+        if self.on_error is not None:
+            for result, error in failed:
+                try:
+                    self.on_error(result, error)
+                except Exception:
+                    # A failing callback must not stop the worker
+                    pass
@@ -0,0 +1,93 @@
+""" Storage backends for the collections cached by testrail.api.API
+
+    API always keeps what it downloads in its in-process _shared_state. A
+    backend is an optional second level that outlives the process, so other
+    processes on the same host can start with warm data.
+"""
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime
+
+
+class CacheBackend(object):
+    """ Interface for cache backends
+
+        Collections are addressed by name (e.g. '_cases') and a tuple key
+        (e.g. the server, user, project and suite). Timestamps are datetimes,
+        values anything JSON serializable.
+    """
+    def load(self, name, key):
+        """ Return (ts, value) for the collection, or None if not stored
+        """
+        raise NotImplementedError
+
+    def store(self, name, key, ts, value):
+        raise NotImplementedError
+
+    def delete(self, name, key):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """ Default backend. Collections only live in API._shared_state, so
+        there is nothing more to load or store.
+    """
+    def load(self, name, key):
+        return None
+
+    def store(self, name, key, ts, value):
+        pass
+
+    def delete(self, name, key):
+        pass
+
+    def clear(self):
+        pass
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """ Store collections in a local SQLite file shared by every process
+        that points at it. A connection is opened per call, so one instance
+        can be used from several threads.
+    """
+    def __init__(self, path=None, timeout=30):
+        self.path = path or os.path.join(
+            os.path.expanduser('~'), '.testrail_cache.sqlite')
+        self.timeout = timeout
+        with closing(self._connect()) as conn, conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS cache ('
+                         'name TEXT, key TEXT, ts REAL, value TEXT, '
+                         'PRIMARY KEY (name, key))')
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=self.timeout)
+
+    def load(self, name, key):
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                'SELECT ts, value FROM cache WHERE name = ? AND key = ?',
+                (name, json.dumps(key))).fetchone()
+        if row is None:
+            return None
+        return datetime.fromtimestamp(row[0]), json.loads(row[1])
+
+    def store(self, name, key, ts, value):
+        epoch = time.mktime(ts.timetuple()) + ts.microsecond / 1e6
+        with closing(self._connect()) as conn, conn:
+            conn.execute('INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)',
+                         (name, json.dumps(key), epoch, json.dumps(value)))
+
+    def delete(self, name, key):
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM cache WHERE name = ? AND key = ?',
+                         (name, json.dumps(key)))
+
+    def clear(self):
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM cache')
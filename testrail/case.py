@@ -1,8 +1,7 @@
 from datetime import datetime
 import sys
 
-from testrail.base import TestRailBase
-from testrail.api import API
+from testrail.base import TestRailBase, relation
 from testrail.casetype import CaseType
 from testrail.helper import custom_methods, TestRailError
 from testrail.milestone import Milestone
@@ -16,21 +15,23 @@ if sys.version_info >= (3,0):
     unicode = str
 
 class Case(TestRailBase):
+    __slots__ = ('_content', '_relations')
+
     def __init__(self, content=None):
         self._content = content or dict()
-        self.api = API()
-        self._custom_methods = custom_methods(self._content)
 
     def __getattr__(self, attr):
-        if attr in self._custom_methods:
-            return self._content.get(self._custom_methods[attr])
+        if not attr.startswith('_'):
+            methods = custom_methods(self._content)
+            if attr in methods:
+                return self._content.get(methods[attr])
         raise AttributeError("'{}' object has no attribute '{}'".format(
             self.__class__.__name__, attr))
 
     def __str__(self):
         return self.title
 
-    @property
+    @relation('created_by')
     def created_by(self):
         user_id = self._content.get('created_by')
         return User(self.api.user_by_id(user_id))
@@ -58,7 +59,7 @@ class Case(TestRailBase):
     def id(self):
         return self._content.get('id')
 
-    @property
+    @relation('milestone_id')
     def milestone(self):
         m = self.api.milestone_with_id(self._content.get('milestone_id'))
         return Milestone(m) if m else Milestone()
@@ -70,7 +71,7 @@ class Case(TestRailBase):
         self._content['milestone_id'] = value.id
 
     
-    @property
+    @relation('priority_id')
     def priority(self):
         p = self.api.priority_with_id(self._content.get('priority_id'))
         return Priority(p) if p else Priority()
@@ -93,9 +94,10 @@ class Case(TestRailBase):
         self._content['refs'] = ','.join(value)
 
     
-    @property
+    @relation('section_id')
     def section(self):
-        s = self.api.section_with_id(self._content.get('section_id'))
+        s = self.api.section_with_id(self._content.get('section_id'),
+                                     project_id=self._suite_project_id())
         return Section(s) if s else Section()
 
     @section.setter
@@ -104,11 +106,16 @@ class Case(TestRailBase):
             raise TestRailError('input must be a Section')
         self._content['section_id'] = value.id
     
-    @property
+    @relation('suite_id')
     def suite(self):
-        s = self.api.suite_with_id(self._content.get('suite_id'))
+        s = self.api.suite_with_id(self._content.get('suite_id'),
+                                   project_id=self._suite_project_id())
         return Suite(s) if s else Suite()
 
+    def _suite_project_id(self):
+        suite_id = self._content.get('suite_id')
+        return self.api.suite_project_id(suite_id) if suite_id else None
+
     @suite.setter
     def suite(self, value):
         if not isinstance(value, Suite):
@@ -125,7 +132,7 @@ class Case(TestRailBase):
             raise TestRailError('input must be a string')
         self._content['title'] = value
 
-    @property
+    @relation('type_id')
     def type(self):
         t = self.api.case_type_with_id(self._content.get('type_id'))
         return CaseType(t) if t else CaseType()
@@ -137,7 +144,7 @@ class Case(TestRailBase):
         self._content['type_id'] = value.id
 
 
-    @property
+    @relation('updated_by')
     def updated_by(self):
         user_id = self._content.get('updated_by')
         return User(self.api.user_by_id(user_id))
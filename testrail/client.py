@@ -2,33 +2,57 @@ import re
 import sys
 
 from testrail.api import API
+from testrail.batch import ResultBuffer, ResultUploader
 from testrail.case import Case
 from testrail.configuration import Config, ConfigContainer
 from testrail.helper import methdispatch, singleresult, TestRailError
 from testrail.milestone import Milestone
 from testrail.plan import Plan, PlanContainer
 from testrail.project import Project, ProjectContainer
+from testrail.query import Query
 from testrail.result import Result, ResultContainer
 from testrail.run import Run, RunContainer
 from testrail.status import Status
 from testrail.suite import Suite
 from testrail.section import Section
+from testrail.table import ResultTable
 from testrail.test import Test
 from testrail.user import User
+from testrail.warm import warm
 
 if sys.version_info >= (3,0):
     unicode = str
 
 class TestRail(object):
-    def __init__(self, project_id=0, email=None, key=None, url=None):
-        self.api = API(email=email, key=key, url=url)
+    def __init__(self, project_id=0, email=None, key=None, url=None,
+                 cache_ttl=None, cache_limit=None):
+        self.api = API(email=email, key=key, url=url, cache_ttl=cache_ttl,
+                       cache_limit=cache_limit)
         self.api.set_project_id(project_id)
         self._project_id = project_id
+        self._result_buffer = None
 
     def set_project_id(self, project_id):
         self._project_id = project_id
         self.api.set_project_id(project_id)
 
+    def query(self, model, scope=None):
+        """ Query of the project's Runs or Plans, or of the Results of the Run
+            passed as scope, filtered by TestRail where it can (see Query)
+        """
+        return Query(self, model, scope)
+
+    def warm(self, project=None, include=None, workers=None):
+        """ Fetch the reference collections relations are resolved from
+            (users, statuses, priorities, case_types, suites, milestones,
+            sections and configs, or only those in include) concurrently,
+            so the first lookups don't each wait on a request. project is a
+            Project or its id and defaults to this client's. Returns a
+            WarmReport of what was loaded and how long it took.
+        """
+        project_id = getattr(project, 'id', project) or self._project_id
+        return warm(self.api, project_id, include, workers)
+
     # Post generics
     @methdispatch
     def add(self, obj):
@@ -58,7 +82,7 @@ class TestRail(object):
     @project.register(unicode)
     @singleresult
     def _project_by_name(self, name):
-        return filter(lambda p: p.name == name, self.projects())
+        return list(map(Project, self.api.projects_with_name(name)))
 
     @project.register(int)
     @singleresult
@@ -105,7 +129,8 @@ class TestRail(object):
     @suite.register(unicode)
     @singleresult
     def _suite_by_name(self, name):
-        return filter(lambda s: s.name.lower() == name.lower(), self.suites())
+        return list(map(
+            Suite, self.api.suites_with_name(name, self._project_id)))
 
     @suite.register(int)
     @singleresult
@@ -143,8 +168,8 @@ class TestRail(object):
     @milestone.register(unicode)
     @singleresult
     def _milestone_by_name(self, name):
-        return filter(
-            lambda m: m.name.lower() == name.lower(), self.milestones())
+        return list(map(
+            Milestone, self.api.milestones_with_name(name, self._project_id)))
 
     @milestone.register(int)
     @singleresult
@@ -171,8 +196,7 @@ class TestRail(object):
 
     @plans.register(Milestone)
     def _plans_for_milestone(self, obj):
-        plans = filter(lambda p: p.milestone is not None, self.plans())
-        return PlanContainer(filter(lambda p: p.milestone.id == obj.id, plans))
+        return self.query(Plan).filter(milestone=obj).all()
 
     @methdispatch
     def plan(self):
@@ -182,7 +206,8 @@ class TestRail(object):
     @plan.register(unicode)
     @singleresult
     def _plan_by_name(self, name):
-        return filter(lambda p: p.name.lower() == name.lower(), self.plans())
+        return list(map(
+            Plan, self.api.plans_with_name(name, self._project_id)))
 
     @plan.register(int)
     @singleresult
@@ -190,10 +215,10 @@ class TestRail(object):
         return filter(lambda p: p.id == plan_id, self.plans())
 
     def completed_plans(self):
-        return filter(lambda p: p.is_completed is True, self.plans())
+        return self.query(Plan).filter(is_completed=True).all()
 
     def active_plans(self):
-        return filter(lambda p: p.is_completed is False, self.plans())
+        return self.query(Plan).filter(is_completed=False).all()
 
     @add.register(Plan)
     def _add_plan(self, obj, milestone=None):
@@ -220,15 +245,14 @@ class TestRail(object):
 
     @runs.register(Milestone)
     def _runs_for_milestone(self, obj):
-        return RunContainer(filter(
-            lambda r: r.milestone.id == obj.id, self.runs()))
+        return self.query(Run).filter(milestone=obj).all()
 
     @runs.register(str)
     @runs.register(unicode)
     def _runs_by_name(self, name):
         # Returns all Runs that match :name, in descending order by ID
-        runs = list(filter(lambda r: r.name.lower() == name.lower(), self.runs()))
-        return sorted(runs, key=lambda r: r.id)
+        runs = self.api.runs_with_name(name, self._project_id)
+        return list(map(Run, sorted(runs, key=lambda r: r['id'])))
 
     @methdispatch
     def run(self):
@@ -239,8 +263,8 @@ class TestRail(object):
     @singleresult
     def _run_by_name(self, name):
         # Returns the most recently created Run that matches :name
-        runs = list(filter(lambda r: r.name.lower() == name.lower(), self.runs()))
-        return sorted(runs, key=lambda r: r.id)[:1]
+        runs = self.api.runs_with_name(name, self._project_id)
+        return [Run(min(runs, key=lambda r: r['id']))] if runs else []
 
     @run.register(int)
     @singleresult
@@ -299,6 +323,12 @@ class TestRail(object):
     def tests(self, run):
         return list(map(Test, self.api.tests(run.id)))
 
+    def iter_tests(self, run):
+        """ Yield the Tests of run as pages arrive, without caching them
+        """
+        for test in self.api.iter_tests(run.id):
+            yield Test(test)
+
     @methdispatch
     def test(self):
         return Test()
@@ -324,6 +354,18 @@ class TestRail(object):
     def _results_for_run(self, run):
         return ResultContainer(list(map(Result, self.api.results_by_run(run.id))))
 
+    def iter_results(self, run):
+        """ Yield the Results of run as pages arrive, without caching them
+        """
+        for result in self.api.iter_results_by_run(run.id):
+            yield Result(result)
+
+    def result_table(self, run):
+        """ ResultTable of run's results, for counts and timings over many
+            results without building a Result for each
+        """
+        return ResultTable.from_run(self.api, run.id)
+
     @results.register(Test)
     def _results_for_test(self, test):
         return ResultContainer(list(map(Result, self.api.results_by_test(test.id))))
@@ -332,8 +374,34 @@ class TestRail(object):
     def result(self):
         return Result()
 
+    def buffer_results(self, size=100, interval=None, run=None):
+        """ Batch the Results passed to add() through API.add_results
+
+            Use the returned ResultBuffer as a context manager; pending
+            results are posted on exit, and add() posts one at a time again.
+            Give the run (a Run or run id) the results belong to, when known,
+            so their runs aren't looked up one test at a time.
+        """
+        self._result_buffer = ResultBuffer(self.api, size, interval, run)
+        return self._result_buffer
+
+    def upload_results(self, size=100, interval=1.0, maxsize=1000, workers=1,
+                       on_error=None, run=None):
+        """ Post the Results passed to add() from background threads
+
+            add() only blocks while the returned ResultUploader's queue is
+            full. Call its flush() to wait for the uploads, and close() (or
+            leave its with-block) when done. run is as for buffer_results().
+        """
+        self._result_buffer = ResultUploader(
+            self.api, size, interval, maxsize, workers, on_error, run)
+        return self._result_buffer
+
     @add.register(Result)
     def _add_result(self, obj):
+        if self._result_buffer is not None and not self._result_buffer.closed:
+            self._result_buffer.add(obj)
+            return
         self.api.add_result(obj.raw_data())
 
     @add.register(tuple)
@@ -376,7 +444,7 @@ class TestRail(object):
     @status.register(unicode)
     @singleresult
     def _status_by_name(self, name):
-        return filter(lambda s: s.name == name.lower(), self.statuses())
+        return list(map(Status, self.api.statuses_with_name(name)))
 
     @status.register(int)
     @singleresult
@@ -36,4 +36,6 @@ class Entry(TestRailBase):
 
     @property
     def suite(self):
-        return Suite(self._api.suite_with_id(self._content.get('suite_id')))
+        suite_id = self._content.get('suite_id')
+        return Suite(self._api.suite_with_id(
+            suite_id, project_id=self._api.suite_project_id(suite_id)))
@@ -0,0 +1,58 @@
+""" Coalescing of identical concurrent calls
+"""
+import threading
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.owner = threading.current_thread()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """ Run at most one call per key at a time
+
+        A thread calling do() while a call with the same key is in flight
+        waits for it and gets its result, or has its exception raised,
+        instead of running func itself. Calls with different keys run
+        independently.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = dict()
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            if call.owner is threading.current_thread():
+                # func asked for its own key again; waiting would deadlock
+                return func()
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        """ Number of calls currently running
+        """
+        with self._lock:
+            return len(self._calls)
@@ -2,6 +2,10 @@ import re
 import inspect
 from datetime import timedelta
 from functools import update_wrapper
+try:
+    from functools import lru_cache
+except ImportError:
+    from backports.functools_lru_cache import lru_cache
 
 from singledispatch import singledispatch
 
@@ -37,16 +41,36 @@ def class_name(meth):
             return cls
 
 
+duration_re = re.compile(r'(\d+)([wdhms])')
+duration_units = {'w': 604800, 'd': 86400, 'h': 3600, 'm': 60, 's': 1}
+
+
+@lru_cache(maxsize=4096)
+def duration_seconds(duration):
+    """ Seconds in a TestRail duration such as '1w 3d 6h 2m 30s'
+
+        Only the first amount given for each unit counts.
+    """
+    seconds = 0
+    seen = set()
+    for amount, unit in duration_re.findall(duration):
+        if unit not in seen:
+            seen.add(unit)
+            seconds += int(amount) * duration_units[unit]
+    return seconds
+
+
+@lru_cache(maxsize=4096)
 def testrail_duration_to_timedelta(duration):
-        span = lambda x: int(x.group(0)[:-1]) if x else 0
-        timedelta_map = {
-            'weeks': span(re.search('\d+w', duration)),
-            'days': span(re.search('\d+d', duration)),
-            'hours': span(re.search('\d+h', duration)),
-            'minutes': span(re.search('\d+m', duration)),
-            'seconds': span(re.search('\d+s', duration))
-        }
-        return timedelta(**timedelta_map)
+    return timedelta(seconds=duration_seconds(duration))
+
+
+def parse_durations(durations):
+    """ List of seconds for an iterable of TestRail durations. Numbers are
+        taken to be seconds already and None is passed through.
+    """
+    return [duration if duration is None or isinstance(duration, (int, float))
+            else duration_seconds(duration) for duration in durations]
 
 
 def singleresult(func):
@@ -68,6 +92,22 @@ class ContainerIter(object):
     def __init__(self, objs):
         self._objs = list(objs)
 
+    def prefetch(self, *names):
+        """ Resolve the named relation properties (e.g. 'status') once per
+            distinct foreign id and attach the result to every object that
+            shares that id, instead of looking it up once per object
+        """
+        for name in names:
+            resolved = dict()
+            for obj in self._objs:
+                fields = getattr(type(obj), name).fget.fields
+                key = obj._relation_key(fields)
+                if key in resolved:
+                    obj._attach(name, key, resolved[key])
+                else:
+                    resolved[key] = getattr(obj, name)
+        return self
+
     def __len__(self):
         return len(self._objs)
 
@@ -78,7 +118,22 @@ class ContainerIter(object):
 custom_methods_re = re.compile(r'^custom_(\w+)')
 
 
+_custom_method_tables = dict()
+
+
 def custom_methods(content):
-    matches = [custom_methods_re.match(method) for method in content]
-    return dict({match.group(1): match.group(0) for match in matches if match})
+    """ Map custom field names, minus the custom_ prefix, to their keys
+
+        Rows with the same set of keys share one (read-only) table.
+    """
+    schema = frozenset(content)
+    table = _custom_method_tables.get(schema)
+    if table is None:
+        matches = [custom_methods_re.match(method) for method in schema]
+        table = dict(
+            {match.group(1): match.group(0) for match in matches if match})
+        if len(_custom_method_tables) >= 256:
+            _custom_method_tables.clear()
+        _custom_method_tables[schema] = table
+    return table
 
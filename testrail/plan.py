@@ -1,8 +1,7 @@
 from datetime import datetime
 
-from testrail.base import TestRailBase
+from testrail.base import TestRailBase, relation
 import testrail.entry
-from testrail.api import API
 from testrail.user import User
 from testrail.project import Project
 from testrail.milestone import Milestone
@@ -10,11 +9,12 @@ from testrail.helper import ContainerIter, TestRailError
 
 
 class Plan(TestRailBase):
+    __slots__ = ('_content', '_relations')
+
     def __init__(self, content=None):
         self._content = content or dict()
-        self.api = API()
 
-    @property
+    @relation('assignedto_id')
     def assigned_to(self):
         return User(self.api.user_with_id(self._content.get('assignedto_id')))
 
@@ -37,7 +37,7 @@ class Plan(TestRailBase):
         except TypeError:
             return None
 
-    @property
+    @relation('created_by')
     def created_by(self):
         return User(self.api.user_with_id(self._content.get('created_by')))
 
@@ -75,7 +75,7 @@ class Plan(TestRailBase):
     def is_completed(self):
         return self._content.get('is_completed')
 
-    @property
+    @relation('milestone_id')
     def milestone(self):
         milestone_id = self._content.get('milestone_id')
         project_id = self._content.get('project_id')
@@ -103,7 +103,7 @@ class Plan(TestRailBase):
     def passed_count(self):
         return self._content.get('passed_count')
 
-    @property
+    @relation('project_id')
     def project(self):
         return Project(
             self.api.project_with_id(self._content.get('project_id')))
@@ -159,6 +159,7 @@ class PlanContainer(ContainerIter):
     def created_by(self, user):
         if not isinstance(user, User):
             raise TestRailError("Must pass in a User object")
+        self.prefetch('created_by')
         return list(filter(lambda p: p.created_by.id == user.id, self._plans))
 
     def latest(self):
@@ -0,0 +1,106 @@
+""" Listings narrowed on the TestRail server instead of in Python
+"""
+from testrail.api import plan_filters, result_filters, run_filters
+from testrail.helper import TestRailError
+from testrail.plan import Plan, PlanContainer
+from testrail.result import Result, ResultContainer
+from testrail.run import Run, RunContainer
+
+
+class Query(object):
+    """ Runs, Plans or Results of a Run matching a set of predicates
+
+        Built with TestRail.query() and narrowed with filter() and where().
+        Predicates the listing's endpoint accepts (run_filters, plan_filters
+        and result_filters in testrail.api) are sent to TestRail, and each
+        distinct set is cached by the API on its own.
+        Other field predicates are compared against the returned rows, and
+        where() functions against the model objects. Nothing is requested
+        until the query is iterated or all() is called.
+    """
+    # model: (filters the endpoint evaluates, container)
+    listings = {Run: (run_filters, RunContainer),
+                Plan: (plan_filters, PlanContainer),
+                Result: (result_filters, ResultContainer)}
+
+    # Friendlier names for predicates, e.g. filter(milestone=m)
+    aliases = {'completed': 'is_completed',
+               'milestone': 'milestone_id',
+               'status': 'status_id',
+               'suite': 'suite_id'}
+
+    def __init__(self, client, model, scope=None):
+        if model not in self.listings:
+            raise TestRailError(
+                'Can only query %s' % ', '.join(
+                    sorted(m.__name__ for m in self.listings)))
+        if model is Result and not isinstance(scope, Run):
+            raise TestRailError('Results must be queried for a Run')
+        self._client = client
+        self._model = model
+        self._scope = scope
+        self._server = dict()
+        self._local = dict()
+        self._functions = list()
+
+    def _copy(self):
+        query = Query(self._client, self._model, self._scope)
+        query._server = dict(self._server)
+        query._local = dict(self._local)
+        query._functions = list(self._functions)
+        return query
+
+    @staticmethod
+    def _value(value):
+        # TestRail objects filter by their id
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return [getattr(v, 'id', v) for v in value]
+        return getattr(value, 'id', value)
+
+    def filter(self, **predicates):
+        """ New query also requiring each field to equal its value, or to be
+            one of the values when given a list
+        """
+        query = self._copy()
+        server_filters = self.listings[self._model][0]
+        for name, value in predicates.items():
+            name = self.aliases.get(name, name)
+            if name in server_filters:
+                query._server[name] = self._value(value)
+            else:
+                query._local[name] = self._value(value)
+        return query
+
+    def where(self, func):
+        """ New query also requiring func(obj) to be true
+        """
+        query = self._copy()
+        query._functions.append(func)
+        return query
+
+    def _rows(self):
+        api = self._client.api
+        if self._model is Run:
+            return api.runs(self._client._project_id, filters=self._server)
+        if self._model is Plan:
+            return api.plans(self._client._project_id, filters=self._server)
+        return api.results_by_run(self._scope.id, filters=self._server)
+
+    def _matches(self, row):
+        for name, value in self._local.items():
+            if isinstance(value, list):
+                if row.get(name) not in value:
+                    return False
+            elif row.get(name) != value:
+                return False
+        return True
+
+    def all(self):
+        objs = [self._model(row) for row in self._rows()
+                if self._matches(row)]
+        for func in self._functions:
+            objs = [obj for obj in objs if func(obj)]
+        return self.listings[self._model][1](objs)
+
+    def __iter__(self):
+        return iter(self.all())
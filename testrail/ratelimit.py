@@ -0,0 +1,99 @@
+""" Client-side pacing of TestRail API requests
+"""
+from contextlib import contextmanager
+import json
+import os
+import threading
+from time import sleep, time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from testrail.helper import TestRailError
+
+
+class TokenBucket(object):
+    """ Token bucket allowing rate requests per second on average and bursts
+        of up to burst requests
+
+        backoff() (called when TestRail answers 429) halves the current rate,
+        down to min_rate, and empties the bucket. The rate then climbs back
+        linearly to the configured one over recovery seconds.
+
+        With lock_path the bucket state lives in that file and is updated
+        under an exclusive flock, so every process using the same path
+        shares one budget (POSIX only).
+    """
+    def __init__(self, rate, burst=None, min_rate=None, recovery=60,
+                 lock_path=None):
+        if rate <= 0:
+            raise TestRailError('rate must be positive')
+        if lock_path is not None and fcntl is None:
+            raise TestRailError('lock_path needs fcntl, which is not '
+                                'available on this platform')
+        self.max_rate = float(rate)
+        self.burst = float(burst or max(1, rate))
+        self.min_rate = float(min_rate or rate / 10.0)
+        self.recovery = recovery
+        self.lock_path = lock_path
+        self._lock = threading.Lock()
+        self._local = {'tokens': self.burst, 'rate': self.max_rate,
+                       'updated': time()}
+
+    @contextmanager
+    def _state(self):
+        with self._lock:
+            if self.lock_path is None:
+                yield self._local
+                return
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                content = os.read(fd, 4096)
+                state = json.loads(content.decode('utf-8')) if content \
+                    else dict(self._local)
+                yield state
+                data = json.dumps(state).encode('utf-8')
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+
+    def _refill(self, state):
+        now = time()
+        elapsed = max(0, now - state['updated'])
+        if self.recovery:
+            state['rate'] = min(self.max_rate, state['rate'] + elapsed *
+                                self.max_rate / self.recovery)
+        state['tokens'] = min(self.burst,
+                              state['tokens'] + elapsed * state['rate'])
+        state['updated'] = now
+
+    def acquire(self):
+        """ Block until a request may be sent
+        """
+        while True:
+            with self._state() as state:
+                self._refill(state)
+                if state['tokens'] >= 1:
+                    state['tokens'] -= 1
+                    return
+                wait = (1 - state['tokens']) / state['rate']
+            sleep(wait)
+
+    def backoff(self):
+        """ Slow down after TestRail reported too many requests
+        """
+        with self._state() as state:
+            self._refill(state)
+            state['rate'] = max(self.min_rate, state['rate'] / 2)
+            state['tokens'] = 0
+
+    @property
+    def rate(self):
+        with self._state() as state:
+            self._refill(state)
+            return state['rate']
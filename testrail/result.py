@@ -1,8 +1,7 @@
 from datetime import datetime, timedelta
 import re
 
-from testrail.base import TestRailBase
-from testrail import api
+from testrail.base import TestRailBase, relation
 from testrail.helper import custom_methods, ContainerIter, TestRailError
 from testrail.status import Status
 from testrail.test import Test
@@ -11,18 +10,20 @@ from testrail.helper import testrail_duration_to_timedelta
 
 
 class Result(TestRailBase):
+    __slots__ = ('_content', '_relations')
+
     def __init__(self, content=None):
         self._content = content or dict()
-        self.api = api.API()
-        self._custom_methods = custom_methods(self._content)
 
     def __getattr__(self, attr):
-        if attr in self._custom_methods:
-            return self._content.get(self._custom_methods[attr])
+        if not attr.startswith('_'):
+            methods = custom_methods(self._content)
+            if attr in methods:
+                return self._content.get(methods[attr])
         raise AttributeError("'{}' object has no attribute '{}'".format(
             self.__class__.__name__, attr))
 
-    @property
+    @relation('assignedto_id')
     def assigned_to(self):
         user_id = self._content.get('assignedto_id')
         return User(self.api.user_with_id(user_id)) if user_id else User()
@@ -47,7 +48,7 @@ class Result(TestRailBase):
             raise TestRailError('input must be a string')
         self._content['comment'] = value
 
-    @property
+    @relation('created_by')
     def created_by(self):
         return User(self.api.user_with_id(self._content.get('created_by')))
 
@@ -96,7 +97,7 @@ class Result(TestRailBase):
     def id(self):
         return self._content.get('id')
 
-    @property
+    @relation('status_id')
     def status(self):
         return Status(self.api.status_with_id(self._content.get('status_id')))
 
@@ -109,7 +110,7 @@ class Result(TestRailBase):
         self.api.status_with_id(status_obj.id)
         self._content['status_id'] = status_obj.id
 
-    @property
+    @relation('test_id')
     def test(self):
         test_id = self._content.get('test_id')
         return Test(self.api.test_with_id(test_id)) if test_id else Test()
@@ -142,11 +143,15 @@ class ResultContainer(ContainerIter):
         super(ResultContainer, self).__init__(results)
         self._results = results
 
+    def _with_status(self, name):
+        self.prefetch('status')
+        return list(filter(lambda r: r.status.name == name, self._results))
+
     def blocked(self):
-        return list(filter(lambda r: r.status.name == "blocked", self._results))
+        return self._with_status("blocked")
 
     def failed(self):
-        return list(filter(lambda r: r.status.name == "failed", self._results))
+        return self._with_status("failed")
 
     def latest(self):
         return sorted(self._results, key=lambda r: r.created_on)[-1]
@@ -155,10 +160,10 @@ class ResultContainer(ContainerIter):
         return sorted(self._results, key=lambda r: r.created_on)[0]
 
     def passed(self):
-        return list(filter(lambda r: r.status.name == "passed", self._results))
+        return self._with_status("passed")
 
     def retest(self):
-        return list(filter(lambda r: r.status.name == "retest", self._results))
+        return self._with_status("retest")
 
     def untested(self):
-        return list(filter(lambda r: r.status.name == "untested", self._results))
+        return self._with_status("untested")
@@ -1,7 +1,6 @@
 from datetime import datetime
 
-from testrail.base import TestRailBase
-from testrail.api import API
+from testrail.base import TestRailBase, relation
 from testrail.helper import ContainerIter, TestRailError
 from testrail.milestone import Milestone
 import testrail.plan
@@ -13,11 +12,12 @@ from testrail.helper import TestRailError
 
 
 class Run(TestRailBase):
+    __slots__ = ('_content', '_relations')
+
     def __init__(self, content=None):
         self._content = content or dict()
-        self.api = API()
 
-    @property
+    @relation('assignedto_id')
     def assigned_to(self):
         return User(self.api.user_with_id(self._content.get('assignedto_id')))
 
@@ -25,11 +25,12 @@ class Run(TestRailBase):
     def blocked_count(self):
         return self._content.get('blocked_count')
 
-    @property
+    @relation('case_ids')
     def cases(self):
         if self._content.get('case_ids'):
-            cases = list(map(self.api.case_with_id, self._content.get('case_ids')))
-            return list(map(Case, cases))
+            return [Case(self.api.case_with_id(
+                case_id, project_id=self.project_id))
+                for case_id in self._content.get('case_ids')]
         else:
             return list()
 
@@ -66,7 +67,7 @@ class Run(TestRailBase):
     def config_ids(self):
         return self._content.get('config_ids')
 
-    @property
+    @relation('created_by')
     def created_by(self):
         return User(self.api.user_with_id(self._content.get('created_by')))
 
@@ -107,7 +108,7 @@ class Run(TestRailBase):
     def is_completed(self):
         return self._content.get('is_completed')
 
-    @property
+    @relation('milestone_id')
     def milestone(self):
         milestone_id = self._content.get('milestone_id')
         if milestone_id is None:
@@ -136,12 +137,13 @@ class Run(TestRailBase):
     def passed_count(self):
         return self._content.get('passed_count')
 
-    @property
+    @relation('plan_id')
     def plan(self):
         return testrail.plan.Plan(
-            self.api.plan_with_id(self._content.get('plan_id')))
+            self.api.plan_with_id(self._content.get('plan_id'),
+                                  project_id=self.project_id))
 
-    @property
+    @relation('project_id')
     def project(self):
         return Project(
             self.api.project_with_id(self._content.get('project_id')))
@@ -161,16 +163,17 @@ class Run(TestRailBase):
     def retest_count(self):
         return self._content.get('retest_count')
 
-    @property
+    @relation('suite_id')
     def suite(self):
-        return Suite(
-            self.api.suite_with_id(self._content.get('suite_id')))
+        return Suite(self.api.suite_with_id(
+            self._content.get('suite_id'), project_id=self.project_id))
 
     @suite.setter
     def suite(self, value):
         if not isinstance(value, Suite):
             raise TestRailError('input must be a Suite')
-        self.api.suite_with_id(value.id)  # verify suite is valid
+        # verify suite is valid
+        self.api.suite_with_id(value.id, project_id=self.project_id)
         self._content['suite_id'] = value.id
 
     @property
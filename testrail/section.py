@@ -36,14 +36,17 @@ class Section(TestRailBase):
 
     @property
     def parent(self):
-        return Section(
-            self.api.section_with_id(self._content.get('parent_id')))
+        return Section(self.api.section_with_id(
+            self._content.get('parent_id'),
+            project_id=self._suite_project_id()))
 
     @parent.setter
     def parent(self, section):
         if not isinstance(section, Section):
             raise TestRailError('input must be a Section')
-        self.api.section_with_id(section.id)  # verify section is valid
+        # verify section is valid
+        self.api.section_with_id(section.id,
+                                 project_id=self._suite_project_id())
         self._content['parent_id'] = section.id
 
     @property
@@ -60,14 +63,22 @@ class Section(TestRailBase):
     def suite(self):
         if self._content.get('suite_id') is None:
             return Suite()
-        return Suite(self.api.suite_with_id(self._content.get('suite_id')))
+        return Suite(self.api.suite_with_id(
+            self._content.get('suite_id'),
+            project_id=self._suite_project_id()))
 
     @suite.setter
     def suite(self, suite_obj):
         if not isinstance(suite_obj, Suite):
             raise TestRailError('input must be a Suite')
-        self.api.suite_with_id(suite_obj.id)  # verify suite is valid
+        # verify suite is valid
+        self.api.suite_with_id(
+            suite_obj.id, project_id=self.api.suite_project_id(suite_obj.id))
         self._content['suite_id'] = suite_obj.id
 
+    def _suite_project_id(self):
+        suite_id = self._content.get('suite_id')
+        return self.api.suite_project_id(suite_id) if suite_id else None
+
     def raw_data(self):
         return self._content
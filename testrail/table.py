@@ -0,0 +1,157 @@
+""" Column-wise view of run results for bulk analysis
+
+    Walking Result objects parses timestamps and durations one property at a
+    time. ResultTable instead reads the raw rows from API.results_by_run
+    once into typed columns and answers counts, percentiles and time buckets
+    on those. NumPy is used when installed; otherwise columns are stdlib
+    arrays and the same methods run in plain Python.
+"""
+from array import array
+from collections import Counter
+from itertools import compress
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from testrail.helper import TestRailError, parse_durations
+
+
+def _percentile(ordered, pct):
+    """ Linear interpolation between closest ranks, as numpy.percentile
+    """
+    if not ordered:
+        return float('nan')
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(math.floor(rank))
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class ResultTable(object):
+    """ Results held as one typed array per field
+
+        Columns are id, test_id, status_id, created_on (epoch seconds),
+        assignedto_id (0 when unassigned) and elapsed (seconds, NaN when not
+        recorded). Methods that narrow the rows return a new ResultTable.
+    """
+    # column name, content key, array typecode
+    columns = (('id', 'id', 'l'),
+               ('test_id', 'test_id', 'l'),
+               ('status_id', 'status_id', 'l'),
+               ('created_on', 'created_on', 'l'),
+               ('assignedto_id', 'assignedto_id', 'l'),
+               ('elapsed', 'elapsed', 'd'))
+
+    _dtypes = {'l': 'int64', 'd': 'float64'}
+
+    def __init__(self, rows=None, use_numpy=None):
+        self._numpy = numpy is not None if use_numpy is None else use_numpy
+        if self._numpy and numpy is None:
+            raise TestRailError('numpy is not installed')
+        rows = list(rows or [])
+        for name, key, typecode in self.columns:
+            if name == 'elapsed':
+                values = [float('nan') if seconds is None else seconds
+                          for seconds in parse_durations(
+                              row.get(key) for row in rows)]
+            else:
+                values = [row.get(key) or 0 for row in rows]
+            setattr(self, name, self._array(typecode, values))
+
+    @classmethod
+    def from_run(cls, api, run_id, use_numpy=None):
+        return cls(api.results_by_run(run_id), use_numpy)
+
+    def _array(self, typecode, values):
+        if self._numpy:
+            return numpy.array(values, dtype=self._dtypes[typecode])
+        return array(typecode, values)
+
+    def _empty(self):
+        return ResultTable(use_numpy=self._numpy)
+
+    def __len__(self):
+        return len(self.id)
+
+    def mask(self, name, values):
+        """ True for rows whose column name holds one of values
+        """
+        column = getattr(self, name)
+        if self._numpy:
+            return numpy.isin(column, list(values))
+        values = set(values)
+        return [value in values for value in column]
+
+    def between(self, name, start=None, end=None):
+        """ True for rows where start <= column name < end
+        """
+        column = getattr(self, name)
+        if self._numpy:
+            mask = numpy.ones(len(column), dtype=bool)
+            if start is not None:
+                mask &= column >= start
+            if end is not None:
+                mask &= column < end
+            return mask
+        return [(start is None or value >= start) and
+                (end is None or value < end) for value in column]
+
+    def select(self, mask):
+        """ New table with the rows where mask is true
+        """
+        table = self._empty()
+        for name, _, typecode in self.columns:
+            column = getattr(self, name)
+            if self._numpy:
+                setattr(table, name, column[numpy.asarray(mask, dtype=bool)])
+            else:
+                setattr(table, name, array(typecode, compress(column, mask)))
+        return table
+
+    def where(self, **conditions):
+        """ Rows matching every condition, e.g. where(status_id=[4, 5]).
+            A single value is the same as a one item list.
+        """
+        table = self
+        for name, values in conditions.items():
+            if not isinstance(values, (list, tuple, set, frozenset)):
+                values = [values]
+            table = table.select(table.mask(name, values))
+        return table
+
+    def status_counts(self):
+        """ {status_id: number of results}
+        """
+        if self._numpy:
+            ids, counts = numpy.unique(self.status_id, return_counts=True)
+            return dict(zip(ids.tolist(), counts.tolist()))
+        return dict(Counter(self.status_id))
+
+    def elapsed_percentiles(self, percentiles=(50, 90, 99)):
+        """ {percentile: elapsed seconds} over results that recorded time
+        """
+        if self._numpy:
+            elapsed = self.elapsed[~numpy.isnan(self.elapsed)]
+            if not len(elapsed):
+                return dict((pct, float('nan')) for pct in percentiles)
+            values = numpy.percentile(elapsed, list(percentiles))
+            return dict(zip(percentiles, values.tolist()))
+        ordered = sorted(x for x in self.elapsed if not math.isnan(x))
+        return dict((pct, _percentile(ordered, pct)) for pct in percentiles)
+
+    def buckets(self, width, name='created_on'):
+        """ [(bucket start, number of results)] in order, grouping column
+            name into windows of width (seconds for created_on)
+        """
+        if width <= 0:
+            raise TestRailError('bucket width must be positive')
+        column = getattr(self, name)
+        if self._numpy:
+            starts = (column // width) * width
+            starts, counts = numpy.unique(starts, return_counts=True)
+            return list(zip(starts.tolist(), counts.tolist()))
+        counts = Counter((value // width) * width for value in column)
+        return sorted(counts.items())
@@ -1,5 +1,4 @@
-from testrail.base import TestRailBase
-from testrail import api
+from testrail.base import TestRailBase, relation
 from testrail.case import Case
 from testrail.casetype import CaseType
 from testrail.milestone import Milestone
@@ -11,20 +10,23 @@ from testrail.helper import testrail_duration_to_timedelta
 
 
 class Test(TestRailBase):
+    __slots__ = ('_content', '_relations')
+
     def __init__(self, content=None):
         self._content = content or dict()
-        self.api = api.API()
 
     def __str__(self):
         return self.title
 
-    @property
+    @relation('assignedto_id')
     def assigned_to(self):
         return User(self.api.user_with_id(self._content.get('assignedto_id')))
 
-    @property
+    @relation('case_id', 'run_id')
     def case(self):
-        return Case(self.api.case_with_id(self._content.get('case_id'), suite_id=self.run.suite.id))
+        return Case(self.api.case_with_id(
+            self._content.get('case_id'), suite_id=self.run.suite.id,
+            project_id=self.run.project_id))
 
     @property
     def estimate(self):
@@ -44,7 +46,7 @@ class Test(TestRailBase):
     def id(self):
         return self._content.get('id')
 
-    @property
+    @relation('project_id', 'milestone_id')
     def milestone(self):
         project_id = self._content.get('project_id')
         milestone_id = self._content.get('milestone_id')
@@ -56,11 +58,13 @@ class Test(TestRailBase):
     def refs(self):
         return self._content.get('refs')
 
-    @property
+    @relation('run_id')
     def run(self):
-        return Run(self.api.run_with_id(self._content.get('run_id')))
+        run_id = self._content.get('run_id')
+        return Run(self.api.run_with_id(
+            run_id, project_id=self.api.run_project_id(run_id)))
 
-    @property
+    @relation('status_id')
     def status(self):
         return Status(self.api.status_with_id(self._content.get('status_id')))
 
@@ -0,0 +1,75 @@
+""" Concurrent prefetch of a project's reference collections
+"""
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+
+from testrail.helper import TestRailError
+
+
+def _sections(api, project_id):
+    # Projects with several suites only list sections per suite
+    return [section for suite in api.suites(project_id)
+            for section in api.sections(project_id, suite['id'])]
+
+
+# name: function(api, project_id) loading it into the API's cache
+loaders = {
+    'users': lambda api, project_id: api.users(),
+    'statuses': lambda api, project_id: api.statuses(),
+    'priorities': lambda api, project_id: api.priorities(),
+    'case_types': lambda api, project_id: api.case_types(),
+    'suites': lambda api, project_id: api.suites(project_id),
+    'milestones': lambda api, project_id: api.milestones(project_id),
+    'sections': _sections,
+    'configs': lambda api, project_id: api.configs(project_id),
+}
+
+
+class WarmReport(object):
+    """ Outcome of TestRail.warm()
+
+        loaded maps each collection that was fetched to its number of
+        objects, failed each one that wasn't to the exception raised (a
+        TestRailError, or e.g. a requests ConnectionError), and
+        timings every collection to the seconds it took. seconds is the
+        wall time of the whole warm-up.
+    """
+    def __init__(self):
+        self.loaded = dict()
+        self.failed = dict()
+        self.timings = dict()
+        self.seconds = 0.0
+
+    def __repr__(self):
+        return '<WarmReport loaded=%s failed=%s seconds=%.3f>' % (
+            sorted(self.loaded), sorted(self.failed), self.seconds)
+
+
+def warm(api, project_id, include=None, workers=None):
+    """ Load the include collections (all of loaders by default) for
+        project_id concurrently and return a WarmReport
+    """
+    include = sorted(loaders) if include is None else list(include)
+    unknown = set(include) - set(loaders)
+    if unknown:
+        raise TestRailError('Cannot warm %s; choose from %s' % (
+            ', '.join(sorted(unknown)), ', '.join(sorted(loaders))))
+    report = WarmReport()
+    if not include:
+        return report
+
+    def load(name):
+        start = time()
+        try:
+            report.loaded[name] = len(loaders[name](api, project_id))
+        except Exception as e:
+            # One collection failing must not abort the others
+            report.failed[name] = e
+        report.timings[name] = time() - start
+
+    start = time()
+    with ThreadPoolExecutor(workers or len(include)) as pool:
+        for future in [pool.submit(load, name) for name in include]:
+            future.result()
+    report.seconds = time() - start
+    return report
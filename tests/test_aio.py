@@ -0,0 +1,99 @@
+import sys
+import threading
+import time
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+if sys.version_info < (3, 5):
+    raise unittest.SkipTest('asyncio support needs Python 3.5+')
+
+import asyncio
+
+import mock
+import util
+
+from testrail.aio import AsyncAPI, AsyncTestRail
+from testrail.api import API
+from testrail.run import RunContainer
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestAsyncAPI(unittest.TestCase):
+    def setUp(self):
+        self.client = AsyncAPI(concurrency=2)
+
+    def tearDown(self):
+        self.client.close()
+        util.reset_shared_state(API)
+
+    @mock.patch('testrail.api.API._get')
+    def test_call_mirrors_api(self, mock_get):
+        mock_get.return_value = [{'id': 1, 'name': 'passed'}]
+        statuses = run(self.client.statuses())
+        self.assertEqual(statuses, [{'id': 1, 'name': 'passed'}])
+        self.assertEqual(run(self.client.status_with_id(1))['name'],
+                         'passed')
+        mock_get.assert_called_once_with('get_statuses')
+
+    @mock.patch('testrail.api.API._get')
+    def test_gather_limits_concurrency(self, mock_get):
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def get(uri):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return [{'id': int(uri.split('/')[1])}]
+        mock_get.side_effect = get
+        suites = run(self.client.gather(
+            'suites', [(1, ), (2, ), (3, ), (4, )]))
+        self.assertEqual(suites, [[{'id': i}] for i in (1, 2, 3, 4)])
+        self.assertEqual(active[1], 2)
+
+    def test_iter_methods_not_wrapped(self):
+        with self.assertRaises(AttributeError):
+            self.client.iter_tests
+
+
+class TestAsyncTestRail(unittest.TestCase):
+    def setUp(self):
+        self.client = AsyncTestRail(1)
+
+    def tearDown(self):
+        self.client.close()
+        util.reset_shared_state(API)
+
+    @mock.patch('testrail.api.API._paginate_request')
+    def test_gather_runs_across_projects(self, mock_paginate):
+        mock_paginate.side_effect = lambda endpoint, params, field: [
+            {'id': int(endpoint.split('/')[1]), 'name': endpoint}]
+        runs = run(self.client.gather('runs', [5, 6]))
+        self.assertTrue(all(isinstance(r, RunContainer) for r in runs))
+        self.assertEqual([r[0].id for r in runs], [5, 6])
+        self.assertEqual(self.client._wrapped.api._project_id, 1)
+
+    @mock.patch('testrail.api.API._paginate_request')
+    def test_gather_leaves_default_project(self, mock_paginate):
+        mock_paginate.return_value = []
+        API().set_project_id(3)
+        run(self.client.gather('runs', [5, 6]))
+        # API instances without a project of their own still follow 3
+        self.assertEqual(API()._project_id, 3)
+        clients = dict(self.client._clients)
+        run(self.client.gather('runs', [6, 5]))
+        self.assertEqual(self.client._clients, clients)
+        self.assertEqual(self.client._client(5).api._project_id, 5)
@@ -1,11 +1,17 @@
 import ast
 import copy
 from datetime import datetime, timedelta
+import json
 import mock
 import os
 import shutil
+import threading
+import time
 import util
 
+import requests
+from requests.adapters import BaseAdapter
+
 try:
     import unittest2 as unittest
 except ImportError:
@@ -29,6 +35,82 @@ class TestBase(unittest.TestCase):
         self.assertEqual(self.client._project_id, 20)
 
 
+class TestThreadSafety(unittest.TestCase):
+    def setUp(self):
+        self.client = API()
+
+    def tearDown(self):
+        util.reset_shared_state(self.client)
+
+    def run_threads(self, target, count=8):
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def test_project_context_per_instance(self):
+        first, second = API(), API()
+        first.set_project_id(1)
+        second.set_project_id(2)
+        self.assertEqual(first._project_id, 1)
+        self.assertEqual(second._project_id, 2)
+        # Instances without a project of their own use the last one set
+        self.assertEqual(API()._project_id, 2)
+
+    @mock.patch('testrail.api.API._get')
+    def test_project_context_in_threads(self, mock_get):
+        mock_get.side_effect = lambda uri, params=None: [
+            {'id': int(uri.split('/')[1]), 'name': uri}]
+        seen = dict()
+
+        def worker(project_id):
+            api = API()
+            api.set_project_id(project_id)
+            for _ in range(50):
+                time.sleep(0)
+                seen.setdefault(project_id, set()).add(
+                    api.suite_with_id(project_id)['name'])
+
+        threads = [threading.Thread(target=worker, args=(p, ))
+                   for p in range(1, 9)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for project_id in range(1, 9):
+            self.assertEqual(seen[project_id],
+                             set(['get_suites/%s' % project_id]))
+
+    @mock.patch('testrail.api.API._get')
+    def test_single_flight_refresh(self, mock_get):
+        def slow_get(uri, params=None):
+            time.sleep(0.05)
+            return [{'id': 1, 'name': 'Passed'}]
+        mock_get.side_effect = slow_get
+        statuses = list()
+        self.run_threads(lambda: statuses.append(self.client.statuses()))
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(len(statuses), 8)
+        self.assertTrue(all(s is statuses[0] for s in statuses))
+
+    def test_concurrent_cache_updates(self):
+        self.client._runs[1]['ts'] = datetime.now()
+        self.client._runs[1]['value'] = list()
+        ids = iter(range(400))
+        add_run = mock.Mock(side_effect=lambda *args: {
+            'id': next(ids), 'project_id': 1, 'name': 'run'})
+
+        with mock.patch('testrail.api.API._post', add_run):
+            def worker():
+                for _ in range(50):
+                    self.client.add_run({'project_id': 1})
+            self.run_threads(worker)
+        runs = self.client._runs[1]['value']
+        self.assertEqual(sorted(r['id'] for r in runs), list(range(400)))
+        self.assertEqual(len(self.client.runs_with_name('run', 1)), 400)
+
+
 class TestConfig(unittest.TestCase):
     def setUp(self):
         home = os.path.expanduser('~')
@@ -108,6 +190,22 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config['email'], email)
         self.assertEqual(client.verify_ssl, True)
 
+    def test_cache_settings(self):
+        self.addCleanup(API.set_ttl, 'statuses', None)
+        self.addCleanup(API.set_cache_limit, 'tests', None)
+        self.addCleanup(setattr, API, '_conf_cache_applied', True)
+        API._conf_cache_applied = False
+        with open(self.config_path, 'a') as f:
+            f.write("    cache_ttl:\n        statuses: 3600\n"
+                    "    cache_limit:\n        tests: 50000\n")
+        API()
+        self.assertEqual(API._ttls['_statuses'], 3600)
+        self.assertEqual(API._cache_limits['_tests'], 50000)
+        # Later constructions keep settings made in the meantime
+        API.set_stale_while_revalidate('statuses', 3600, 7200)
+        API()
+        self.assertEqual(API._ttls['_statuses'], 7200)
+
     def test_config_no_email(self):
         os.remove(self.config_path)
         shutil.copyfile('%s/testrail.conf-noemail' % self.test_dir,
@@ -148,7 +246,7 @@ class TestHTTPMethod(unittest.TestCase):
     def setUp(self):
         self.client = API()
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_ok(self, mock_get):
         mock_response = mock.Mock()
         return_value = {
@@ -178,7 +276,7 @@ class TestHTTPMethod(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_bad_no_params(self, mock_get):
         mock_response = mock.Mock()
         expected_response = {
@@ -210,6 +308,471 @@ class TestHTTPMethod(unittest.TestCase):
         self.assertEqual(expected_response, ast.literal_eval(str(e.exception)))
 
 
+class MockAdapter(BaseAdapter):
+    """ Transport adapter that answers every request with a canned body
+    """
+    def __init__(self, body):
+        super(MockAdapter, self).__init__()
+        self.body = body
+        self.requests = list()
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = json.dumps(self.body).encode('utf-8')
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+    def close(self):
+        pass
+
+
+class TestSession(unittest.TestCase):
+    def setUp(self):
+        self.client = API()
+
+    def tearDown(self):
+        API.configure_session()
+
+    def test_session_reused(self):
+        self.assertIs(self.client._http(), API()._http())
+
+    def test_session_pool_size(self):
+        API.configure_session(pool_size=32)
+        adapter = self.client._http().get_adapter('https://<server>')
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_session_no_keep_alive(self):
+        API.configure_session(keep_alive=False)
+        self.assertEqual(self.client._http().headers['Connection'], 'close')
+
+    def test_session_injected_adapter(self):
+        adapter = MockAdapter({'id': 1})
+        API.configure_session(adapter=adapter)
+        self.assertEqual(self.client._get('get_project/1'), {'id': 1})
+        self.assertEqual(self.client._post('close_run/1'), {'id': 1})
+        self.assertEqual(len(adapter.requests), 2)
+        self.assertEqual(adapter.requests[1].method, 'POST')
+
+    def test_session_created_once_across_threads(self):
+        API.configure_session()
+        sessions = list()
+        threads = [threading.Thread(target=lambda: sessions.append(API._http()))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(set(map(id, sessions))), 1)
+
+
+class TestPaginate(unittest.TestCase):
+    def setUp(self):
+        self.client = API()
+        self.items = [{'id': i} for i in range(1, 1101)]
+
+    def tearDown(self):
+        self.client.set_page_workers(1)
+        API._retry_after = 0
+
+    def mock_page(self, end_point, params=None):
+        offset, limit = params['offset'], params['limit']
+        page = self.items[offset:offset + limit]
+        more = offset + limit < len(self.items)
+        return {'offset': offset, 'limit': limit, 'size': len(page),
+                '_links': {'next': '/next' if more else None, 'prev': None},
+                'cases': page}
+
+    @mock.patch('testrail.api.API._get')
+    def test_paginate_serial(self, mock_get):
+        mock_get.side_effect = self.mock_page
+        values = self.client._paginate_request('get_cases/1', {}, 'cases')
+        self.assertEqual(values, self.items)
+        # 1100 items in pages of 250 is 5 requests, no trailing empty page
+        self.assertEqual(mock_get.call_count, 5)
+
+    @mock.patch('testrail.api.API._get')
+    def test_paginate_single_page(self, mock_get):
+        self.items = self.items[:10]
+        mock_get.side_effect = self.mock_page
+        self.client.set_page_workers(4)
+        values = self.client._paginate_request('get_cases/1', None, 'cases')
+        self.assertEqual(values, self.items)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @mock.patch('testrail.api.API._get')
+    def test_paginate_parallel(self, mock_get):
+        mock_get.side_effect = self.mock_page
+        self.client.set_page_workers(3)
+        params = {'suite_id': 2}
+        values = self.client._paginate_request('get_cases/1', params, 'cases')
+        self.assertEqual(values, self.items)
+        self.assertEqual(params, {'suite_id': 2})
+        offsets = sorted(c[1]['params']['offset'] for c in mock_get.call_args_list)
+        self.assertEqual(offsets, [0, 250, 500, 750, 1000, 1250, 1500])
+        self.assertTrue(all(c[1]['params']['suite_id'] == 2
+                            for c in mock_get.call_args_list))
+
+    @mock.patch('testrail.api.API._get')
+    def test_paginate_no_links(self, mock_get):
+        def page(end_point, params=None):
+            resp = self.mock_page(end_point, params)
+            del resp['_links']
+            return resp
+        mock_get.side_effect = page
+        self.client.set_page_workers(2)
+        values = self.client._paginate_request('get_cases/1', {}, 'cases')
+        self.assertEqual(values, self.items)
+
+    @mock.patch('testrail.api.API._get')
+    def test_iter_pages_is_lazy(self, mock_get):
+        mock_get.side_effect = self.mock_page
+        rows = self.client._iter_pages('get_cases/1', {}, 'cases')
+        self.assertEqual(mock_get.call_count, 0)
+        first = [next(rows) for _ in range(250)]
+        self.assertEqual(first, self.items[:250])
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(list(rows), self.items[250:])
+        self.assertEqual(mock_get.call_count, 5)
+
+    @mock.patch('testrail.api.API._get')
+    def test_iter_results_by_run_uncached(self, mock_get):
+        def page(end_point, params=None):
+            resp = self.mock_page(end_point, params)
+            resp['results'] = resp.pop('cases')
+            return resp
+        mock_get.side_effect = page
+        rows = list(self.client.iter_results_by_run(7))
+        self.assertEqual(rows, self.items)
+        self.assertEqual(mock_get.call_args[0][0], 'get_results_for_run/7')
+        self.assertFalse(self.client._results[7]['ts'])
+
+    @mock.patch('testrail.api.API._get')
+    def test_iter_tests_cached(self, mock_get):
+        self.client._tests[7]['ts'] = datetime.now()
+        self.client._tests[7]['value'] = self.items[:3]
+        self.assertEqual(list(self.client.iter_tests(7)), self.items[:3])
+        self.assertEqual(mock_get.call_count, 0)
+        util.reset_shared_state(self.client)
+
+    def test_set_page_workers_invalid(self):
+        with self.assertRaises(TestRailError):
+            self.client.set_page_workers(0)
+
+    def test_set_page_workers_shared(self):
+        API.set_page_workers(3)
+        self.assertEqual(API._page_workers, 3)
+        self.assertEqual(API()._page_workers, 3)
+
+    @mock.patch('testrail.api.sleep')
+    def test_retry_after_shared(self, mock_sleep):
+        resp = mock.Mock(status_code=429, headers={'Retry-After': '5'})
+        with self.assertRaises(TestRailError):
+            API._raise_on_429_or_503_status(resp)
+        self.assertGreater(API._retry_after, 0)
+        API._wait_for_retry_after()
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertGreater(mock_sleep.call_args[0][0], 4)
+
+
+class TestIndex(unittest.TestCase):
+    def setUp(self):
+        self.cache = {'ts': datetime.now(),
+                      'value': [{'id': 1, 'name': 'a'},
+                                {'id': 2, 'name': 'b'},
+                                {'id': 3, 'name': 'a'}]}
+
+    def test_find_first_match(self):
+        self.assertEqual(API._find(self.cache, 'name', 'a')['id'], 1)
+        self.assertEqual(API._find(self.cache, 'id', 2)['name'], 'b')
+
+    def test_find_missing(self):
+        with self.assertRaises(IndexError):
+            API._find(self.cache, 'id', 4)
+
+    def test_index_built_once(self):
+        API._find(self.cache, 'id', 1)
+        index = self.cache['index']['id']
+        API._find(self.cache, 'id', 3)
+        self.assertIs(self.cache['index']['id'], index)
+
+    def test_index_rebuilt_on_refresh(self):
+        API._find(self.cache, 'id', 1)
+        self.cache['value'] = [{'id': 4, 'name': 'd'}]
+        self.assertEqual(API._find(self.cache, 'id', 4)['name'], 'd')
+        with self.assertRaises(IndexError):
+            API._find(self.cache, 'id', 1)
+
+    def test_named_ignores_case(self):
+        self.cache['value'][1]['name'] = 'Build B'
+        self.assertEqual([o['id'] for o in API._named(self.cache, 'A')],
+                         [1, 3])
+        self.assertEqual(API._named(self.cache, 'build b'),
+                         [self.cache['value'][1]])
+        self.assertEqual(API._named(self.cache, 'c'), [])
+        self.assertIs(API._named(self.cache, 'a'),
+                      API._named(self.cache, 'A'))
+
+    @mock.patch('testrail.api.API._get')
+    def test_runs_with_name_follows_updates(self, mock_get):
+        client = API()
+        self.addCleanup(util.reset_shared_state, client)
+        mock_get.return_value = {
+            'size': 1, '_links': {'next': None},
+            'runs': [{'id': 1, 'project_id': 1, 'name': 'Nightly'}]}
+        self.assertEqual(len(client.runs_with_name('nightly', 1)), 1)
+        with mock.patch('testrail.api.API._post') as mock_post:
+            mock_post.return_value = {'id': 2, 'project_id': 1,
+                                      'name': 'NIGHTLY'}
+            client.add_run({'project_id': 1, 'name': 'NIGHTLY'})
+        # Newest first, as a fresh get_runs would list them
+        self.assertEqual([r['id'] for r in client.runs_with_name('Nightly', 1)],
+                         [2, 1])
+        self.assertEqual([r['id'] for r in client.runs(1)], [2, 1])
+        self.assertEqual(mock_get.call_count, 1)
+
+
+class TestStaleWhileRevalidate(unittest.TestCase):
+    def setUp(self):
+        self.client = API()
+        API.set_stale_while_revalidate('statuses', 10, 3600)
+        self.stale = [{'id': 1, 'name': 'Passed'}]
+        self.fresh = [{'id': 1, 'name': 'Passed'}, {'id': 2, 'name': 'Blocked'}]
+
+    def tearDown(self):
+        API.set_stale_while_revalidate('statuses', None, None)
+        util.reset_shared_state(self.client)
+
+    def cache_statuses(self, age):
+        cache = self.client._statuses
+        cache['value'] = self.stale
+        cache['ts'] = datetime.now() - timedelta(seconds=age)
+
+    def wait_for(self, condition):
+        for _ in range(100):
+            if condition():
+                return
+            time.sleep(0.01)
+        self.fail('timed out')
+
+    @mock.patch('testrail.api.API._get')
+    def test_fresh_not_refreshed(self, mock_get):
+        self.cache_statuses(5)
+        self.assertIs(self.client.statuses(), self.stale)
+        self.assertEqual(mock_get.call_count, 0)
+
+    @mock.patch('testrail.api.API._get')
+    def test_stale_served_while_refreshing(self, mock_get):
+        release = threading.Event()
+
+        def blocked_get(uri, params=None):
+            release.wait(5)
+            return self.fresh
+        mock_get.side_effect = blocked_get
+        self.cache_statuses(60)
+
+        self.assertIs(self.client.statuses(), self.stale)
+        self.assertIs(self.client.statuses(), self.stale)
+        release.set()
+        self.wait_for(lambda: self.client.statuses() is self.fresh)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.client.status_with_id(2)['name'], 'Blocked')
+
+    @mock.patch('testrail.api.API._get')
+    def test_failed_background_refresh_keeps_stale(self, mock_get):
+        mock_get.side_effect = TestRailError('unavailable')
+        self.cache_statuses(60)
+        self.assertIs(self.client.statuses(), self.stale)
+        self.wait_for(lambda: not self.client._statuses['revalidating'])
+        self.assertIs(self.client.statuses(), self.stale)
+
+    @mock.patch('testrail.api.API._get')
+    def test_hard_ttl_blocks(self, mock_get):
+        mock_get.return_value = self.fresh
+        self.cache_statuses(3601)
+        self.assertIs(self.client.statuses(), self.fresh)
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(TestRailError):
+            API.set_stale_while_revalidate('statuses', 60, 30)
+        with self.assertRaises(TestRailError):
+            API.set_stale_while_revalidate('nothing', 10, 60)
+
+
+class TestCacheSettings(unittest.TestCase):
+    def setUp(self):
+        self.client = API()
+
+    def tearDown(self):
+        for collection in ('statuses', 'users'):
+            API.set_ttl(collection, None)
+        API.set_cache_limit('tests', None)
+        util.reset_shared_state(self.client)
+
+    def page(self, run_id):
+        return {'size': 2, '_links': {'next': None},
+                'tests': [{'id': run_id * 10}, {'id': run_id * 10 + 1}]}
+
+    @mock.patch('testrail.api.API._get')
+    def test_collection_ttl(self, mock_get):
+        mock_get.return_value = []
+        API.set_ttl('statuses', 3600)
+        for name in ('_statuses', '_users'):
+            cache = getattr(self.client, name)
+            cache['value'] = [{'id': 1}]
+            cache['ts'] = datetime.now() - timedelta(seconds=60)
+        self.client.statuses()
+        self.assertEqual(mock_get.call_count, 0)
+        self.client.users()
+        self.assertEqual(mock_get.call_count, 1)
+
+    @mock.patch('testrail.api.API._get')
+    def test_lru_eviction(self, mock_get):
+        mock_get.side_effect = lambda uri, params=None: self.page(
+            int(uri.split('/')[1]))
+        API.set_cache_limit('tests', 5)
+        for run_id in (1, 2, 3):
+            self.client.tests(run_id)
+        self.assertEqual(sorted(self.client._tests), [2, 3])
+        self.client.tests(2)
+        self.client.tests(4)
+        self.assertEqual(sorted(self.client._tests), [2, 4])
+        self.assertEqual(mock_get.call_count, 4)
+        # An evicted run is simply fetched again
+        self.assertEqual(len(self.client.tests(1)), 2)
+        self.assertEqual(mock_get.call_count, 5)
+
+    @mock.patch('testrail.api.API._post')
+    @mock.patch('testrail.api.API._get')
+    def test_add_result_after_eviction(self, mock_get, mock_post):
+        mock_get.side_effect = lambda uri, params=None: self.page(
+            int(uri.split('/')[1]))
+        mock_post.return_value = {'id': 7, 'test_id': 10}
+        API.set_cache_limit('tests', 5)
+        for run_id in (1, 2, 3):
+            self.client.tests(run_id)
+        self.assertNotIn(1, self.client._tests)
+        result = self.client.add_result({'test_id': 10, 'status_id': 1})
+        self.assertEqual(result, {'id': 7, 'test_id': 10})
+        # Still found through the run's cached results
+        self.client._results[1] = {'value': [{'id': 3, 'test_id': 10}],
+                                   'ts': datetime.now()}
+        self.client.add_result({'test_id': 10, 'status_id': 1})
+        self.assertIsNone(self.client._results[1]['ts'])
+
+    @mock.patch('testrail.api.API._post')
+    def test_writes_create_no_slots(self, mock_post):
+        API.set_cache_limit('test_results', 10)
+        self.addCleanup(API.set_cache_limit, 'test_results', None)
+        for test_id in range(50):
+            mock_post.return_value = {'id': test_id, 'test_id': test_id}
+            self.client.add_result({'test_id': test_id, 'status_id': 1})
+        self.assertEqual(len(self.client._test_results), 0)
+        self.client.add_results([{'test_id': 1, 'status_id': 1}], 7)
+        self.assertNotIn(7, self.client._tests)
+        self.assertNotIn(7, self.client._results)
+
+    def test_constructor_settings(self):
+        API(cache_ttl={'users': '120'}, cache_limit={'tests': 10})
+        self.assertEqual(API._ttls['_users'], 120)
+        self.assertEqual(API._cache_limits['_tests'], 10)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(TestRailError):
+            API.set_cache_limit('statuses', 10)
+        with self.assertRaises(TestRailError):
+            API.set_cache_limit('tests', 0)
+        with self.assertRaises(TestRailError):
+            API.configure_cache(ttl={'users': 'soon'})
+        API.set_stale_while_revalidate('users', 10, 60)
+        with self.assertRaises(TestRailError):
+            API.set_ttl('users', 5)
+
+
+class TestDeltaRefresh(unittest.TestCase):
+    def setUp(self):
+        self.client = API()
+        self.client.set_project_id(1)
+        self.cases = [{'id': 1, 'title': 'one', 'updated_on': 100},
+                      {'id': 2, 'title': 'two', 'updated_on': 200}]
+
+    def tearDown(self):
+        util.reset_shared_state(self.client)
+
+    def page(self, rows):
+        return {'size': len(rows), '_links': {'next': None}, 'cases': rows}
+
+    @mock.patch('testrail.api.API._get')
+    def test_delta_merges_changes(self, mock_get):
+        changed = {'id': 2, 'title': 'two v2', 'updated_on': 300}
+        added = {'id': 3, 'title': 'three', 'updated_on': 300}
+        mock_get.side_effect = [self.page(self.cases),
+                                self.page([changed, added])]
+        self.assertEqual(len(self.client.cases(suite_id=5)), 2)
+        self.assertEqual(self.client.case_with_id(2, 5)['title'], 'two')
+        self.client._cases[1][5]['ts'] = None
+
+        cases = self.client.cases(suite_id=5)
+
+        params = mock_get.call_args[1]['params']
+        self.assertEqual(params['updated_after'], 199)
+        self.assertEqual(params['suite_id'], 5)
+        self.assertEqual([c['id'] for c in cases], [1, 2, 3])
+        self.assertEqual(self.client.case_with_id(2, 5), changed)
+        self.assertEqual(self.client.case_with_id(3, 5), added)
+        self.assertEqual(self.client._cases[1][5]['since'], 300)
+
+    @mock.patch('testrail.api.API._get')
+    def test_full_resync_drops_deleted(self, mock_get):
+        mock_get.side_effect = [self.page(self.cases),
+                                self.page(self.cases[:1])]
+        self.client.cases(suite_id=5)
+        cache = self.client._cases[1][5]
+        cache['ts'] = None
+        cache['synced'] = datetime.now() - timedelta(
+            seconds=API._full_sync_interval + 1)
+
+        cases = self.client.cases(suite_id=5)
+
+        self.assertNotIn('updated_after', mock_get.call_args[1]['params'])
+        self.assertEqual(cases, self.cases[:1])
+        with self.assertRaises(TestRailError):
+            self.client.case_with_id(2, 5)
+
+    @mock.patch('testrail.api.API._get')
+    def test_results_delta_uses_created_after(self, mock_get):
+        # TestRail lists results newest first
+        results = [{'id': 3, 'test_id': 1, 'created_on': 50},
+                   {'id': 2, 'test_id': 1, 'created_on': 40}]
+        new = [{'id': 5, 'test_id': 1, 'created_on': 70},
+               {'id': 4, 'test_id': 1, 'created_on': 60}]
+        mock_get.side_effect = [
+            {'size': 2, '_links': {'next': None}, 'results': results},
+            {'size': 2, '_links': {'next': None}, 'results': new}]
+        self.client.results_by_run(9)
+        self.client._results[9]['ts'] = None
+        self.assertEqual(self.client.results_by_run(9), new + results)
+        self.assertEqual(mock_get.call_args[1]['params']['created_after'], 49)
+
+    @mock.patch('testrail.api.API._get')
+    def test_delta_keeps_listing_order(self, mock_get):
+        # Cases come in display order, not by id
+        cases = [self.cases[1], self.cases[0]]
+        changed = {'id': 1, 'title': 'one v2', 'updated_on': 300}
+        added = {'id': 0, 'title': 'zero', 'updated_on': 300}
+        mock_get.side_effect = [self.page(cases), self.page([added, changed])]
+        self.client.cases(suite_id=5)
+        self.client._cases[1][5]['ts'] = None
+
+        cases = self.client.cases(suite_id=5)
+
+        self.assertEqual([c['id'] for c in cases], [2, 1, 0])
+        self.assertEqual(cases[1], changed)
+
+
 class TestUser(unittest.TestCase):
     def setUp(self):
         self.client = API()
@@ -233,7 +796,7 @@ class TestUser(unittest.TestCase):
     def tearDown(self):
         util.reset_shared_state(self.client)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_users(self, mock_get):
         mock_response = mock.Mock()
         expected_response = self.users
@@ -257,7 +820,7 @@ class TestUser(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_users_cache_timeout(self, mock_get):
         self.client = API()
         mock_response = mock.Mock()
@@ -281,7 +844,7 @@ class TestUser(unittest.TestCase):
         self.assertEqual(2, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_user_with_id(self, mock_get):
         mock_response = mock.Mock()
         expected_response = next(filter(
@@ -302,7 +865,7 @@ class TestUser(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_user_invalid_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_user_data
@@ -313,7 +876,7 @@ class TestUser(unittest.TestCase):
         err_msg = "User ID '300' was not found"
         self.assertEqual(err_msg, str(e.exception))
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_user_with_email(self, mock_get):
         mock_response = mock.Mock()
         expected_response = next(filter(
@@ -336,7 +899,7 @@ class TestUser(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_user_invalid_email(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_user_data
@@ -377,7 +940,7 @@ class TestProject(unittest.TestCase):
     def tearDown(self):
         util.reset_shared_state(self.client)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_projects(self, mock_get):
         mock_response = mock.Mock()
         expected_response = self.projects
@@ -401,7 +964,7 @@ class TestProject(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_projects_cache_timeout(self, mock_get):
         mock_response = mock.Mock()
         expected_response = self.projects
@@ -425,7 +988,7 @@ class TestProject(unittest.TestCase):
         self.assertEqual(2, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_project_id(self, mock_get):
         mock_response = mock.Mock()
         expected_response = next(filter(
@@ -446,7 +1009,7 @@ class TestProject(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_project_invalid_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_project_data
@@ -500,7 +1063,7 @@ class TestSuite(unittest.TestCase):
     def tearDown(self):
         util.reset_shared_state(self.client)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suites(self, mock_get):
         mock_response = mock.Mock()
         expected_response = self.suites_1
@@ -520,7 +1083,7 @@ class TestSuite(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suites_with_project(self, mock_get):
         mock_response = mock.Mock()
         expected_response = self.suites_2
@@ -540,7 +1103,7 @@ class TestSuite(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suites_invalid_project(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = {}
@@ -549,7 +1112,7 @@ class TestSuite(unittest.TestCase):
         with self.assertRaises(TestRailError):
             self.client.suites(20)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suites_cache_timeout(self, mock_get):
         mock_response = mock.Mock()
         expected_response = self.suites_1
@@ -573,7 +1136,7 @@ class TestSuite(unittest.TestCase):
         self.assertEqual(2, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suites_different_projects_no_cache_hit(self, mock_get):
         mock_response = mock.Mock()
         expected_response = self.suites_1
@@ -603,7 +1166,7 @@ class TestSuite(unittest.TestCase):
         self.assertEqual(2, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suite_with_id(self, mock_get):
         mock_response = mock.Mock()
         expected_response = next(filter(
@@ -624,7 +1187,7 @@ class TestSuite(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suites_invalid_suite_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = {}
@@ -722,7 +1285,7 @@ class TestPlan(unittest.TestCase):
     def tearDown(self):
         util.reset_shared_state(self.client)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_plans(self, mock_get):
         mock_response = mock.Mock()
         expected_response = self.plans_1
@@ -742,7 +1305,7 @@ class TestPlan(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_plans_with_project(self, mock_get):
         mock_response = mock.Mock()
         expected_response = self.plans_2
@@ -762,7 +1325,7 @@ class TestPlan(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_plans_invalid_project(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = {}
@@ -771,7 +1334,7 @@ class TestPlan(unittest.TestCase):
         with self.assertRaises(TestRailError):
             self.client.plans(20)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_plan_with_id(self, mock_get):
         mock_response = mock.Mock()
         expected_response = next(filter(
@@ -792,7 +1355,7 @@ class TestPlan(unittest.TestCase):
         self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual(expected_response, actual_response)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_plans_invalid_suite_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = {}
@@ -805,3 +1368,159 @@ class TestPlan(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestFilteredQueries(unittest.TestCase):
+    def setUp(self):
+        self.client = API()
+        self.client.set_project_id(1)
+        self.runs = [{'id': 1, 'project_id': 1, 'is_completed': False},
+                     {'id': 2, 'project_id': 1, 'is_completed': True}]
+
+    def tearDown(self):
+        util.reset_shared_state(self.client)
+
+    def page(self, rows):
+        return {'size': len(rows), '_links': {'next': None}, 'runs': rows}
+
+    def test_filter_params(self):
+        self.assertEqual(
+            API._filter_params({'is_completed': True, 'created_by': [3, 1],
+                                'milestone_id': 4, 'suite_id': None,
+                                'created_after': datetime(2020, 1, 1)}),
+            {'is_completed': '1', 'created_by': '1,3', 'milestone_id': '4',
+              'created_after': str(int(
+                 time.mktime(datetime(2020, 1, 1).timetuple())))})
+
+    @mock.patch('testrail.api.API._get')
+    def test_cached_per_filter_set(self, mock_get):
+        mock_get.side_effect = [self.page(self.runs[1:]),
+                                self.page(self.runs[:1]),
+                                self.page(self.runs)]
+        done = self.client.runs(filters={'is_completed': True})
+        active = self.client.runs(filters={'is_completed': False})
+        self.assertEqual(done, self.runs[1:])
+        self.assertEqual(active, self.runs[:1])
+        self.assertEqual(self.client.runs(filters={'is_completed': 1}), done)
+        self.assertEqual(self.client.runs(), self.runs)
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_get.call_args_list[0][1]['params']
+                         ['is_completed'], '1')
+
+    @mock.patch('testrail.api.API._post')
+    @mock.patch('testrail.api.API._get')
+    def test_write_invalidates_queries(self, mock_get, mock_post):
+        mock_get.side_effect = [self.page(self.runs),
+                                self.page(self.runs[1:]),
+                                self.page(self.runs)]
+        self.client.runs()
+        self.client.runs(filters={'is_completed': True})
+        mock_post.return_value = dict(self.runs[0], is_completed=True)
+        self.client.close_run(1)
+        self.assertEqual(len(self.client.runs(filters={'is_completed': True})),
+                         2)
+        self.assertEqual(mock_get.call_count, 3)
+
+    @mock.patch('testrail.api.API._get')
+    def test_completed_does_not_share_unfiltered_slot(self, mock_get):
+        mock_get.side_effect = [self.page(self.runs),
+                                self.page(self.runs[1:])]
+        self.assertEqual(self.client.runs(), self.runs)
+        self.assertEqual(self.client.runs(completed=True), self.runs[1:])
+        self.assertEqual(self.client.runs(), self.runs)
+        self.assertEqual(self.client.runs(completed=True), self.runs[1:])
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args[0][0], 'get_runs/1')
+
+    @mock.patch('testrail.api.API._get')
+    def test_run_filter_keywords(self, mock_get):
+        mock_get.return_value = self.page(self.runs)
+        self.client.runs(milestone_id=[3, 2], suite_id=4, completed=False)
+        self.client.runs(filters={'suite_id': 4, 'milestone_id': '2,3'},
+                         is_completed=0)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_get.call_args[1]['params'],
+                         {'milestone_id': '2,3', 'suite_id': '4',
+                          'is_completed': '0', 'offset': 0, 'limit': 250})
+
+    def test_unknown_filter(self):
+        with self.assertRaises(TestRailError):
+            self.client.runs(status_id=1)
+        with self.assertRaises(TestRailError):
+            self.client.tests(1, filters={'is_completed': True})
+
+    @mock.patch('testrail.api.API._get')
+    def test_iter_runs_uses_cached_query(self, mock_get):
+        mock_get.return_value = self.page(self.runs[1:])
+        self.client.runs(completed=True)
+        self.assertEqual(list(self.client.iter_runs(completed=True)),
+                         self.runs[1:])
+        self.assertEqual(mock_get.call_count, 1)
+
+    @mock.patch('testrail.api.API._get')
+    def test_results_by_run_and_test_kept_apart(self, mock_get):
+        by_run = [{'id': 1, 'test_id': 8}]
+        by_test = [{'id': 2, 'test_id': 5}]
+        mock_get.side_effect = [
+            {'size': 1, '_links': {'next': None}, 'results': by_run},
+            {'size': 1, '_links': {'next': None}, 'results': by_test}]
+        self.assertEqual(self.client.results_by_run(5), by_run)
+        self.assertEqual(self.client.results_by_test(5), by_test)
+        self.assertEqual(self.client.results_by_run(5), by_run)
+
+
+class TestCaseSectionWrites(unittest.TestCase):
+    def setUp(self):
+        self.client = API()
+        self.client.set_project_id(1)
+        now = datetime.now()
+        self.client._users['ts'] = now
+        self.client._users['value'] = [{'id': 1}]
+        self.client._suites[1]['ts'] = now
+        self.client._suites[1]['value'] = [{'id': 5, 'project_id': 1}]
+        self.client._cases[1][5]['ts'] = now
+        self.client._cases[1][5]['value'] = [{'id': 1, 'suite_id': 5}]
+
+    def tearDown(self):
+        util.reset_shared_state(self.client)
+
+    @mock.patch('testrail.api.API._post')
+    def test_add_case_updates_suite_listing(self, mock_post):
+        mock_post.return_value = {'id': 2, 'suite_id': 5, 'title': 'new'}
+        self.client.add_case({'section_id': 3, 'title': 'new'})
+        self.assertEqual([c['id'] for c in self.client._cases[1][5]['value']],
+                         [1, 2])
+        self.assertTrue(self.client._cases[1][5]['ts'])
+        self.assertTrue(self.client._users['ts'])
+        self.assertEqual(self.client.case_with_id(2, 5)['title'], 'new')
+
+    @mock.patch('testrail.api.API._post')
+    def test_update_case_replaces_cached_copy(self, mock_post):
+        mock_post.return_value = {'id': 1, 'suite_id': 5, 'title': 'v2'}
+        self.client.update_case({'id': 1, 'title': 'v2'})
+        self.assertEqual(self.client._cases[1][5]['value'],
+                         [mock_post.return_value])
+
+    @mock.patch('testrail.api.API._post')
+    def test_case_of_unknown_suite_marks_project_listings_stale(self,
+                                                               mock_post):
+        self.client._cases[2][-1]['ts'] = datetime.now()
+        self.client._cases[2][-1]['value'] = []
+        mock_post.return_value = {'id': 9, 'suite_id': 77}
+        self.client.add_case({'section_id': 3})
+        self.assertIsNone(self.client._cases[2][-1]['ts'])
+        self.assertTrue(self.client._cases[1][5]['ts'])
+        self.assertEqual(len(self.client._cases[1][5]['value']), 1)
+
+    @mock.patch('testrail.api.API._post')
+    def test_add_section_updates_listings(self, mock_post):
+        for key in (5, -1):
+            self.client._sections[1][key]['ts'] = datetime.now()
+            self.client._sections[1][key]['value'] = [{'id': 1}]
+        mock_post.return_value = {'id': 2, 'suite_id': 5, 'name': 's'}
+        self.client.add_section({'project_id': 1, 'suite_id': 5, 'name': 's'})
+        for key in (5, -1):
+            self.assertEqual(
+                [s['id'] for s in self.client._sections[1][key]['value']],
+                [1, 2])
+        self.assertTrue(self.client._users['ts'])
@@ -4,7 +4,13 @@ try:
 except ImportError:
     import unittest
 
-from testrail.base import TestRailBase
+from testrail.base import TestRailBase, relation
+from testrail.case import Case
+from testrail.helper import ContainerIter, custom_methods
+from testrail.plan import Plan
+from testrail.result import Result
+from testrail.run import Run
+from testrail.test import Test
 
 
 class TestBase(unittest.TestCase):
@@ -20,3 +26,73 @@ class TestBase(unittest.TestCase):
 
     def test___repr__(self):
         self.assertEqual(repr(self.base), "Foo-123")
+
+
+class Owner(TestRailBase):
+    lookups = 0
+
+    def __init__(self, content):
+        self._content = content
+
+    @relation('owner_id')
+    def owner(self):
+        Owner.lookups += 1
+        return {'id': self._content.get('owner_id')}
+
+    @owner.setter
+    def owner(self, value):
+        self._content['owner_id'] = value['id']
+
+
+class TestRelation(unittest.TestCase):
+    def setUp(self):
+        Owner.lookups = 0
+
+    def test_memoized(self):
+        obj = Owner({'owner_id': 1})
+        self.assertIs(obj.owner, obj.owner)
+        self.assertEqual(Owner.lookups, 1)
+
+    def test_invalidated_when_key_changes(self):
+        obj = Owner({'owner_id': 1})
+        obj.owner
+        obj.owner = {'id': 2}
+        self.assertEqual(obj.owner['id'], 2)
+        obj._content['owner_id'] = 3
+        self.assertEqual(obj.owner['id'], 3)
+        self.assertEqual(Owner.lookups, 3)
+
+    def test_prefetch_resolves_once_per_id(self):
+        objs = [Owner({'owner_id': i % 3}) for i in range(30)]
+        container = ContainerIter(objs).prefetch('owner')
+        self.assertEqual(Owner.lookups, 3)
+        self.assertEqual([o.owner['id'] for o in container],
+                         [i % 3 for i in range(30)])
+        self.assertEqual(Owner.lookups, 3)
+
+
+class TestCompactModels(unittest.TestCase):
+    def test_no_instance_dict(self):
+        for cls in (Case, Plan, Result, Run, Test):
+            self.assertFalse(hasattr(cls({'id': 1}), '__dict__'))
+
+    def test_shared_api(self):
+        self.assertIs(Result().api, Case().api)
+        self.assertIs(Run().api, Plan().api)
+
+    def test_relations_stored_in_slot(self):
+        obj = Run({'id': 1})
+        obj._attach('plan', (None,), 'plan')
+        self.assertEqual(obj._relations, {'plan': ((None,), 'plan')})
+
+    def test_custom_fields(self):
+        result = Result({'id': 1, 'custom_build': 'b1'})
+        self.assertEqual(result.build, 'b1')
+        with self.assertRaises(AttributeError):
+            result.missing
+
+    def test_custom_methods_shared_per_schema(self):
+        first = custom_methods({'id': 1, 'custom_build': 'b1'})
+        second = custom_methods({'custom_build': 'b2', 'id': 2})
+        self.assertIs(first, second)
+        self.assertEqual(first, {'build': 'custom_build'})
@@ -0,0 +1,297 @@
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import threading
+
+import mock
+import util
+
+import testrail
+from testrail.api import API
+from testrail.batch import ResultBuffer, ResultUploader
+from testrail.helper import TestRailError
+from testrail.result import Result
+from testrail.run import Run
+
+
+def rejected(message, status_code=400):
+    # TestRailError the way API._post raises it
+    return TestRailError({'status_code': status_code, 'error': message})
+
+
+class TestResultBuffer(unittest.TestCase):
+    def setUp(self):
+        self.api = mock.Mock()
+        self.results = [Result({'test_id': i, 'status_id': 1})
+                        for i in range(10)]
+
+    def posted(self):
+        return [[r['test_id'] for r in c[0][0]]
+                for c in self.api.add_results.call_args_list]
+
+    def test_flush_on_size(self):
+        buf = ResultBuffer(self.api, size=4)
+        for result in self.results[:9]:
+            buf.add(result, run=7)
+        self.assertEqual(self.posted(), [[0, 1, 2, 3], [4, 5, 6, 7]])
+        self.assertEqual(len(buf), 1)
+        self.assertTrue(all(c[0][1] == 7
+                            for c in self.api.add_results.call_args_list))
+
+    @mock.patch('testrail.batch.time')
+    def test_flush_on_interval(self, mock_time):
+        mock_time.side_effect = [100, 101, 105, 111]
+        buf = ResultBuffer(self.api, size=50, interval=10)
+        buf.add(self.results[0], run=7)
+        buf.add(self.results[1], run=7)
+        self.assertEqual(self.api.add_results.call_count, 0)
+        buf.add(self.results[2], run=7)
+        self.assertEqual(self.posted(), [[0, 1, 2]])
+
+    def test_context_manager_flushes_per_run(self):
+        with ResultBuffer(self.api, size=50) as buf:
+            buf.add(self.results[0], run=Run({'id': 1}))
+            buf.add(self.results[1], run=2)
+            buf.add(self.results[2], run=Run({'id': 1}))
+            self.assertEqual(self.api.add_results.call_count, 0)
+        calls = dict((c[0][1], [r['test_id'] for r in c[0][0]])
+                     for c in self.api.add_results.call_args_list)
+        self.assertEqual(calls, {1: [0, 2], 2: [1]})
+        self.assertTrue(buf.closed)
+        with self.assertRaises(TestRailError):
+            buf.add(self.results[3], run=1)
+
+    def test_run_looked_up_from_test(self):
+        self.api.test_run_id.return_value = 3
+        with ResultBuffer(self.api) as buf:
+            buf.add(self.results[5])
+        self.api.test_run_id.assert_called_once_with(5)
+        self.assertEqual(self.api.add_results.call_args[0][1], 3)
+
+    def test_failed_chunk_bisected(self):
+        def add_results(results, run_id):
+            if any(r['test_id'] == 5 for r in results):
+                raise rejected('Field :results[5].status_id is not valid')
+        self.api.add_results.side_effect = add_results
+        buf = ResultBuffer(self.api, size=8)
+        for result in self.results[:7]:
+            buf.add(result, run=1)
+        with self.assertRaises(TestRailError):
+            buf.flush()
+        self.assertEqual(buf.failed[0][0], self.results[5])
+        self.assertEqual(len(buf.failed), 1)
+        posted = [t for c in self.posted() for t in c]
+        for test_id in (0, 1, 2, 3, 4, 6):
+            self.assertIn(test_id, posted)
+
+    def test_request_error_not_bisected(self):
+        self.api.add_results.side_effect = rejected(
+            'The test run is completed and cannot be modified', 403)
+        buf = ResultBuffer(self.api, size=8)
+        for result in self.results[:7]:
+            buf.add(result, run=1)
+        with self.assertRaises(TestRailError):
+            buf.flush()
+        self.assertEqual(self.api.add_results.call_count, 1)
+        self.assertEqual(len(buf.failed), 7)
+
+    def test_halves_failing_alike_stop(self):
+        self.api.add_results.side_effect = rejected(
+            'Field :results uses an unknown custom field')
+        buf = ResultBuffer(self.api, size=8)
+        for result in self.results[:7]:
+            buf.add(result, run=1)
+        with self.assertRaises(TestRailError):
+            buf.flush()
+        self.assertEqual(self.api.add_results.call_count, 3)
+        self.assertEqual([r for r, e in buf.failed], self.results[:7])
+
+    def test_unposted_kept_on_other_errors(self):
+        self.api.add_results.side_effect = [None, IOError('connection reset')]
+        buf = ResultBuffer(self.api, size=10)
+        buf.add(self.results[0], run=1)
+        buf.add(self.results[1], run=1)
+        for result in self.results[2:5]:
+            buf.add(result, run=2)
+        buf.size = 2  # post in three chunks
+        with self.assertRaises(IOError):
+            buf.flush()
+        self.assertEqual(len(buf), 3)
+        self.assertEqual(buf.failed, [])
+        self.api.add_results.side_effect = None
+        buf.flush()
+        self.assertEqual(len(buf), 0)
+        self.assertEqual(self.api.add_results.call_count, 4)
+
+    def test_exit_does_not_mask_exception(self):
+        self.api.add_results.side_effect = TestRailError('down')
+        with self.assertRaises(ValueError):
+            with ResultBuffer(self.api) as buf:
+                buf.add(self.results[0], run=1)
+                raise ValueError('test runner error')
+
+
+class TestResultUploader(unittest.TestCase):
+    def setUp(self):
+        self.api = mock.Mock()
+        self.results = [Result({'test_id': i, 'status_id': 1})
+                        for i in range(20)]
+
+    def posted(self):
+        return sorted(r['test_id'] for c in self.api.add_results.call_args_list
+                      for r in c[0][0])
+
+    def test_flush_posts_everything(self):
+        uploader = ResultUploader(self.api, size=5, interval=60, workers=2)
+        for result in self.results:
+            uploader.add(result, run=1)
+        uploader.flush()
+        self.assertEqual(self.posted(), list(range(20)))
+        self.assertTrue(all(len(c[0][0]) <= 5
+                            for c in self.api.add_results.call_args_list))
+        uploader.close()
+
+    def test_close_posts_remaining(self):
+        with ResultUploader(self.api, size=50, interval=60) as uploader:
+            for result in self.results[:3]:
+                uploader.add(result, run=1)
+        self.assertEqual(self.posted(), [0, 1, 2])
+        self.assertTrue(uploader.closed)
+        with self.assertRaises(TestRailError):
+            uploader.add(self.results[3], run=1)
+
+    def test_backpressure(self):
+        release = threading.Event()
+        self.api.add_results.side_effect = lambda *args: release.wait()
+        uploader = ResultUploader(self.api, size=1, interval=0, maxsize=1)
+        uploader.add(self.results[0], run=1)  # taken by the worker
+        uploader.add(self.results[1], run=1)  # fills the queue
+        with self.assertRaises(TestRailError):
+            uploader.add(self.results[2], run=1, timeout=0.1)
+        release.set()
+        uploader.close()
+        self.assertEqual(self.posted(), [0, 1])
+
+    def test_error_callback(self):
+        errors = list()
+
+        def add_results(results, run_id):
+            if any(r['test_id'] == 3 for r in results):
+                raise rejected('Field :results[3].status_id is not valid')
+        self.api.add_results.side_effect = add_results
+        self.api.test_run_id.side_effect = TestRailError('no such test')
+        uploader = ResultUploader(self.api, size=10, interval=60,
+                                  on_error=lambda r, e: errors.append(r))
+        for result in self.results[:5]:
+            uploader.add(result, run=1)
+        uploader.add(self.results[5])
+        uploader.close()
+        self.assertEqual(sorted(r.raw_data()['test_id'] for r in errors),
+                         [3, 5])
+        self.assertEqual(len(uploader.failed), 2)
+
+    def test_workers_survive_other_errors(self):
+        self.api.add_results.side_effect = IOError('connection refused')
+        uploader = ResultUploader(self.api, size=2, interval=60, workers=2,
+                                  on_error=lambda r, e: 1 / 0)
+        for result in self.results[:4]:
+            uploader.add(result, run=1)
+        uploader.flush()
+        self.assertEqual(len(uploader.failed), 4)
+        self.assertTrue(all(isinstance(e, IOError)
+                            for r, e in uploader.failed))
+        self.assertTrue(all(t.is_alive() for t in uploader._threads))
+        self.api.add_results.side_effect = None
+        uploader.add(self.results[4], run=1)
+        uploader.close()
+        self.assertEqual(self.api.add_results.call_args[0][0],
+                         [self.results[4].raw_data()])
+
+    def test_flush_after_close(self):
+        uploader = ResultUploader(self.api, size=5, interval=60)
+        uploader.add(self.results[0], run=1)
+        uploader.close()
+        uploader.flush()
+        self.assertEqual(self.posted(), [0])
+
+
+class TestClientBufferResults(unittest.TestCase):
+    def setUp(self):
+        self.client = testrail.TestRail(1)
+
+    def tearDown(self):
+        util.reset_shared_state(self.client.api)
+
+    @mock.patch('testrail.api.API.add_result')
+    @mock.patch('testrail.api.API.add_results')
+    def test_add_routes_to_buffer(self, mock_add_results, mock_add_result):
+        self.client.api._tests[4]['value'] = [{'id': 1}, {'id': 2}]
+        with self.client.buffer_results(size=10):
+            self.client.add(Result({'test_id': 1, 'status_id': 1}))
+            self.client.add(Result({'test_id': 2, 'status_id': 5}))
+        self.assertEqual(mock_add_result.call_count, 0)
+        mock_add_results.assert_called_once_with(
+            [{'test_id': 1, 'status_id': 1}, {'test_id': 2, 'status_id': 5}],
+            4)
+        self.client.add(Result({'test_id': 1, 'status_id': 1}))
+        self.assertEqual(mock_add_result.call_count, 1)
+
+    @mock.patch('testrail.api.API._get')
+    @mock.patch('testrail.api.API.add_results')
+    def test_buffer_run_given(self, mock_add_results, mock_get):
+        with self.client.buffer_results(size=10, run=Run({'id': 4})):
+            for test_id in range(5):
+                self.client.add(Result({'test_id': test_id, 'status_id': 1}))
+        self.assertEqual(mock_get.call_count, 0)
+        self.assertEqual(mock_add_results.call_count, 1)
+        self.assertEqual(mock_add_results.call_args[0][1], 4)
+
+    @mock.patch('testrail.api.API._get')
+    @mock.patch('testrail.api.API.add_results')
+    def test_uploader_run_given(self, mock_add_results, mock_get):
+        with self.client.upload_results(interval=60, run=4):
+            for test_id in range(5):
+                self.client.add(Result({'test_id': test_id, 'status_id': 1}))
+        self.assertEqual(mock_get.call_count, 0)
+        self.assertEqual(mock_add_results.call_args[0][1], 4)
+
+    @mock.patch('testrail.api.API.add_result')
+    @mock.patch('testrail.api.API.add_results')
+    def test_add_routes_to_uploader(self, mock_add_results, mock_add_result):
+        self.client.api._tests[4]['value'] = [{'id': 1}]
+        with self.client.upload_results(interval=60) as uploader:
+            self.client.add(Result({'test_id': 1, 'status_id': 1}))
+            uploader.flush()
+            mock_add_results.assert_called_once_with(
+                [{'test_id': 1, 'status_id': 1}], 4)
+        self.assertEqual(mock_add_result.call_count, 0)
+
+
+class TestTestRunId(unittest.TestCase):
+    def setUp(self):
+        self.client = API()
+
+    def tearDown(self):
+        util.reset_shared_state(self.client)
+
+    def test_cached(self):
+        self.client._tests[4]['value'] = [{'id': 1}]
+        self.client._tests[5]['value'] = [{'id': 2}]
+        self.assertEqual(self.client.test_run_id(2), 5)
+
+    @mock.patch('testrail.api.API._get')
+    def test_not_cached(self, mock_get):
+        def get(uri, params=None):
+            if uri == 'get_test/9':
+                return {'id': 9, 'run_id': 6}
+            return {'size': 2, '_links': {'next': None},
+                    'tests': [{'id': 9}, {'id': 10}]}
+        mock_get.side_effect = get
+        self.assertEqual(self.client.test_run_id(9), 6)
+        self.assertEqual(mock_get.call_args_list[0][0], ('get_test/9', ))
+        # The run's tests were loaded along the way
+        self.assertEqual(self.client.test_run_id(10), 6)
+        self.assertEqual(mock_get.call_count, 2)
+
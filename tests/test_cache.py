@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+import os
+import shutil
+import tempfile
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import mock
+import util
+
+from testrail.api import API
+from testrail.cache import MemoryCacheBackend, SQLiteCacheBackend
+
+
+class TestSQLiteCacheBackend(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'cache.sqlite')
+        self.backend = SQLiteCacheBackend(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_load_missing(self):
+        self.assertIsNone(self.backend.load('_users', ['url', 'me']))
+
+    def test_store_and_load(self):
+        ts = datetime(2020, 1, 2, 3, 4, 5, 600000)
+        value = [{'id': 1, 'name': 'Han Solo'}]
+        self.backend.store('_users', ['url', 'me'], ts, value)
+        self.assertEqual(self.backend.load('_users', ['url', 'me']),
+                         (ts, value))
+        self.assertIsNone(self.backend.load('_users', ['url', 'you']))
+
+    def test_store_replaces(self):
+        ts = datetime.now()
+        self.backend.store('_cases', ['url', 'me', 1, 2], ts, [1])
+        self.backend.store('_cases', ['url', 'me', 1, 2], ts, [2])
+        self.assertEqual(self.backend.load('_cases', ['url', 'me', 1, 2])[1],
+                         [2])
+
+    def test_shared_between_instances(self):
+        ts = datetime.now()
+        self.backend.store('_statuses', ['url', 'me'], ts, [{'id': 1}])
+        other = SQLiteCacheBackend(self.path)
+        self.assertEqual(other.load('_statuses', ['url', 'me'])[1],
+                         [{'id': 1}])
+
+    def test_delete_and_clear(self):
+        ts = datetime.now()
+        self.backend.store('_users', ['url', 'me'], ts, [])
+        self.backend.store('_statuses', ['url', 'me'], ts, [])
+        self.backend.delete('_users', ['url', 'me'])
+        self.assertIsNone(self.backend.load('_users', ['url', 'me']))
+        self.backend.clear()
+        self.assertIsNone(self.backend.load('_statuses', ['url', 'me']))
+
+
+class TestAPICacheBackend(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        API.set_cache_backend(
+            SQLiteCacheBackend(os.path.join(self.tmp_dir, 'cache.sqlite')))
+        self.client = API()
+        self.users = [{'id': 1, 'email': 'han@example.com'}]
+
+    def tearDown(self):
+        API.set_cache_backend(MemoryCacheBackend())
+        util.reset_shared_state(self.client)
+        shutil.rmtree(self.tmp_dir)
+
+    @mock.patch('testrail.api.API._get')
+    def test_warm_start_from_backend(self, mock_get):
+        mock_get.return_value = self.users
+        self.client.users()
+        # A new process starts with empty in-memory caches
+        util.reset_shared_state(self.client)
+        self.assertEqual(self.client.user_with_id(1), self.users[0])
+        self.assertEqual(mock_get.call_count, 1)
+
+    @mock.patch('testrail.api.API._get')
+    def test_expired_backend_entry_ignored(self, mock_get):
+        mock_get.return_value = self.users
+        self.client.users()
+        util.reset_shared_state(self.client)
+        old = datetime.now() - timedelta(seconds=self.client._timeout + 1)
+        API._cache_backend.store('_users', self.client._backend_key(()),
+                                 old, self.users)
+        self.client.users()
+        self.assertEqual(mock_get.call_count, 2)
+
+    @mock.patch('testrail.api.API._get')
+    def test_invalidated_cache_skips_backend(self, mock_get):
+        mock_get.return_value = self.users
+        self.client.users()
+        self.client._users['ts'] = None
+        self.client.users()
+        self.assertEqual(mock_get.call_count, 2)
+
+    @mock.patch('testrail.api.API._get')
+    def test_flush_cache_clears_backend(self, mock_get):
+        mock_get.return_value = self.users
+        self.client.users()
+        API.flush_cache()
+        self.assertIsNone(API._cache_backend.load(
+            '_users', self.client._backend_key(())))
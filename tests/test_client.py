@@ -14,6 +14,7 @@ from testrail.project import Project
 from testrail.milestone import Milestone
 from testrail.helper import TestRailError
 from testrail.run import RunContainer, Run
+from testrail.table import ResultTable
 from testrail.plan import PlanContainer, Plan
 from testrail.result import ResultContainer, Result
 
@@ -369,7 +370,7 @@ class TestProject(unittest.TestCase):
     def tearDown(self):
             pass
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_projects(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_project_data
@@ -380,7 +381,7 @@ class TestProject(unittest.TestCase):
         for project in projects:
             assert isinstance(project, Project)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_runs_returns_runcontainer(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_runs_data
@@ -390,7 +391,7 @@ class TestProject(unittest.TestCase):
         assert isinstance(runs, RunContainer)
         self.assertEqual(len(runs), 2)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_plan_by_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_plans_data)
@@ -400,7 +401,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue(isinstance(plan, Plan))
         self.assertEqual(plan.id, 11)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_plan_by_name(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_plans_data)
@@ -410,7 +411,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue(isinstance(plan, Plan))
         self.assertEqual(plan.name, 'Mock Plan1 Name')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_user_by_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_users)
@@ -420,7 +421,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue(isinstance(user, User))
         self.assertEqual(user.id, 1)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_user_by_email(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_users)
@@ -430,7 +431,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue(isinstance(user, User))
         self.assertEqual(user.email, 'mock1@email.com')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_user_by_name(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_users)
@@ -440,7 +441,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue(isinstance(user, User))
         self.assertEqual(user.name, 'Mock Name 2')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_user_is_active(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_users)
@@ -452,7 +453,7 @@ class TestProject(unittest.TestCase):
         self.assertEqual(users[0].id, 1)
         self.assertEqual(users[1].id, 2)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_user_is_inactive(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_users)
@@ -463,7 +464,7 @@ class TestProject(unittest.TestCase):
         self.assertEqual(len(users), 1)
         self.assertEqual(users[0].id, 3)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_runcontainer_contains_only_run_objects(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_runs_data
@@ -472,7 +473,7 @@ class TestProject(unittest.TestCase):
         runs = self.client.runs()
         self.assertTrue(all([isinstance(r, Run) for r in runs]))
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_runcontainer_active_runs(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_runs_data
@@ -482,7 +483,7 @@ class TestProject(unittest.TestCase):
         self.assertEqual(len(active_runs), 1)
         self.assertEqual(active_runs[0].id, 111)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_runcontainer_completed_runs(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_runs_data
@@ -492,7 +493,7 @@ class TestProject(unittest.TestCase):
         self.assertEqual(len(completed_runs), 1)
         self.assertEqual(completed_runs[0].id, 222)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_runcontainer_latest_runs(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_runs_data
@@ -501,7 +502,7 @@ class TestProject(unittest.TestCase):
         latest_run = self.client.runs().latest()
         self.assertEqual(latest_run.id, 222)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_runcontainer_oldest_runs(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_runs_data
@@ -510,7 +511,7 @@ class TestProject(unittest.TestCase):
         oldest_run = self.client.runs().oldest()
         self.assertEqual(oldest_run.id, 111)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_contains_only_plan_objects(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -519,7 +520,7 @@ class TestProject(unittest.TestCase):
         plans = self.client.plans()
         self.assertTrue(all([isinstance(r, Plan) for r in plans]))
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_active_plans(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -534,7 +535,7 @@ class TestProject(unittest.TestCase):
         self.assertIn(33, ids)
         self.assertIn(44, ids)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_completed_plans(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -545,7 +546,7 @@ class TestProject(unittest.TestCase):
         self.assertEqual(len(completed_plans), 1)
         self.assertEqual(completed_plans[0].id, 11)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_latest_plan(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -555,7 +556,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue(isinstance(latest_plan, Plan))
         self.assertEqual(latest_plan.id, 44)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_oldest_plan(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -565,7 +566,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue(isinstance(oldest_plan, Plan))
         self.assertEqual(oldest_plan.id, 11)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_created_after_error(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -576,7 +577,7 @@ class TestProject(unittest.TestCase):
             created_after = self.client.plans().created_after(after_date)
         self.assertEqual(str(e.exception), 'Must pass in a datetime object')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_created_after(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -589,7 +590,7 @@ class TestProject(unittest.TestCase):
         self.assertEqual(created_after[0].id, 33)
         self.assertEqual(created_after[1].id, 44)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_created_before_error(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -600,7 +601,7 @@ class TestProject(unittest.TestCase):
             created_before = self.client.plans().created_before(before_date)
         self.assertEqual(str(e.exception), 'Must pass in a datetime object')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_created_before(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -612,7 +613,7 @@ class TestProject(unittest.TestCase):
         self.assertEqual(len(created_before), 1)
         self.assertEqual(created_before[0].id, 11)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_created_by_error(self, mock_get):
         API.flush_cache()
         mock_response = mock.Mock()
@@ -624,7 +625,7 @@ class TestProject(unittest.TestCase):
             created_by = self.client.plans().created_by(user)
         self.assertEqual(str(e.exception), 'Must pass in a User object')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_created_by(self, mock_get):
         API.flush_cache()
         mock_response = mock.Mock()
@@ -638,7 +639,7 @@ class TestProject(unittest.TestCase):
         self.assertEqual(created_by[0].id, 33)
         self.assertEqual(created_by[1].id, 44)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_plan_with_name_error(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -649,7 +650,7 @@ class TestProject(unittest.TestCase):
             by_name = self.client.plans().name(name)
         self.assertEqual(str(e.exception), 'Must pass in a string')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_plan_with_name_not_found(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -660,7 +661,7 @@ class TestProject(unittest.TestCase):
             by_name = self.client.plans().name(name)
         self.assertEqual(str(e.exception), "Plan with name '3' was not found")
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_with_name(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_plans_data
@@ -671,7 +672,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue(isinstance(plan, Plan))
         self.assertEqual(plan.id, 22)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plancontainer_for_milestone(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.side_effect = [
@@ -685,7 +686,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue([isinstance(p, Plan) for p in plans])
         self.assertTrue([p._content['milestone_id'] == 1 for p in plans])
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_resultcontainer_contains_only_result_objects(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_results_data
@@ -694,7 +695,7 @@ class TestProject(unittest.TestCase):
         results = self.client.results(Run(self.mock_runs_data[0]))
         self.assertTrue(all([isinstance(r, Result) for r in results]))
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_resultcontainer_blocked_results(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.side_effect = [self.mock_results_data,
@@ -709,7 +710,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue([lambda x: isinstance(x, Result) for x in blocked])
         self.assertEqual(blocked[0].id, 22)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_resultcontainer_failed_results(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.side_effect = [self.mock_results_data,
@@ -724,7 +725,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue([lambda x: isinstance(x, Result) for x in failed])
         self.assertEqual(failed[0].id, 55)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_resultcontainer_passed_results(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.side_effect = [self.mock_results_data,
@@ -739,7 +740,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue([lambda x: isinstance(x, Result) for x in passed])
         self.assertEqual(passed[0].id, 11)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_resultcontainer_retest_results(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.side_effect = [self.mock_results_data,
@@ -754,7 +755,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue([lambda x: isinstance(x, Result) for x in retest])
         self.assertEqual(retest[0].id, 44)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_resultcontainer_untested_results(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.side_effect = [self.mock_results_data,
@@ -769,7 +770,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue([lambda x: isinstance(x, Result) for x in untested])
         self.assertEqual(untested[0].id, 33)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_resultcontainer_latest_plan(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_results_data
@@ -782,7 +783,7 @@ class TestProject(unittest.TestCase):
         self.assertTrue(isinstance(latest_result, Result))
         self.assertEqual(latest_result.id, 44)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_resultcontainer_oldest_plan(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = self.mock_results_data
@@ -794,3 +795,36 @@ class TestProject(unittest.TestCase):
 
         self.assertTrue(isinstance(oldest_result, Result))
         self.assertEqual(oldest_result.id, 22)
+
+    @mock.patch('testrail.api.requests.Session.get')
+    def test_iter_results(self, mock_get):
+        mock_response = mock.Mock()
+        mock_response.json.return_value = {
+            'size': len(self.mock_results_data),
+            '_links': {'next': None, 'prev': None},
+            'results': self.mock_results_data}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+        results = self.client.iter_results(Run(self.mock_runs_data[0]))
+        self.assertFalse(isinstance(results, list))
+        results = list(results)
+        self.assertTrue(all([isinstance(r, Result) for r in results]))
+        self.assertEqual([r.id for r in results],
+                         [r['id'] for r in self.mock_results_data])
+
+    @mock.patch('testrail.api.API.results_by_run')
+    def test_result_table(self, mock_results):
+        mock_results.return_value = self.mock_results_data
+        table = self.client.result_table(Run(self.mock_runs_data[0]))
+        self.assertTrue(isinstance(table, ResultTable))
+        self.assertEqual(list(table.id),
+                         [r['id'] for r in self.mock_results_data])
+
+    @mock.patch('testrail.api.API.runs_with_name')
+    def test_run_by_name(self, mock_runs):
+        mock_runs.return_value = [{'id': 5, 'name': 'Smoke'},
+                                  {'id': 3, 'name': 'smoke'}]
+        run = self.client.run('SMOKE')
+        mock_runs.assert_called_once_with('SMOKE', 1)
+        self.assertEqual(run.id, 3)
+        self.assertEqual([r.id for r in self.client.runs('SMOKE')], [3, 5])
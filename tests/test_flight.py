@@ -0,0 +1,115 @@
+import threading
+import time
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import mock
+
+import util
+from testrail.api import API
+from testrail.flight import SingleFlight
+from testrail.helper import TestRailError
+
+
+def run_threads(target, count=8):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.flight = SingleFlight()
+        self.calls = list()
+
+    def slow(self, value=None, error=None):
+        def func():
+            self.calls.append(1)
+            time.sleep(0.05)
+            if error is not None:
+                raise error
+            return value
+        return func
+
+    def test_result_shared(self):
+        value = object()
+        results = list()
+        run_threads(lambda: results.append(
+            self.flight.do('k', self.slow(value))))
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(results, [value] * 8)
+        self.assertEqual(self.flight.in_flight(), 0)
+
+    def test_exception_shared(self):
+        error = TestRailError('down')
+        errors = list()
+
+        def worker():
+            try:
+                self.flight.do('k', self.slow(error=error))
+            except TestRailError as e:
+                errors.append(e)
+        run_threads(worker)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(errors, [error] * 8)
+        self.assertEqual(self.flight.in_flight(), 0)
+
+    def test_keys_independent(self):
+        keys = iter(range(8))
+        run_threads(lambda: self.flight.do(next(keys), self.slow()))
+        self.assertEqual(len(self.calls), 8)
+
+    def test_sequential_calls_not_shared(self):
+        self.flight.do('k', self.slow(1))
+        self.assertEqual(self.flight.do('k', self.slow(2)), 2)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_reentrant(self):
+        self.assertEqual(
+            self.flight.do('k', lambda: self.flight.do('k', lambda: 3)), 3)
+
+
+class TestAPICoalescing(unittest.TestCase):
+    def setUp(self):
+        self.client = API()
+
+    def tearDown(self):
+        util.reset_shared_state(self.client)
+
+    @mock.patch('testrail.api.API._http_get')
+    def test_identical_gets_coalesced(self, mock_get):
+        def slow_get(uri, params=None):
+            time.sleep(0.05)
+            return {'id': 1}
+        mock_get.side_effect = slow_get
+        run_threads(lambda: self.client._get('get_plan/1', {'a': 1}))
+        self.assertEqual(mock_get.call_count, 1)
+        run_threads(lambda: self.client._get('get_plan/1', {'a': 2}), 1)
+        run_threads(lambda: self.client._get('get_plan/2', {'a': 1}), 1)
+        self.assertEqual(mock_get.call_count, 3)
+
+    @mock.patch('testrail.api.API._get')
+    def test_failed_refresh_shared(self, mock_get):
+        def failing_get(uri, params=None):
+            time.sleep(0.05)
+            raise TestRailError('unavailable')
+        mock_get.side_effect = failing_get
+        errors = list()
+
+        def worker():
+            try:
+                self.client.statuses()
+            except TestRailError as e:
+                errors.append(e)
+        run_threads(worker)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(len(errors), 8)
+        # The next miss tries again
+        mock_get.side_effect = None
+        mock_get.return_value = [{'id': 1}]
+        self.assertEqual(self.client.statuses(), [{'id': 1}])
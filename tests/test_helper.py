@@ -0,0 +1,33 @@
+from datetime import timedelta
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from testrail import helper
+from testrail.helper import duration_seconds, parse_durations
+
+
+class TestDurations(unittest.TestCase):
+    def test_all_units(self):
+        self.assertEqual(helper.testrail_duration_to_timedelta('1w 3d 6h 2m 30s'),
+                         timedelta(weeks=1, days=3, hours=6, minutes=2,
+                                   seconds=30))
+
+    def test_units_in_any_order(self):
+        self.assertEqual(duration_seconds('30s 1h'), 3630)
+        self.assertEqual(duration_seconds('2m'), 120)
+
+    def test_first_amount_per_unit(self):
+        self.assertEqual(duration_seconds('1m 5m'), 60)
+
+    def test_empty(self):
+        self.assertEqual(duration_seconds(''), 0)
+
+    def test_memoized(self):
+        self.assertIs(helper.testrail_duration_to_timedelta('4h 1s'),
+                      helper.testrail_duration_to_timedelta('4h 1s'))
+
+    def test_parse_durations(self):
+        self.assertEqual(parse_durations(['1m', None, 45, '1h 1s']),
+                         [60, None, 45, 3601])
@@ -145,7 +145,7 @@ class TestCaseType(unittest.TestCase):
             self.milestone.name = 394
         self.assertEqual(str(e.exception), 'input must be a string')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_project_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -153,7 +153,7 @@ class TestCaseType(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(type(self.milestone.project), Project)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_project(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -161,7 +161,7 @@ class TestCaseType(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(self.milestone.project.id, 1)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_project_invalid_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -172,7 +172,7 @@ class TestCaseType(unittest.TestCase):
             self.milestone.project
         self.assertEqual(str(e.exception), "Project ID '200' was not found")
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_project(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -188,7 +188,7 @@ class TestCaseType(unittest.TestCase):
             self.milestone.project = 2
         self.assertEqual(str(e.exception), 'input must be a Project')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_project_invalid_project(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -201,7 +201,7 @@ class TestCaseType(unittest.TestCase):
         self.assertEqual(str(e.exception),
                          "Project ID '5' was not found")
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_project_empty_project(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
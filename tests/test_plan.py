@@ -189,7 +189,7 @@ class TestPlan(unittest.TestCase):
         self.plan = Plan(self.mock_plan_data[0])
         self.plan2 = Plan(self.mock_plan_data[1])
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_plan_assigned_to_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_users)
@@ -197,7 +197,7 @@ class TestPlan(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertTrue(isinstance(self.plan.assigned_to, User))
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_run_assigned_to(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_users)
@@ -231,7 +231,7 @@ class TestPlan(unittest.TestCase):
         self.assertEqual(
             self.plan2.created_on, datetime.datetime.fromtimestamp(30000))
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_created_by_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_users)
@@ -239,7 +239,7 @@ class TestPlan(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertTrue(isinstance(self.plan.created_by, User))
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_created_by(self, mock_get2):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_users)
@@ -271,7 +271,7 @@ class TestPlan(unittest.TestCase):
             return e.id.startswith("mock-id")
         self.assertTrue(all([entry_checker(e) for e in self.plan.entries]))
     """
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_entries_if_none(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_plan_data)
@@ -299,7 +299,7 @@ class TestPlan(unittest.TestCase):
     def test_is_completed(self):
         self.assertEqual(self.plan.is_completed, False)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_no_milestone(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_mstone_data)
@@ -308,7 +308,7 @@ class TestPlan(unittest.TestCase):
         self.assertEqual(self.plan2.milestone.id, None)
         self.assertEqual(type(self.plan2.milestone), Milestone)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_milestone_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_mstone_data)
@@ -316,7 +316,7 @@ class TestPlan(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertTrue(isinstance(self.plan.milestone, Milestone))
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_milestone(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_mstone_data)
@@ -324,7 +324,7 @@ class TestPlan(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(self.plan.milestone.id, 7)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_milestone(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -362,7 +362,7 @@ class TestPlan(unittest.TestCase):
     def test_passed_count(self):
         self.assertEqual(self.plan.passed_count, 5)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_project_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -370,7 +370,7 @@ class TestPlan(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertTrue(isinstance(self.plan.project, Project))
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_project(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -378,7 +378,7 @@ class TestPlan(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(self.plan.project.id, 1)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_project(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -0,0 +1,95 @@
+import mock
+import util
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from testrail.client import TestRail
+from testrail.helper import TestRailError
+from testrail.milestone import Milestone
+from testrail.plan import Plan, PlanContainer
+from testrail.result import Result, ResultContainer
+from testrail.run import Run, RunContainer
+from testrail.user import User
+
+
+class TestQuery(unittest.TestCase):
+    def setUp(self):
+        self.client = TestRail(project_id=1)
+        self.runs = [
+            {'id': 1, 'project_id': 1, 'name': 'a', 'milestone_id': 7,
+             'is_completed': False, 'config': 'linux'},
+            {'id': 2, 'project_id': 1, 'name': 'b', 'milestone_id': 7,
+             'is_completed': False, 'config': 'mac'}]
+
+    def tearDown(self):
+        util.reset_shared_state(self.client.api)
+
+    def page(self, field, rows):
+        return {'size': len(rows), '_links': {'next': None}, field: rows}
+
+    @mock.patch('testrail.api.API._get')
+    def test_filters_sent_to_server(self, mock_get):
+        mock_get.return_value = self.page('runs', self.runs)
+        runs = self.client.query(Run).filter(
+            milestone=Milestone({'id': 7}), completed=False,
+            created_by=[User({'id': 3}), User({'id': 2})]).all()
+        self.assertTrue(isinstance(runs, RunContainer))
+        self.assertEqual([r.id for r in runs], [1, 2])
+        args, kwargs = mock_get.call_args
+        self.assertEqual(args[0], 'get_runs/1')
+        self.assertEqual(kwargs['params']['milestone_id'], '7')
+        self.assertEqual(kwargs['params']['is_completed'], '0')
+        self.assertEqual(kwargs['params']['created_by'], '2,3')
+
+    @mock.patch('testrail.api.API._get')
+    def test_local_fallback(self, mock_get):
+        mock_get.return_value = self.page('runs', self.runs)
+        query = self.client.query(Run).filter(milestone_id=7, config='mac')
+        self.assertEqual([r.id for r in query], [2])
+        self.assertNotIn('config', mock_get.call_args[1]['params'])
+        self.assertEqual(
+            [r.id for r in query.where(lambda r: r.name == 'a')], [])
+
+    @mock.patch('testrail.api.API._get')
+    def test_cached_per_filter_set(self, mock_get):
+        mock_get.return_value = self.page('runs', self.runs)
+        self.client.query(Run).filter(milestone_id=7).all()
+        self.client.query(Run).filter(milestone_id=7, name='a').all()
+        self.assertEqual(mock_get.call_count, 1)
+        self.client.query(Run).filter(milestone_id=8).all()
+        self.assertEqual(mock_get.call_count, 2)
+
+    @mock.patch('testrail.api.API._get')
+    def test_plans(self, mock_get):
+        plans = [{'id': 5, 'project_id': 1, 'is_completed': True}]
+        mock_get.return_value = self.page('plans', plans)
+        completed = self.client.completed_plans()
+        self.assertTrue(isinstance(completed, PlanContainer))
+        self.assertEqual([p.id for p in completed], [5])
+        self.assertEqual(mock_get.call_args[0][0], 'get_plans/1')
+        self.assertEqual(mock_get.call_args[1]['params']['is_completed'], '1')
+
+    @mock.patch('testrail.api.API._get')
+    def test_results_for_run(self, mock_get):
+        results = [{'id': 3, 'test_id': 4, 'status_id': 5}]
+        mock_get.return_value = self.page('results', results)
+        failed = self.client.query(Result, Run({'id': 9})).filter(
+            status=[5, 4]).all()
+        self.assertTrue(isinstance(failed, ResultContainer))
+        self.assertEqual(mock_get.call_args[0][0], 'get_results_for_run/9')
+        self.assertEqual(mock_get.call_args[1]['params']['status_id'], '4,5')
+
+    def test_results_need_run(self):
+        with self.assertRaises(TestRailError):
+            self.client.query(Result)
+
+    def test_unsupported_model(self):
+        with self.assertRaises(TestRailError):
+            self.client.query(User)
+
+    def test_filter_returns_new_query(self):
+        query = self.client.query(Plan)
+        self.assertIsNot(query.filter(is_completed=True), query)
+        self.assertEqual(query._server, {})
@@ -0,0 +1,100 @@
+import os
+import shutil
+import tempfile
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import mock
+
+from testrail.api import API
+from testrail.helper import TestRailError
+from testrail.ratelimit import TokenBucket
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patches = [mock.patch('testrail.ratelimit.time', self.clock.time),
+                   mock.patch('testrail.ratelimit.sleep', self.clock.sleep)]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_burst_then_paced(self):
+        bucket = TokenBucket(rate=2, burst=3)
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(self.clock.now, 1000.0)
+        for _ in range(4):
+            bucket.acquire()
+        self.assertAlmostEqual(self.clock.now, 1002.0)
+
+    def test_backoff_halves_rate(self):
+        bucket = TokenBucket(rate=4, min_rate=1, recovery=None)
+        bucket.backoff()
+        self.assertEqual(bucket.rate, 2)
+        bucket.backoff()
+        bucket.backoff()
+        self.assertEqual(bucket.rate, 1)
+        bucket.acquire()
+        self.assertAlmostEqual(self.clock.now, 1001.0)
+
+    def test_rate_recovers(self):
+        bucket = TokenBucket(rate=4, recovery=10)
+        bucket.backoff()
+        self.clock.now += 5
+        self.assertEqual(bucket.rate, 4)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(TestRailError):
+            TokenBucket(rate=0)
+
+    def test_shared_through_lock_file(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = os.path.join(tmp_dir, 'bucket')
+        first = TokenBucket(rate=1, burst=2, lock_path=path)
+        second = TokenBucket(rate=1, burst=2, lock_path=path)
+        first.acquire()
+        second.acquire()
+        self.assertEqual(self.clock.now, 1000.0)
+        first.acquire()  # the shared bucket is empty now
+        self.assertAlmostEqual(self.clock.now, 1001.0)
+        second.backoff()
+        self.assertEqual(first.rate, 0.5)
+
+
+class TestAPIRateLimit(unittest.TestCase):
+    def tearDown(self):
+        API.set_rate_limit(None)
+        API._retry_after = 0
+
+    @mock.patch('testrail.api.requests.Session.get')
+    def test_get_acquires_token(self, mock_get):
+        mock_get.return_value = mock.Mock(status_code=200)
+        API.set_rate_limit(5)
+        with mock.patch.object(API._rate_limiter, 'acquire') as acquire:
+            API()._get('get_statuses')
+        acquire.assert_called_once_with()
+
+    @mock.patch('testrail.api.sleep')
+    def test_429_backs_off(self, mock_sleep):
+        API.set_rate_limit(8, burst=8)
+        resp = mock.Mock(status_code=429, headers={'Retry-After': '1'})
+        with self.assertRaises(TestRailError):
+            API._raise_on_429_or_503_status(resp)
+        self.assertLess(API._rate_limiter.rate, 8)
@@ -9,7 +9,7 @@ except ImportError:
 from testrail.api import API
 from testrail.test import Test
 from testrail.user import User
-from testrail.result import Result
+from testrail.result import Result, ResultContainer
 from testrail.status import Status
 from testrail.helper import TestRailError
 
@@ -77,7 +77,7 @@ class TestUser(unittest.TestCase):
 
         self.result = Result(self.mock_result_data)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_assigned_to_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_user_data)
@@ -86,7 +86,7 @@ class TestUser(unittest.TestCase):
         user = self.result.assigned_to
         self.assertEqual(type(user), User)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_assigned_to(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_user_data)
@@ -100,7 +100,7 @@ class TestUser(unittest.TestCase):
         self.assertEqual(type(self.result.assigned_to), User)
         self.assertEqual(self.result.assigned_to.id, None)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_assigned_to(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_user_data)
@@ -117,7 +117,7 @@ class TestUser(unittest.TestCase):
             self.result.assigned_to = 2
         self.assertEqual(str(e.exception), 'input must be a User object')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_assigned_to_invalid_user(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_user_data)
@@ -130,7 +130,7 @@ class TestUser(unittest.TestCase):
         self.assertEqual(str(e.exception),
                          "User with ID '%s' is not valid" % user.id)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_assigned_to_empty_user(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_user_data)
@@ -163,7 +163,7 @@ class TestUser(unittest.TestCase):
             self.result.comment = True
         self.assertEqual(str(e.exception), 'input must be a string')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_created_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_user_data)
@@ -171,7 +171,7 @@ class TestUser(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(type(self.result.created_by), User)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_created_by(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_user_data)
@@ -180,7 +180,7 @@ class TestUser(unittest.TestCase):
         user = self.result.created_by
         self.assertEqual(user._content, self.mock_user_data[1])
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_created_by_no_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_user_data)
@@ -191,7 +191,7 @@ class TestUser(unittest.TestCase):
             result.created_by
         self.assertEqual(str(e.exception), "User ID 'None' was not found")
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_created_by_invalid_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_user_data)
@@ -307,7 +307,7 @@ class TestUser(unittest.TestCase):
     def test_get_id(self):
         self.assertEqual(self.result.id, 3)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_status_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_status_data)
@@ -315,7 +315,7 @@ class TestUser(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(type(self.result.status), Status)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_status(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_status_data)
@@ -323,7 +323,7 @@ class TestUser(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(self.result.status.label, 'Passed')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_status_invalid_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_status_data)
@@ -339,7 +339,7 @@ class TestUser(unittest.TestCase):
             self.result.status = 'passed'
         self.assertEqual(str(e.exception), 'input must be a Status')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_status(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_status_data)
@@ -348,7 +348,7 @@ class TestUser(unittest.TestCase):
         self.result.status = Status({'id': 1})
         self.assertEqual(self.result._content['status_id'], 1)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_status_invalid_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_status_data)
@@ -364,7 +364,7 @@ class TestUser(unittest.TestCase):
         result = Result(result_data)
         self.assertEqual(result.test.id, None)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_test_data)
@@ -372,7 +372,7 @@ class TestUser(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(type(self.result.test), Test)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_test_data[0])
@@ -380,7 +380,7 @@ class TestUser(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(self.result.test.id, 5)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_invalid_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = {u'error': u'Field :test_id is not a valid test.'}
@@ -396,7 +396,7 @@ class TestUser(unittest.TestCase):
             self.result.test = 5
         self.assertEqual(str(e.exception), 'input must be a Test')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_test(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_test_data)
@@ -405,7 +405,7 @@ class TestUser(unittest.TestCase):
         self.result.test = Test({'id': 5, 'run_id': 1})
         self.assertEqual(self.result._content['test_id'], 5)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_test_invalid_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_test_data)
@@ -436,3 +436,19 @@ class TestUser(unittest.TestCase):
 
     def test_raw_data(self):
         self.assertEqual(self.result.raw_data(), self.mock_result_data)
+
+
+class TestResultContainer(unittest.TestCase):
+    def setUp(self):
+        self.statuses = {1: {'id': 1, 'name': 'passed'},
+                         5: {'id': 5, 'name': 'failed'}}
+        self.container = ResultContainer(
+            [Result({'id': i, 'status_id': 1 if i % 4 else 5})
+             for i in range(100)])
+
+    @mock.patch('testrail.api.API.status_with_id')
+    def test_status_resolved_once_per_id(self, mock_status):
+        mock_status.side_effect = lambda status_id: self.statuses[status_id]
+        self.assertEqual(len(self.container.failed()), 25)
+        self.assertEqual(len(self.container.passed()), 75)
+        self.assertEqual(mock_status.call_count, 2)
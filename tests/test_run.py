@@ -186,7 +186,7 @@ class TestRun(unittest.TestCase):
         self.run2 = Run(self.mock_run_data[1])
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_run_assigned_to_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -196,7 +196,7 @@ class TestRun(unittest.TestCase):
         self.assertTrue(isinstance(self.run.assigned_to, User))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_run_assigned_to(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -212,7 +212,7 @@ class TestRun(unittest.TestCase):
         self.assertEqual(self.run.blocked_count, 1)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_cases_container_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -223,7 +223,7 @@ class TestRun(unittest.TestCase):
         self.assertTrue(isinstance(self.run.cases, list))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_cases_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -235,7 +235,7 @@ class TestRun(unittest.TestCase):
         self.assertTrue(all(map(case_check, self.run.cases)))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_cases(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -250,7 +250,7 @@ class TestRun(unittest.TestCase):
         self.assertEqual(cases_from_run, [8, 9])
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_cases_to_none(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -310,7 +310,7 @@ class TestRun(unittest.TestCase):
             self.run.created_on, datetime.datetime.fromtimestamp(1393845644))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_created_by_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -320,7 +320,7 @@ class TestRun(unittest.TestCase):
         self.assertTrue(isinstance(self.run.created_by, User))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_created_by(self, mock_get2, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -369,7 +369,7 @@ class TestRun(unittest.TestCase):
         self.assertEqual(self.run.is_completed, False)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_milestone_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -379,7 +379,7 @@ class TestRun(unittest.TestCase):
         self.assertTrue(isinstance(self.run.milestone, Milestone))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_milestone(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -389,7 +389,7 @@ class TestRun(unittest.TestCase):
         self.assertEqual(self.run.milestone.id, 9)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_milestone(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -402,7 +402,7 @@ class TestRun(unittest.TestCase):
         self.assertEqual(self.run.milestone.id, 9)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_milestone_with_no_id(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -412,7 +412,7 @@ class TestRun(unittest.TestCase):
         self.assertEqual(self.run2.milestone.id, None)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_plan_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -422,7 +422,7 @@ class TestRun(unittest.TestCase):
         self.assertTrue(isinstance(self.run.plan, Plan))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_plan(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -454,7 +454,7 @@ class TestRun(unittest.TestCase):
         self.assertEqual(self.run.passed_count, 3)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_project_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -464,7 +464,7 @@ class TestRun(unittest.TestCase):
         self.assertTrue(isinstance(self.run.project, Project))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_project(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -474,7 +474,7 @@ class TestRun(unittest.TestCase):
         self.assertEqual(self.run.project.id, 1)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_project(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -504,7 +504,7 @@ class TestRun(unittest.TestCase):
         self.assertEqual(self.run.retest_count, 7)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suite_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -514,7 +514,7 @@ class TestRun(unittest.TestCase):
         self.assertTrue(isinstance(self.run.suite, Suite))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suite(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -524,7 +524,7 @@ class TestRun(unittest.TestCase):
         self.assertEqual(self.run.suite.id, 1)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_suite(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -139,7 +139,7 @@ class TestSuite(unittest.TestCase):
     def test_raw_data_type(self):
         self.assertEqual(type(self.section.raw_data()), dict)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suite_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_suite_data)
@@ -147,7 +147,7 @@ class TestSuite(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(type(self.section.suite), Suite)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suite(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_suite_data)
@@ -155,7 +155,7 @@ class TestSuite(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(self.section.suite.id, 1)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_suite_invalid_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_suite_data)
@@ -166,7 +166,7 @@ class TestSuite(unittest.TestCase):
             self.section.suite
         self.assertEqual(str(e.exception), "Suite ID '200' was not found")
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_suite(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_suite_data)
@@ -182,7 +182,7 @@ class TestSuite(unittest.TestCase):
             self.section.suite = 2
         self.assertEqual(str(e.exception), 'input must be a Suite')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_suite_invalid_suite(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_suite_data)
@@ -200,7 +200,7 @@ class TestSuite(unittest.TestCase):
         self.assertEqual(s.suite.id, None)
         self.assertEqual(type(s.suite), Suite)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_parent_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_section_data)
@@ -208,7 +208,7 @@ class TestSuite(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(type(self.section.parent), Section)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_parent(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_section_data)
@@ -216,7 +216,7 @@ class TestSuite(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(self.section.parent.id, 1)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_parent_invalid_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_section_data)
@@ -227,7 +227,7 @@ class TestSuite(unittest.TestCase):
             self.section.parent
         self.assertEqual(str(e.exception), "Section ID '200' was not found")
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_parent(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_section_data)
@@ -243,7 +243,7 @@ class TestSuite(unittest.TestCase):
             self.section.parent = 2
         self.assertEqual(str(e.exception), 'input must be a Section')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_parent_invalid_section(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_section_data)
@@ -256,7 +256,7 @@ class TestSuite(unittest.TestCase):
         self.assertEqual(str(e.exception),
                          "Section ID '5' was not found")
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_parent_empty_section(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_section_data)
@@ -128,7 +128,7 @@ class TestSuite(unittest.TestCase):
         self.assertEqual(
             self.suite.url, 'http://<server>/index.php?/suites/view/1')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_project_type(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -136,7 +136,7 @@ class TestSuite(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(type(self.suite.project), Project)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_project(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -144,7 +144,7 @@ class TestSuite(unittest.TestCase):
         mock_get.return_value = mock_response
         self.assertEqual(self.suite.project.id, 1)
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_project_invalid_id(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -156,7 +156,7 @@ class TestSuite(unittest.TestCase):
         self.assertEqual(str(e.exception), "Project ID '200' was not found")
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_project(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -173,7 +173,7 @@ class TestSuite(unittest.TestCase):
             self.suite.project = 2
         self.assertEqual(str(e.exception), 'input must be a Project')
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_project_invalid_project(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -186,7 +186,7 @@ class TestSuite(unittest.TestCase):
         self.assertEqual(str(e.exception),
                          "Project ID '5' was not found")
 
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_set_project_empty_project(self, mock_get):
         mock_response = mock.Mock()
         mock_response.json.return_value = copy.deepcopy(self.mock_project_data)
@@ -0,0 +1,96 @@
+import math
+import mock
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from testrail import table
+from testrail.api import API
+from testrail.helper import TestRailError
+from testrail.table import ResultTable
+
+
+ROWS = [
+    {'id': 1, 'test_id': 10, 'status_id': 1, 'created_on': 1000,
+     'assignedto_id': 2, 'elapsed': '1m'},
+    {'id': 2, 'test_id': 11, 'status_id': 5, 'created_on': 1030,
+     'assignedto_id': None, 'elapsed': '2m 30s'},
+    {'id': 3, 'test_id': 12, 'status_id': 1, 'created_on': 1075,
+     'assignedto_id': 2, 'elapsed': None},
+    {'id': 4, 'test_id': 10, 'status_id': 4, 'created_on': 1130,
+     'assignedto_id': 3, 'elapsed': 30},
+]
+
+
+class ResultTableTests(object):
+    use_numpy = False
+
+    def setUp(self):
+        self.table = ResultTable(ROWS, use_numpy=self.use_numpy)
+
+    def test_columns(self):
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(list(self.table.test_id), [10, 11, 12, 10])
+        self.assertEqual(list(self.table.assignedto_id), [2, 0, 2, 3])
+        elapsed = list(self.table.elapsed)
+        self.assertEqual(elapsed[:2], [60, 150])
+        self.assertTrue(math.isnan(elapsed[2]))
+        self.assertEqual(elapsed[3], 30)
+
+    def test_where(self):
+        failed = self.table.where(status_id=[4, 5])
+        self.assertEqual(list(failed.id), [2, 4])
+        self.assertEqual(list(self.table.where(status_id=1, test_id=12).id),
+                         [3])
+
+    def test_between(self):
+        recent = self.table.select(self.table.between('created_on', 1030))
+        self.assertEqual(list(recent.id), [2, 3, 4])
+        window = self.table.between('created_on', 1000, 1075)
+        self.assertEqual(list(self.table.select(window).id), [1, 2])
+
+    def test_status_counts(self):
+        self.assertEqual(self.table.status_counts(), {1: 2, 4: 1, 5: 1})
+
+    def test_elapsed_percentiles(self):
+        self.assertEqual(self.table.elapsed_percentiles((0, 50, 100)),
+                         {0: 30, 50: 60, 100: 150})
+        self.assertAlmostEqual(
+            self.table.elapsed_percentiles((25, ))[25], 45)
+
+    def test_elapsed_percentiles_empty(self):
+        empty = self.table.where(status_id=99)
+        self.assertTrue(math.isnan(empty.elapsed_percentiles((50, ))[50]))
+
+    def test_buckets(self):
+        self.assertEqual(self.table.buckets(60),
+                         [(960, 1), (1020, 2), (1080, 1)])
+
+    def test_buckets_invalid_width(self):
+        with self.assertRaises(TestRailError):
+            self.table.buckets(0)
+
+
+class TestResultTableArray(ResultTableTests, unittest.TestCase):
+    use_numpy = False
+
+
+@unittest.skipIf(table.numpy is None, 'numpy is not installed')
+class TestResultTableNumpy(ResultTableTests, unittest.TestCase):
+    use_numpy = True
+
+
+class TestResultTableFromRun(unittest.TestCase):
+    @mock.patch('testrail.api.API.results_by_run')
+    def test_from_run(self, mock_results):
+        mock_results.return_value = ROWS
+        result_table = ResultTable.from_run(API(), 7)
+        mock_results.assert_called_once_with(7)
+        self.assertEqual(len(result_table), 4)
+
+    @mock.patch('testrail.table.numpy', None)
+    def test_numpy_missing(self):
+        self.assertFalse(ResultTable(ROWS)._numpy)
+        with self.assertRaises(TestRailError):
+            ResultTable(ROWS, use_numpy=True)
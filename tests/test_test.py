@@ -1,11 +1,14 @@
 import mock
 import datetime
+import threading
+import util
 try:
     import unittest2 as unittest
 except ImportError:
     import unittest
 
 from testrail.api import API
+from testrail.client import TestRail
 from testrail.run import Run
 from testrail.case import Case
 from testrail.test import Test
@@ -153,7 +156,7 @@ class TestTest(unittest.TestCase):
         self.test2 = Test(self.mock_test_data[1])
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_assigned_to_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -163,7 +166,7 @@ class TestTest(unittest.TestCase):
         self.assertTrue(isinstance(self.test.assigned_to, User))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_assigned_to(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -174,7 +177,7 @@ class TestTest(unittest.TestCase):
 
     @mock.patch('testrail.test.Test.run')
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_case_type(self, mock_get, refresh_mock, _):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -185,7 +188,7 @@ class TestTest(unittest.TestCase):
 
     @mock.patch('testrail.test.Test.run')
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_case(self, mock_get, refresh_mock, _):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -225,7 +228,7 @@ class TestTest(unittest.TestCase):
         self.assertEqual(self.test.id, 100)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_milestone_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -238,7 +241,7 @@ class TestTest(unittest.TestCase):
         self.assertEqual(self.test2.milestone, None)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_milestone(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -257,7 +260,7 @@ class TestTest(unittest.TestCase):
         self.assertIn("REF1", self.test.refs)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_run_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -267,7 +270,7 @@ class TestTest(unittest.TestCase):
         self.assertTrue(isinstance(self.test.run, Run))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_run(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -277,7 +280,7 @@ class TestTest(unittest.TestCase):
         self.assertEqual(self.test.run.id, 81)
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_status_type(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -287,7 +290,7 @@ class TestTest(unittest.TestCase):
         self.assertTrue(isinstance(self.test.status, Status))
 
     @mock.patch('testrail.api.API._refresh')
-    @mock.patch('testrail.api.requests.get')
+    @mock.patch('testrail.api.requests.Session.get')
     def test_get_test_status(self, mock_get, refresh_mock):
         refresh_mock.return_value = True
         mock_response = mock.Mock()
@@ -307,3 +310,99 @@ class TestTest(unittest.TestCase):
 
     def test_raw_data(self):
         self.assertEqual(self.test.raw_data(), self.mock_test_data[0])
+
+
+class TestTestRelations(unittest.TestCase):
+    def setUp(self):
+        self.test = Test({'id': 1, 'case_id': 8, 'run_id': 3})
+        patches = {
+            'run_project_id': lambda run_id: 1,
+            'run_with_id': lambda run_id, project_id=None: {
+                'id': run_id, 'suite_id': 2, 'project_id': project_id},
+            'suite_with_id': lambda suite_id, project_id=None: {
+                'id': suite_id},
+            'case_with_id': lambda case_id, suite_id=None, project_id=None: {
+                'id': case_id, 'suite_id': suite_id},
+        }
+        self.mocks = dict()
+        for name, side_effect in patches.items():
+            patch = mock.patch('testrail.api.API.%s' % name,
+                               side_effect=side_effect)
+            self.mocks[name] = patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_case_memoized(self):
+        case = self.test.case
+        self.assertIs(self.test.case, case)
+        self.assertEqual(case.id, 8)
+        for mock_lookup in self.mocks.values():
+            self.assertEqual(mock_lookup.call_count, 1)
+
+    def test_case_invalidated_by_content_change(self):
+        self.assertEqual(self.test.case.id, 8)
+        self.test._content['case_id'] = 9
+        self.assertEqual(self.test.case.id, 9)
+        # the run didn't change, so it wasn't looked up again
+        self.assertEqual(self.mocks['run_with_id'].call_count, 1)
+
+    def test_run_memoized(self):
+        self.assertIs(self.test.run, self.test.run)
+        self.test._content['run_id'] = 4
+        self.assertEqual(self.test.run.id, 4)
+        self.assertEqual(self.mocks['run_with_id'].call_count, 2)
+
+
+class TestTestProjects(unittest.TestCase):
+    def setUp(self):
+        self.runs = {1: [{'id': 10, 'project_id': 1, 'suite_id': 3}],
+                     2: [{'id': 20, 'project_id': 2, 'suite_id': 4}]}
+        patch = mock.patch('testrail.api.API._get', side_effect=self.get)
+        self.mock_get = patch.start()
+        self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        util.reset_shared_state(API())
+
+    def get(self, uri, params=None):
+        end_point, obj_id = uri.split('/')
+        if end_point == 'get_runs':
+            return {'size': 1, '_links': {'next': None},
+                    'runs': self.runs[int(obj_id)]}
+        if end_point == 'get_run':
+            return {'id': int(obj_id), 'project_id': int(obj_id) // 10}
+        raise AssertionError('unexpected request %s' % uri)
+
+    def test_run_of_other_clients_project(self):
+        TestRail(1)
+        TestRail(2)
+        self.assertEqual(Test({'run_id': 10}).run.project_id, 1)
+        self.assertEqual(Test({'run_id': 20}).run.project_id, 2)
+        # Known runs are resolved from the cached listings
+        calls = self.mock_get.call_count
+        self.assertEqual(Test({'run_id': 10}).run.id, 10)
+        self.assertEqual(self.mock_get.call_count, calls)
+
+    def test_run_project_kept(self):
+        api = API()
+        # Like the runs of a test plan, run 30 is in no get_runs listing
+        self.assertEqual(api.run_project_id(30), 3)
+        self.assertEqual(api.run_project_id(30), 3)
+        self.assertEqual(self.mock_get.call_count, 1)
+
+    def test_two_clients_in_threads(self):
+        seen = dict()
+
+        def worker(project_id):
+            TestRail(project_id)
+            run_id = project_id * 10
+            for _ in range(50):
+                seen.setdefault(run_id, set()).add(
+                    Test({'run_id': run_id}).run.project_id)
+
+        threads = [threading.Thread(target=worker, args=(p, ))
+                   for p in (1, 2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(seen, {10: set([1]), 20: set([2])})
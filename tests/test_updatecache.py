@@ -9,7 +9,7 @@ except ImportError:
 
 import mock
 
-from testrail.api import UpdateCache
+from testrail.api import API, UpdateCache
 from testrail.helper import TestRailError
 
 
@@ -124,8 +124,138 @@ class TestUpdateCache(unittest.TestCase):
         def cache_refresh_func(val):
             return force_refresh_obj
 
+        refresh_cache[1]['queries'] = {('get_runs/1', ): {'ts': dt.now()}}
         cache_refresh_func(id_to_delete)
 
         self.assertEqual(len(refresh_cache[0]['value']), 5)
         self.assertEqual(len(refresh_cache[1]['value']), 5)
-        self.assertTrue(all([x['ts'] is None for x in refresh_cache.values()]))
+        # Listings that never held the object stay valid
+        self.assertTrue(all([x['ts'] for x in refresh_cache.values()]))
+        self.assertIsNone(refresh_cache[1]['queries'][('get_runs/1', )]['ts'])
+
+    def test_cache_add_updates_index(self,):
+        add_cache = deepcopy(self.mock_cache)
+        API._find(add_cache[1], 'id', 'id10')  # build the index
+        add_obj = {'id': 'id15', 'val': 'test_cache_add', 'project_id': 1}
+
+        @UpdateCache(add_cache)
+        def cache_add_func():
+            return add_obj
+
+        cache_add_func()
+
+        self.assertIs(API._find(add_cache[1], 'id', 'id15'), add_obj)
+
+    def test_cache_update_updates_index(self,):
+        update_cache = deepcopy(self.mock_cache)
+        API._find(update_cache[1], 'val', 'oldval')  # build the index
+        update_obj = {'id': 'id12', 'val': 'newval', 'project_id': 1}
+
+        @UpdateCache(update_cache)
+        def cache_update_func():
+            return update_obj
+
+        cache_update_func()
+
+        self.assertIs(API._find(update_cache[1], 'val', 'newval'), update_obj)
+        self.assertEqual(API._find(update_cache[1], 'id', 'id12'), update_obj)
+        self.assertNotIn(update_obj,
+                         update_cache[1]['index']['val']['oldval'])
+
+    def test_cache_delete_updates_index(self,):
+        delete_cache = deepcopy(self.mock_cache)
+        API._find(delete_cache[1], 'id', 'id10')  # build the index
+
+        @UpdateCache(delete_cache)
+        def cache_delete_func(val):
+            return {}
+
+        cache_delete_func('id13')
+
+        with self.assertRaises(IndexError):
+            API._find(delete_cache[1], 'id', 'id13')
+
+    def test_cache_add_keeps_order(self,):
+        add_cache = deepcopy(self.mock_cache)
+
+        @UpdateCache(add_cache)
+        def cache_add_func(obj):
+            return obj
+
+        for obj_id in ('id19', 'id105', 'id00', 'id17'):
+            cache_add_func({'id': obj_id, 'project_id': 1})
+
+        ids = [obj['id'] for obj in add_cache[1]['value']]
+        self.assertEqual(ids, ['id10', 'id11', 'id12', 'id13', 'id14',
+                               'id19', 'id105', 'id00', 'id17'])
+        self.assertEqual(set(add_cache[1]['positions']['ids']), set(ids))
+        cache_add_func({'id': 'id12', 'project_id': 1, 'val': 'new'})
+        self.assertEqual(add_cache[1]['value'][ids.index('id12')]['val'],
+                         'new')
+
+    def test_cache_delete_keeps_positions(self,):
+        delete_cache = deepcopy(self.mock_cache)
+
+        @UpdateCache(delete_cache)
+        def cache_delete_func(val):
+            return {}
+
+        cache_delete_func('id11')
+        cache_delete_func('id13')
+
+        cache_delete_func('id14')
+
+        ids = [obj['id'] for obj in delete_cache[1]['value']]
+        self.assertEqual(ids, ['id10', 'id12'])
+        self.assertEqual(set(delete_cache[1]['positions']['ids']), set(ids))
+
+    def test_cache_add_delete_interleaved(self,):
+        cache = deepcopy(self.mock_cache)
+
+        @UpdateCache(cache)
+        def cache_func(obj):
+            return obj if isinstance(obj, dict) else {}
+
+        cache_func('id11')
+        cache_func({'id': 'id05', 'project_id': 1})
+        cache_func('id10')
+        cache_func({'id': 'id13', 'project_id': 1, 'val': 'new'})
+        cache_func({'id': 'id05', 'project_id': 1, 'val': 'new'})
+
+        self.assertEqual([(o['id'], o['val']) for o in cache[1]['value']],
+                         [('id12', 'oldval'), ('id13', 'new'),
+                          ('id14', 'oldval'), ('id05', 'new')])
+
+    def test_cache_add_newest_first(self,):
+        add_cache = deepcopy(self.mock_cache)
+
+        @UpdateCache(add_cache, newest_first=True)
+        def cache_add_func(obj):
+            return obj
+
+        cache_add_func({'id': 'id15', 'project_id': 1})
+        cache_add_func({'id': 'id12', 'project_id': 1, 'val': 'new'})
+
+        ids = [obj['id'] for obj in add_cache[1]['value']]
+        self.assertEqual(ids, ['id15', 'id10', 'id11', 'id12', 'id13',
+                               'id14'])
+        self.assertEqual(add_cache[1]['value'][3]['val'], 'new')
+
+    def test_cache_newest_first_interleaved(self,):
+        cache = deepcopy(self.mock_cache)
+
+        @UpdateCache(cache, newest_first=True)
+        def cache_func(obj):
+            return obj if isinstance(obj, dict) else {}
+
+        cache_func({'id': 'id15', 'project_id': 1})
+        cache_func('id11')
+        cache_func({'id': 'id16', 'project_id': 1})
+        cache_func('id15')
+        cache_func({'id': 'id13', 'project_id': 1, 'val': 'new'})
+        cache_func({'id': 'id16', 'project_id': 1, 'val': 'new'})
+
+        self.assertEqual([(o['id'], o['val']) for o in cache[1]['value']],
+                         [('id16', 'new'), ('id10', 'oldval'),
+                          ('id12', 'oldval'), ('id13', 'new'),
+                          ('id14', 'oldval')])
@@ -0,0 +1,99 @@
+import time
+
+import mock
+import requests
+import util
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from testrail.client import TestRail
+from testrail.helper import TestRailError
+from testrail.project import Project
+from testrail.warm import WarmReport
+
+
+class TestWarm(unittest.TestCase):
+    def setUp(self):
+        self.client = TestRail(project_id=1)
+        # Don't pick up collections other tests left in the cache backend
+        self.client.api.flush_cache()
+        self.responses = {
+            'get_users': [{'id': 1}, {'id': 2}],
+            'get_statuses': [{'id': 1}, {'id': 5}],
+            'get_priorities': [{'id': 1}],
+            'get_case_types': [{'id': 1}],
+            'get_suites/1': [{'id': 3}, {'id': 4}],
+            'get_milestones/1': [{'id': 6}],
+            'get_configs/1': [],
+        }
+        patch = mock.patch('testrail.api.API._get', side_effect=self.get)
+        self.mock_get = patch.start()
+        self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        util.reset_shared_state(self.client.api)
+
+    def get(self, uri, params=None):
+        time.sleep(0.05)
+        if uri.startswith('get_sections/'):
+            suite_id = params['suite_id']
+            rows = [{'id': suite_id * 10, 'suite_id': suite_id}]
+        elif uri in self.responses:
+            rows = self.responses[uri]
+            if isinstance(rows, Exception):
+                raise rows
+        else:
+            raise TestRailError('unexpected %s' % uri)
+        if isinstance(params, dict) and 'offset' in params:
+            field = uri.split('/')[0].replace('get_', '')
+            return {'size': len(rows), '_links': {'next': None},
+                    field: rows}
+        return rows
+
+    def test_warm_all(self):
+        report = self.client.warm()
+        self.assertTrue(isinstance(report, WarmReport))
+        self.assertEqual(report.failed, {})
+        self.assertEqual(report.loaded, {
+            'users': 2, 'statuses': 2, 'priorities': 1, 'case_types': 1,
+            'suites': 2, 'milestones': 1, 'sections': 2, 'configs': 0})
+        self.assertEqual(set(report.timings), set(report.loaded))
+        # Fetched side by side rather than one after the other
+        self.assertLess(report.seconds, sum(report.timings.values()))
+
+    def test_warm_fills_cache(self):
+        self.client.warm(Project({'id': 1}), include=['statuses', 'users'])
+        calls = self.mock_get.call_count
+        self.client.statuses()
+        self.client.users()
+        self.assertEqual(self.mock_get.call_count, calls)
+
+    def test_warm_include(self):
+        report = self.client.warm(1, include=['priorities'])
+        self.assertEqual(report.loaded, {'priorities': 1})
+        self.assertEqual(self.mock_get.call_count, 1)
+
+    def test_warm_failure_reported(self):
+        del self.responses['get_configs/1']
+        report = self.client.warm(include=['configs', 'users'])
+        self.assertEqual(report.loaded, {'users': 2})
+        self.assertTrue(isinstance(report.failed['configs'], TestRailError))
+
+    def test_warm_other_error_reported(self):
+        self.responses['get_users'] = requests.ConnectionError('refused')
+        report = self.client.warm(include=['users', 'statuses'])
+        self.assertEqual(report.loaded, {'statuses': 2})
+        self.assertTrue(isinstance(report.failed['users'],
+                                   requests.ConnectionError))
+
+    def test_warm_sections_serve_lookups(self):
+        self.client.warm(include=['sections'])
+        calls = self.mock_get.call_count
+        self.assertEqual(self.client.api.section_with_id(40, 1)['id'], 40)
+        self.assertEqual(self.mock_get.call_count, calls)
+
+    def test_warm_unknown(self):
+        with self.assertRaises(TestRailError):
+            self.client.warm(include=['users', 'plans'])
@@ -3,10 +3,13 @@ nested_dict = lambda: collections.defaultdict(nested_dict)
 
 
 def reset_shared_state(cls):
-    for key in cls._shared_state.keys():
+    for key, value in cls._shared_state.items():
         if key == '_timeout':
             cls._shared_state[key] = 30
         elif key == '_project_id':
             cls._shared_state[key] = None
-        else:
+        elif isinstance(value, collections.defaultdict):
+            # Cleared in place, UpdateCache holds references to these
+            value.clear()
+        elif isinstance(value, dict):
             cls._shared_state[key] = nested_dict()